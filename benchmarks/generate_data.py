@@ -0,0 +1,181 @@
+""" Generate synthetic events files and sidecars of configurable size for benchmarking. """
+
+import os
+import json
+import random
+import argparse
+import pandas as pd
+from hed.schema import HedKey, load_schema_version
+
+# Tags with these attributes can't stand alone in a HED string, so they are never chosen.
+EXCLUDED_ATTRIBUTES = [HedKey.RequireChild, HedKey.Required, HedKey.Unique, HedKey.TagGroup,
+                       HedKey.TopLevelTagGroup, HedKey.TakesValue]
+
+
+def get_simple_tags(hed_schema):
+    """ Return the short forms of the leaf tags in a schema that can be used alone without a value.
+
+    Parameters:
+        hed_schema (HedSchema): The schema to take the tags from.
+
+    Returns:
+        list: The short tags in schema order.
+
+    """
+    tags = []
+    for entry in hed_schema.tags.values():
+        if entry.children or any(entry.has_attribute(attribute) for attribute in EXCLUDED_ATTRIBUTES):
+            continue
+        tags.append(entry.short_tag_name)
+    return tags
+
+
+def make_hed_string(tags, rng, tags_per_string=4):
+    """ Return a random HED string with some of its tags in a group.
+
+    Parameters:
+        tags (list): The tags to choose from.
+        rng (random.Random): The random number generator.
+        tags_per_string (int): The number of tags in the string.
+
+    Returns:
+        str: The HED string.
+
+    """
+    chosen = rng.sample(tags, tags_per_string)
+    if tags_per_string < 3:
+        return ", ".join(chosen)
+    group_size = rng.randint(2, tags_per_string - 1)
+    return ", ".join(chosen[group_size:]) + ", (" + ", ".join(chosen[:group_size]) + ")"
+
+
+def make_sidecar(hed_schema, categorical_columns=3, levels=10, definitions=5, tags_per_string=4, seed=0):
+    """ Return the dictionary of a sidecar with categorical columns, a value column and definitions.
+
+    Parameters:
+        hed_schema (HedSchema): The schema to take the tags from.
+        categorical_columns (int): The number of categorical columns (named cat0, cat1, ...).
+        levels (int): The number of values of each categorical column (named level0, level1, ...).
+        definitions (int): The number of definitions (named Cond-0, Cond-1, ...) used by the first column.
+        tags_per_string (int): The number of tags in each HED string.
+        seed (int): Seed for the random number generator.
+
+    Returns:
+        dict: The sidecar as it would be loaded from JSON.
+
+    """
+    rng = random.Random(seed)
+    tags = get_simple_tags(hed_schema)
+    sidecar = {}
+    if definitions:
+        sidecar["defs"] = {"HED": {f"def{index}": f"(Definition/Cond-{index}, "
+                                                  f"({make_hed_string(tags, rng, tags_per_string)}))"
+                                   for index in range(definitions)}}
+    for column in range(categorical_columns):
+        hed_dict = {}
+        for level in range(levels):
+            hed_string = make_hed_string(tags, rng, tags_per_string)
+            if column == 0 and definitions:
+                hed_string = f"Def/Cond-{level % definitions}, " + hed_string
+            hed_dict[f"level{level}"] = hed_string
+        sidecar[f"cat{column}"] = {"Levels": {key: f"Synthetic {key}" for key in hed_dict}, "HED": hed_dict}
+    sidecar["response_time"] = {"HED": "(Delay/# s, Agent-action)"}
+    return sidecar
+
+
+def make_events(hed_schema, rows=1000, categorical_columns=3, levels=10, tags_per_string=4, seed=0):
+    """ Return the dataframe of an events file to use with the sidecar from make_sidecar.
+
+    Parameters:
+        hed_schema (HedSchema): The schema to take the tags from.
+        rows (int): The number of events.
+        categorical_columns (int): The number of categorical columns.
+        levels (int): The number of values of each categorical column.
+        tags_per_string (int): The number of tags in the strings of the HED column.
+        seed (int): Seed for the random number generator.
+
+    Returns:
+        DataFrame: The events with onset, duration, categorical, response_time and HED columns.
+
+    Notes:
+        - About one event in ten has n/a for response_time and about one in four has n/a for HED.
+
+    """
+    rng = random.Random(seed + 1)
+    tags = get_simple_tags(hed_schema)
+    onsets = []
+    onset = 0.0
+    for _ in range(rows):
+        onset += round(rng.uniform(0.1, 2.0), 3)
+        onsets.append(f"{onset:.3f}")
+    events = {"onset": onsets, "duration": ["n/a"] * rows}
+    for column in range(categorical_columns):
+        events[f"cat{column}"] = [f"level{rng.randrange(levels)}" for _ in range(rows)]
+    events["response_time"] = ["n/a" if rng.random() < 0.1 else f"{rng.uniform(0.2, 1.5):.3f}"
+                               for _ in range(rows)]
+    events["HED"] = ["n/a" if rng.random() < 0.25 else make_hed_string(tags, rng, tags_per_string)
+                     for _ in range(rows)]
+    return pd.DataFrame(events)
+
+
+def save_dataset(save_dir, hed_schema, rows=1000, categorical_columns=3, levels=10, definitions=5,
+                 tags_per_string=4, seed=0):
+    """ Save a synthetic events file and its sidecar.
+
+    Parameters:
+        save_dir (str): The directory to save task-synthetic_events.tsv and task-synthetic_events.json in.
+        hed_schema (HedSchema): The schema to take the tags from.
+        rows (int): The number of events.
+        categorical_columns (int): The number of categorical columns.
+        levels (int): The number of values of each categorical column.
+        definitions (int): The number of definitions.
+        tags_per_string (int): The number of tags in each HED string.
+        seed (int): Seed for the random number generator.
+
+    Returns:
+        tuple: The paths of the events file and the sidecar.
+
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    events_path = os.path.join(save_dir, "task-synthetic_events.tsv")
+    sidecar_path = os.path.join(save_dir, "task-synthetic_events.json")
+    make_events(hed_schema, rows, categorical_columns, levels, tags_per_string, seed).to_csv(
+        events_path, sep='\t', index=False, header=True)
+    with open(sidecar_path, 'w') as fp:
+        json.dump(make_sidecar(hed_schema, categorical_columns, levels, definitions, tags_per_string, seed),
+                  fp, indent=4)
+    return events_path, sidecar_path
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="Generates a synthetic events file and sidecar for benchmarks.")
+    parser.add_argument("save_dir", help="Directory in which to save the events file and sidecar.")
+    add_data_arguments(parser)
+    return parser
+
+
+def add_data_arguments(parser):
+    """ Add the arguments controlling the size and content of the synthetic data to a parser. """
+    parser.add_argument("-r", "--rows", type=int, default=1000, help="Number of events.")
+    parser.add_argument("-c", "--categorical-columns", type=int, default=3, dest="categorical_columns",
+                        help="Number of categorical columns.")
+    parser.add_argument("-l", "--levels", type=int, default=10,
+                        help="Number of values of each categorical column.")
+    parser.add_argument("-d", "--definitions", type=int, default=5, help="Number of definitions.")
+    parser.add_argument("-t", "--tags-per-string", type=int, default=4, dest="tags_per_string",
+                        help="Number of tags in each HED string.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Seed for the random number generator.")
+    parser.add_argument("-sv", "--schema-version", default="8.2.0", dest="schema_version",
+                        help="Version of the bundled schema to take the tags from.")
+
+
+def main(arg_list=None):
+    args = get_parser().parse_args(arg_list)
+    hed_schema = load_schema_version(args.schema_version)
+    events_path, sidecar_path = save_dataset(args.save_dir, hed_schema, args.rows, args.categorical_columns,
+                                             args.levels, args.definitions, args.tags_per_string, args.seed)
+    print(f"Saved {events_path}\nSaved {sidecar_path}")
+
+
+if __name__ == '__main__':
+    main()
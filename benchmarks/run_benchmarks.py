@@ -0,0 +1,284 @@
+""" Time the parse, validate, assemble, search and remodel hot paths on synthetic data.
+
+Example:
+    python benchmarks/run_benchmarks.py -r 5000 -o results.json
+    python benchmarks/run_benchmarks.py -r 5000 --compare results.json
+
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import datetime
+import statistics
+import tempfile
+import tracemalloc
+import numpy as np
+import pandas as pd
+import hed
+from hed import HedString, TabularInput, Sidecar
+from hed.models import QueryParser
+from hed.schema import load_schema_version
+from hed.validator import HedValidator
+from hed.tools.remodeling.dispatcher import Dispatcher
+from generate_data import add_data_arguments, get_simple_tags, make_events, make_sidecar
+
+
+class BenchmarkData:
+    """ The synthetic data shared by all the benchmarks in a run.
+
+    Parameters:
+        args (argparse.Namespace): The size and content of the data as given by add_data_arguments.
+        work_dir (str): A directory in which to save the events file (the remodeler reads files).
+
+    """
+
+    def __init__(self, args, work_dir):
+        self.hed_schema = load_schema_version(args.schema_version)
+        self.sidecar_dict = make_sidecar(self.hed_schema, args.categorical_columns, args.levels, args.definitions,
+                                         args.tags_per_string, args.seed)
+        self.events = make_events(self.hed_schema, args.rows, args.categorical_columns, args.levels,
+                                  args.tags_per_string, args.seed)
+        self.events_path = os.path.join(work_dir, "task-synthetic_events.tsv")
+        self.events.to_csv(self.events_path, sep='\t', index=False, header=True)
+        self.sidecar = self.get_sidecar()
+        self.def_dict = self.sidecar.get_def_dict(self.hed_schema)
+        self.hed_strings = [str(text) for text in TabularInput(self.events.copy(), sidecar=self.sidecar).series_a]
+        tags = get_simple_tags(self.hed_schema)[::37]
+        self.queries = [tags[0], f"{tags[1]} and {tags[2]}", f"{tags[3]} or [{tags[4]}]",
+                        f"{{{tags[5]}, {tags[6]}}}", f"~{tags[7]}", "Def/Cond-1", f"{tags[8][:3]}*"]
+
+    def get_sidecar(self):
+        return Sidecar(io.StringIO(json.dumps(self.sidecar_dict)), name="synthetic_events.json")
+
+    def get_tabular(self):
+        return TabularInput(self.events.copy(), sidecar=self.get_sidecar(), name="synthetic_events.tsv")
+
+    def get_operations(self):
+        return [
+            {"operation": "remove_columns", "description": "", "parameters": {"column_names": ["duration"],
+                                                                              "ignore_missing": True}},
+            {"operation": "factor_column", "description": "",
+             "parameters": {"column_name": "cat1", "factor_values": ["level0", "level1"],
+                            "factor_names": ["factor0", "factor1"]}},
+            {"operation": "factor_hed_tags", "description": "",
+             "parameters": {"queries": self.queries[:3], "query_names": ["query0", "query1", "query2"],
+                            "remove_types": []}},
+            {"operation": "summarize_hed_tags", "description": "",
+             "parameters": {"summary_name": "tags", "summary_filename": "tags",
+                            "tags": {"Sensory events": ["Sensory-event"], "Actions": ["Agent-action"]}}},
+            {"operation": "summarize_column_values", "description": "",
+             "parameters": {"summary_name": "values", "summary_filename": "values", "skip_columns": ["HED"],
+                            "value_columns": ["onset", "response_time"]}}
+        ]
+
+
+def _setup_parse(data):
+    return data.hed_strings
+
+
+def _run_parse(data, hed_strings):
+    return [HedString(hed_string, data.hed_schema, data.def_dict) for hed_string in hed_strings]
+
+
+def _setup_validate_strings(data):
+    return HedValidator(data.hed_schema, def_dicts=data.def_dict), _run_parse(data, data.hed_strings)
+
+
+def _run_validate_strings(data, setup):
+    validator, hed_strings = setup
+    return [validator.validate(hed_string, allow_placeholders=False) for hed_string in hed_strings]
+
+
+def _run_validate(data, tabular):
+    return tabular.validate(data.hed_schema)
+
+
+def _run_assemble(data, tabular):
+    return tabular.series_a
+
+
+def _setup_search(data):
+    return [QueryParser(query) for query in data.queries], _run_parse(data, data.hed_strings)
+
+
+def _run_search(data, setup):
+    queries, hed_strings = setup
+    return [[query.search(hed_string) for hed_string in hed_strings] for query in queries]
+
+
+def _setup_search_index(data):
+    # Imported here, so the other benchmarks still run on releases without the search index.
+    from hed.tools.analysis.search_index import SearchIndex
+    return (SearchIndex,) + _setup_search(data)
+
+
+def _run_search_index(data, setup):
+    search_index, queries, hed_strings = setup
+    return search_index(hed_strings).search_all(queries)
+
+
+def _setup_remodel(data):
+    return Dispatcher(data.get_operations(), data_root=None, hed_versions=data.hed_schema), data.get_sidecar()
+
+
+def _run_remodel(data, setup):
+    dispatch, sidecar = setup
+    return dispatch.run_operations(data.events_path, sidecar=sidecar)
+
+
+# Each benchmark has a description, an untimed setup and the timed run, which is passed the setup result.
+BENCHMARKS = {
+    "parse": ("HedString from each assembled event string", _setup_parse, _run_parse),
+    "validate_strings": ("HedValidator.validate on each parsed event string",
+                         _setup_validate_strings, _run_validate_strings),
+    "validate": ("TabularInput.validate of the events with the sidecar", BenchmarkData.get_tabular, _run_validate),
+    "assemble": ("TabularInput.series_a of the events with the sidecar", BenchmarkData.get_tabular,
+                 _run_assemble),
+    "search": ("QueryParser.search of each query on each parsed event string", _setup_search, _run_search),
+    "search_index": ("SearchIndex.search_all of the queries on the parsed event strings", _setup_search_index,
+                     _run_search_index),
+    "remodel": ("Dispatcher.run_operations with factor and summary operations", _setup_remodel, _run_remodel),
+}
+
+
+def clear_caches(data):
+    """ Empty the caches kept between calls, so that every run starts cold.
+
+    Parameters:
+        data (BenchmarkData): The synthetic data, whose schema holds some of the caches.
+
+    Notes:
+        - Releases without a cache are skipped, so results can be compared across releases.
+
+    """
+    try:
+        from hed.models.hed_string_cache import clear_cache
+        clear_cache()
+    except ImportError:
+        pass
+    try:
+        from hed.models.expression_parser import clear_query_cache
+        clear_query_cache()
+    except ImportError:
+        pass
+    if hasattr(data.hed_schema, "_tag_lookup_cache"):
+        data.hed_schema._tag_lookup_cache.clear()
+    for entry in data.hed_schema.tags.values():
+        if hasattr(entry, "_unit_matches"):
+            entry._unit_matches = None
+
+
+def run_benchmark(data, setup, run, repeats=3):
+    """ Time a benchmark and measure its peak memory.
+
+    Parameters:
+        data (BenchmarkData): The synthetic data.
+        setup (function): Called with data to make the input of each run.  It is not timed.
+        run (function): Called with data and the result of setup.
+        repeats (int): The number of timed runs.
+
+    Returns:
+        dict: The run times in seconds and the peak memory in MB allocated during an extra run.
+
+    Notes:
+        - The memory is measured in a separate run because tracemalloc slows Python down.
+        - The caches are cleared before each setup, so every run is timed cold.  Validators, sidecars and their
+          caches are made by the setup functions, so they are new for each run as well.
+
+    """
+    times = []
+    for _ in range(repeats):
+        clear_caches(data)
+        setup_result = setup(data)
+        start = time.perf_counter()
+        run(data, setup_result)
+        times.append(time.perf_counter() - start)
+    clear_caches(data)
+    setup_result = setup(data)
+    tracemalloc.start()
+    try:
+        run(data, setup_result)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rows = len(data.events)
+    return {"min_s": min(times), "median_s": statistics.median(times), "mean_s": statistics.mean(times),
+            "rows_per_s": rows / min(times) if min(times) > 0 else None, "peak_mb": peak / 2 ** 20}
+
+
+def get_metadata(args):
+    return {"hedtools": hed.__version__, "python": platform.python_version(), "numpy": np.__version__,
+            "pandas": pd.__version__, "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec='seconds'),
+            "parameters": {"rows": args.rows, "categorical_columns": args.categorical_columns,
+                           "levels": args.levels, "definitions": args.definitions,
+                           "tags_per_string": args.tags_per_string, "seed": args.seed,
+                           "schema_version": args.schema_version, "repeats": args.repeats}}
+
+
+def compare_results(results, old_results):
+    """ Return a table of the ratio of the old minimum times and peak memory to the new ones.
+
+    Parameters:
+        results (dict): The results of this run.
+        old_results (dict): The results of an earlier run as saved by this program.
+
+    Returns:
+        str: One line per benchmark in both runs.  A speedup above 1 means this run is faster.
+
+    """
+    lines = [f"{'benchmark':<18}{'old min (s)':>14}{'new min (s)':>14}{'speedup':>10}{'memory':>10}"]
+    for name, result in results["results"].items():
+        old = old_results.get("results", {}).get(name)
+        if not old:
+            continue
+        speedup = old["min_s"] / result["min_s"] if result["min_s"] else float('inf')
+        memory = old["peak_mb"] / result["peak_mb"] if result["peak_mb"] else float('inf')
+        lines.append(f"{name:<18}{old['min_s']:>14.4f}{result['min_s']:>14.4f}{speedup:>10.2f}{memory:>10.2f}")
+    return "\n".join(lines)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="Times HEDTools hot paths on synthetic data.")
+    add_data_arguments(parser)
+    parser.add_argument("-b", "--benchmarks", nargs="*", default=list(BENCHMARKS), choices=list(BENCHMARKS),
+                        help="The benchmarks to run (all by default).")
+    parser.add_argument("-n", "--repeats", type=int, default=3, help="Number of timed runs of each benchmark.")
+    parser.add_argument("-o", "--output", default="", help="If given, the results are saved to this JSON file.")
+    parser.add_argument("--compare", default="", help="If given, compare the results to this earlier JSON file.")
+    return parser
+
+
+def main(arg_list=None):
+    args = get_parser().parse_args(arg_list)
+    results = {"metadata": get_metadata(args), "results": {}}
+    print(f"{'benchmark':<18}{'min (s)':>10}{'median (s)':>12}{'rows/s':>12}{'peak (MB)':>11}  description")
+    with tempfile.TemporaryDirectory() as work_dir:
+        data = BenchmarkData(args, work_dir)
+        for name in args.benchmarks:
+            description, setup, run = BENCHMARKS[name]
+            try:
+                result = run_benchmark(data, setup, run, args.repeats)
+            except ImportError as e:
+                print(f"{name:<18}skipped, not available in this version: {e}")
+                continue
+            results["results"][name] = result
+            print(f"{name:<18}{result['min_s']:>10.4f}{result['median_s']:>12.4f}"
+                  f"{result['rows_per_s'] or 0:>12.0f}{result['peak_mb']:>11.2f}  {description}")
+            sys.stdout.flush()
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=4)
+    if args.compare:
+        with open(args.compare, 'r') as fp:
+            print("\n" + compare_results(results, json.load(fp)))
+    return results
+
+
+if __name__ == '__main__':
+    main()
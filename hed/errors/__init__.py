@@ -1,5 +1,7 @@
-from .error_reporter import ErrorHandler, get_printable_issue_string, sort_issues, replace_tag_references
+from .error_reporter import ErrorHandler, IssueRecord, get_printable_issue_string, sort_issues, \
+    replace_tag_references
 from .error_types import DefinitionErrors, OnsetErrors, SchemaErrors, SchemaWarnings,  SidecarErrors, \
     ValidationErrors, ColumnErrors
 from .error_types import ErrorContext, ErrorSeverity
 from .exceptions import HedExceptions, HedFileError
+from .issue_sinks import IssueSink, CallbackIssueSink, CountingIssueSink, FirstErrorsIssueSink, JsonlIssueSink
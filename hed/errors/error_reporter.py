@@ -5,8 +5,12 @@ You can scope the formatted errors with calls to push_error_context and pop_erro
 """
 
 from functools import wraps
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import MutableMapping
 import xml.etree.ElementTree as ET
 import copy
+import sys
 from hed.errors.error_types import ErrorContext, ErrorSeverity
 from hed.errors.known_error_codes import known_error_codes
 
@@ -35,6 +39,31 @@ int_sort_list = [
 ]
 
 
+# If True, errors are created without messages.  See skip_error_messages.
+_skip_messages = ContextVar("skip_error_messages", default=False)
+
+
+@contextmanager
+def skip_error_messages():
+    """ Within this context, errors are created without formatting their messages or finding their positions.
+
+    Notes:
+        - The issues still have their codes and severities, which is all that is needed to decide validity.
+        - This applies to the current thread or task only.
+
+    """
+    token = _skip_messages.set(True)
+    try:
+        yield
+    finally:
+        _skip_messages.reset(token)
+
+
+def error_messages_skipped():
+    """ Return True if called within skip_error_messages. """
+    return _skip_messages.get()
+
+
 def _register_error_function(error_type, wrapper_func):
     if error_type in error_functions:
         raise KeyError(f"{error_type} defined more than once.")
@@ -67,6 +96,8 @@ def hed_error(error_type, default_severity=ErrorSeverity.ERROR, actual_code=None
             Returns:
                 list: A list of dict with the errors.=
             """
+            if _skip_messages.get():
+                return ErrorHandler._create_error_object(actual_code, "", severity)
             base_message = func(*args, **kwargs)
             error_object = ErrorHandler._create_error_object(actual_code, base_message, severity)
             return error_object
@@ -108,6 +139,8 @@ def hed_tag_error(error_type, default_severity=ErrorSeverity.ERROR, has_sub_tag=
                     list: A list of dict with the errors.
 
                 """
+                if _skip_messages.get():
+                    return ErrorHandler._create_error_object(actual_code, "", severity, source_tag=tag)
                 try:
                     tag_as_string = tag.tag
                 except AttributeError:
@@ -145,6 +178,8 @@ def hed_tag_error(error_type, default_severity=ErrorSeverity.ERROR, has_sub_tag=
                     list: A list of dict with the errors.
 
                 """
+                if _skip_messages.get():
+                    return ErrorHandler._create_error_object(actual_code, "", severity, source_tag=tag)
                 from hed.models.hed_tag import HedTag
                 from hed.models.hed_group import HedGroup
                 if isinstance(tag, HedTag):
@@ -174,11 +209,149 @@ error_messages.mark_as_used = True
 schema_error_messages.mark_as_used = True
 
 
+class IssueRecord(MutableMapping):
+    """ A compact issue that can be used wherever an issue dictionary is expected.
+
+    Notes:
+        - The keys of a record are kept in a tuple shared by all the records with the same keys,
+          so a record only holds its own values.
+        - Values other than strings, numbers and None are replaced by their text.
+          The HED string context becomes the original HED string, so records hold no parse trees.
+        - Use dict(record) to get a plain dictionary, for example to save issues as JSON.
+
+    """
+    __slots__ = ('_keys', '_values')
+
+    # Shared key tuples and their key to position dictionaries.
+    _key_tuples = {}
+
+    def __init__(self, issue=None):
+        """ Create a record from an issue dictionary.
+
+        Parameters:
+            issue (dict or None): The issue to copy.
+
+        """
+        issue = issue if issue else {}
+        self._keys = self._get_key_tuple(tuple(issue))
+        self._values = [self._snapshot(key, value) for key, value in issue.items()]
+
+    @classmethod
+    def _get_key_tuple(cls, keys):
+        entry = cls._key_tuples.get(keys)
+        if entry is None:
+            keys = tuple(sys.intern(key) for key in keys)
+            entry = (keys, {key: position for position, key in enumerate(keys)})
+            cls._key_tuples[keys] = entry
+        return entry[0]
+
+    def _position(self, key):
+        return self._key_tuples[self._keys][1].get(key)
+
+    @staticmethod
+    def _snapshot(key, value):
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if key == ErrorContext.HED_STRING and hasattr(value, "get_original_hed_string"):
+            return value.get_original_hed_string()
+        return str(value)
+
+    def __getitem__(self, key):
+        position = self._position(key)
+        if position is None:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __setitem__(self, key, value):
+        value = self._snapshot(key, value)
+        position = self._position(key)
+        if position is None:
+            self._keys = self._get_key_tuple(self._keys + (key,))
+            self._values.append(value)
+        else:
+            self._values[position] = value
+
+    def __delitem__(self, key):
+        position = self._position(key)
+        if position is None:
+            raise KeyError(key)
+        self._keys = self._get_key_tuple(self._keys[:position] + self._keys[position + 1:])
+        del self._values[position]
+
+    def __contains__(self, key):
+        return self._position(key) is not None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"IssueRecord({dict(self)!r})"
+
+    def __getstate__(self):
+        return self._keys, self._values
+
+    def __setstate__(self, state):
+        self._keys = self._get_key_tuple(state[0])
+        self._values = state[1]
+
+    def copy(self):
+        new_record = IssueRecord()
+        new_record._keys = self._keys
+        new_record._values = list(self._values)
+        return new_record
+
+
 class ErrorHandler:
-    def __init__(self, check_for_warnings=True):
+    def __init__(self, check_for_warnings=True, compact=False, issue_sink=None):
+        """ Create an error handler.
+
+        Parameters:
+            check_for_warnings (bool): If False, issues that are warnings are dropped.
+            compact (bool): If True, the issues with context added by this handler are IssueRecords,
+                            which use less memory and don't keep the HedStrings and tags they refer to.
+            issue_sink (IssueSink, function, or None): If given, validators send the issues they find here
+                            instead of returning them.  See hed.errors.issue_sinks.
+        """
         # The current (ordered) dictionary of contexts.
         self.error_context = []
         self._check_for_warnings = check_for_warnings
+        self._compact = compact
+        # The last HedString context made into text, as the issues for a string usually come together.
+        self._last_hed_string = (None, "")
+        from hed.errors.issue_sinks import as_issue_sink
+        self._issue_sink = as_issue_sink(issue_sink)
+
+    @property
+    def issue_sink(self):
+        return self._issue_sink
+
+    @property
+    def stop_requested(self):
+        """ Return True if the issue sink has all the issues it wants, so validation can stop. """
+        return self._issue_sink is not None and self._issue_sink.done
+
+    def report_issues(self, issues):
+        """ Send finished issues to the issue sink if there is one.
+
+        Parameters:
+            issues (list): Issues with their context added.
+
+        Returns:
+            list: The issues the caller should keep: all of them if there is no sink and none otherwise.
+
+        Notes:
+            - Validators call this where they would otherwise accumulate issues, so issues reach the sink in
+              the order they are found rather than sorted.
+
+        """
+        if self._issue_sink is None:
+            return issues
+        for issue in issues:
+            self._issue_sink.add(issue)
+        return []
 
     def push_error_context(self, context_type, context):
         """ Push a new error context to narrow down error scope.
@@ -229,9 +402,20 @@ class ErrorHandler:
                 return []
             self._add_context_to_errors(actual_error, self.error_context)
             self._update_error_with_char_pos(actual_error)
+            if self._compact:
+                error_object[0] = self._compact_issue(actual_error)
 
         return error_object
 
+    def _compact_issue(self, error_object):
+        """ Return an IssueRecord for the issue, sharing the text of the HED string with the previous issue. """
+        hed_string = error_object.get(ErrorContext.HED_STRING)
+        if hed_string is not None and not isinstance(hed_string, str):
+            if self._last_hed_string[0] is not hed_string:
+                self._last_hed_string = (hed_string, hed_string.get_original_hed_string())
+            error_object[ErrorContext.HED_STRING] = self._last_hed_string[1]
+        return IssueRecord(error_object)
+
     @staticmethod
     def format_error(error_type, *args, actual_error=None, **kwargs):
         """ Format an error based on the parameters, which vary based on what type of error this is.
@@ -270,9 +454,11 @@ class ErrorHandler:
         if not self._check_for_warnings:
             issues[:] = self.filter_issues_by_severity(issues, ErrorSeverity.ERROR)
 
-        for error_object in issues:
+        for index, error_object in enumerate(issues):
             self._add_context_to_errors(error_object, self.error_context)
             self._update_error_with_char_pos(error_object)
+            if self._compact:
+                issues[index] = self._compact_issue(error_object)
 
     @staticmethod
     def format_error_from_context(error_type, error_context, *args, actual_error=None, **kwargs):
@@ -363,6 +549,8 @@ class ErrorHandler:
     @staticmethod
     def _update_error_with_char_pos(error_object):
         # This part is optional as you can always generate these as needed.
+        if _skip_messages.get():
+            return
         start, end = ErrorHandler._get_tag_span_to_error_object(error_object)
         if start is not None and end is not None:
             source_tag = error_object.get('source_tag', None)
@@ -583,7 +771,7 @@ def _get_context_from_issue(val_issue, skip_filename=True):
     for key, value in val_issue.items():
         if skip_filename and key == ErrorContext.FILE_NAME:
             continue
-        if key == ErrorContext.HED_STRING:
+        if key == ErrorContext.HED_STRING and not isinstance(value, str):
             value = value.get_original_hed_string()
         if key.startswith("ec_"):
             single_issue_context.append((key, str(value)))
@@ -683,9 +871,9 @@ def replace_tag_references(list_or_dict):
     Parameters:
        list_or_dict(list or dict): An arbitrarily nested list/dict structure
     """
-    if isinstance(list_or_dict, dict):
+    if isinstance(list_or_dict, (dict, IssueRecord)):
         for key, value in list_or_dict.items():
-            if isinstance(value, (dict, list)):
+            if isinstance(value, (dict, list, IssueRecord)):
                 replace_tag_references(value)
             elif isinstance(value, (bool, float, int)):
                 list_or_dict[key] = value
@@ -693,7 +881,7 @@ def replace_tag_references(list_or_dict):
                 list_or_dict[key] = str(value)
     elif isinstance(list_or_dict, list):
         for key, value in enumerate(list_or_dict):
-            if isinstance(value, (dict, list)):
+            if isinstance(value, (dict, list, IssueRecord)):
                 replace_tag_references(value)
             elif isinstance(value, (bool, float, int)):
                 list_or_dict[key] = value
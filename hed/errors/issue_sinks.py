@@ -0,0 +1,166 @@
+""" Destinations for validation issues as they are found, so they don't have to be kept in memory.
+
+Pass an issue sink to an ErrorHandler and the validators send each finished issue to it rather than returning it.
+Any object with an add(issue) method and a done attribute can be used as a sink.
+A plain function can also be used.  It is called with each issue and can return True to stop validation.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from collections import Counter
+from hed.errors.error_types import ErrorSeverity
+from hed.errors.error_reporter import IssueRecord
+
+
+def as_issue_sink(issue_sink):
+    """ Return the issue sink to use for an issue sink, a function or None.
+
+    Parameters:
+        issue_sink (IssueSink, function, or None): An object with add and done, or a function to call with each issue.
+
+    Returns:
+        IssueSink or None: The sink, with any function wrapped in a CallbackIssueSink.
+
+    """
+    if issue_sink is None or hasattr(issue_sink, "add"):
+        return issue_sink
+    return CallbackIssueSink(issue_sink)
+
+
+class IssueSink(ABC):
+    """ Abstract base class for issue sinks.
+
+    Notes:
+        - Subclasses override add and set done to True once validation should stop.
+        - Validators check done between rows, strings and files, so a few more issues may arrive after it is set.
+
+    """
+
+    def __init__(self):
+        self.done = False
+
+    @abstractmethod
+    def add(self, issue):
+        """ Receive a single issue.
+
+        Parameters:
+            issue (dict): An issue with its context.
+
+        Notes:
+            Abstract method implemented by each individual sink.
+
+        """
+        pass
+
+    def close(self):
+        """ Release any resources held by this sink. """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def is_error(issue):
+        return issue['severity'] < ErrorSeverity.WARNING
+
+
+class CallbackIssueSink(IssueSink):
+    """ Issue sink that calls a function with each issue. """
+
+    def __init__(self, callback):
+        """ Create a sink for a function.
+
+        Parameters:
+            callback (function): Called with each issue.  If it returns True, validation stops.
+
+        """
+        super().__init__()
+        self.callback = callback
+
+    def add(self, issue):
+        if self.callback(issue):
+            self.done = True
+
+
+class CountingIssueSink(IssueSink):
+    """ Issue sink that only counts the issues it receives. """
+
+    def __init__(self):
+        super().__init__()
+        self.error_count = 0
+        self.warning_count = 0
+        self.code_counts = Counter()
+
+    @property
+    def count(self):
+        return self.error_count + self.warning_count
+
+    def add(self, issue):
+        if self.is_error(issue):
+            self.error_count += 1
+        else:
+            self.warning_count += 1
+        self.code_counts[issue['code']] += 1
+
+
+class FirstErrorsIssueSink(IssueSink):
+    """ Issue sink that keeps the issues until a number of errors have been found and then stops validation. """
+
+    def __init__(self, max_errors=1, keep_warnings=True):
+        """ Create a sink that stops after max_errors errors.
+
+        Parameters:
+            max_errors (int): The number of errors after which validation stops.
+            keep_warnings (bool): If False, warnings are not kept.
+
+        """
+        super().__init__()
+        self.max_errors = max_errors
+        self.keep_warnings = keep_warnings
+        self.error_count = 0
+        self.issues = []
+
+    def add(self, issue):
+        if self.is_error(issue):
+            if self.error_count >= self.max_errors:
+                return
+            self.error_count += 1
+            self.done = self.error_count >= self.max_errors
+        elif not self.keep_warnings or self.done:
+            return
+        self.issues.append(issue)
+
+
+class JsonlIssueSink(IssueSink):
+    """ Issue sink that writes each issue as a line of JSON. """
+
+    def __init__(self, file, mode='w'):
+        """ Create a sink writing to a file.
+
+        Parameters:
+            file (str or file-like): The path of the file to write or a text file opened for writing.
+            mode (str): The mode in which to open the file if a path is given ('w' or 'a').
+
+        Notes:
+            - HedStrings and other objects in the issues are written as text.
+
+        """
+        super().__init__()
+        self.count = 0
+        if isinstance(file, str):
+            self._file = open(file, mode, encoding='utf-8')
+            self._close_file = True
+        else:
+            self._file = file
+            self._close_file = False
+
+    def add(self, issue):
+        self._file.write(json.dumps(dict(IssueRecord(issue))) + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._close_file and not self._file.closed:
+            self._file.close()
@@ -3,12 +3,14 @@
 from .base_input import BaseInput
 from .column_mapper import ColumnMapper
 from .column_metadata import ColumnMetadata, ColumnType
+from .compiled_sidecar import CompiledSidecar
 from .definition_dict import DefinitionDict
 from .definition_entry import DefinitionEntry
 from .expression_parser import QueryParser
 from .hed_group import HedGroup
 from .spreadsheet_input import SpreadsheetInput
 from .hed_string import HedString
+from .hed_string_cache import HedStringCache
 from .hed_tag import HedTag
 from .sidecar import Sidecar
 from .tabular_input import TabularInput
@@ -1,5 +1,6 @@
 import re
 import os
+from functools import lru_cache
 
 import openpyxl
 import pandas
@@ -57,6 +58,8 @@ class BaseInput:
         self._loaded_workbook = None
         self._worksheet_name = worksheet_name
         self._dataframe = None
+        # The number of data rows before this one in the source file, if this is one chunk of a larger file.
+        self._row_offset = 0
 
         input_type = file_type
         if isinstance(file, str):
@@ -158,6 +161,11 @@ class BaseInput:
         """ Name of the data. """
         return self._name
 
+    @property
+    def row_offset(self):
+        """ The number of data rows in the source file before this one.  Non-zero only for chunks after the first. """
+        return self._row_offset
+
     @property
     def has_column_names(self):
         """ True if dataframe has column names. """
@@ -441,30 +449,44 @@ class BaseInput:
         if newvalue != "n/a":
             return text.replace(f"{{{column_ref}}}", newvalue)
 
-        def _remover(match):
-            p1 = match.group("p1").count("(")
-            p2 = match.group("p2").count(")")
-            if p1 > p2:  # We have more starting parens than ending.  Make sure we don't remove comma before
-                output = match.group("c1") + "(" * (p1 - p2)
-            elif p2 > p1:  # We have more ending parens.  Make sure we don't remove comma after
-                output = ")" * (p2 - p1) + match.group("c2")
-            else:
-                c1 = match.group("c1")
-                c2 = match.group("c2")
-                if c1:
-                    c1 = ""
-                elif c2:
-                    c2 = ""
-                output = c1 + c2
-
-            return output
-
-        # this finds all surrounding commas and parentheses to a reference.
-        # c1/c2 contain the comma(and possibly spaces) separating this ref from other tags
-        # p1/p2 contain the parentheses directly surrounding the tag
-        # All four groups can have spaces.
-        pattern = r'(?P<c1>[\s,]*)(?P<p1>[(\s]*)\{' + column_ref + r'\}(?P<p2>[\s)]*)(?P<c2>[\s,]*)'
-        return re.sub(pattern, _remover, text)
+        return _get_ref_pattern(column_ref).sub(_remove_ref_match, text)
+
+    @staticmethod
+    def _replace_ref_column(column, new_values, column_ref):
+        """ Replace column ref in every row of a column with the matching row of new_values.
+
+        Parameters:
+            column (Series): The strings containing the ref enclosed in curly braces.
+            new_values (Series): The replacement value for each row.
+            column_ref (str): The ref to be replaced, without curly braces
+
+        Returns:
+            Series: The column with the ref replaced or removed in each row.
+
+        Notes:
+            - Produces the same result as calling _replace_ref on each row.
+            - Rows without the ref are left alone, n/a removal is only done once per unique string.
+        """
+        column_ref_brackets = f"{{{column_ref}}}"
+        has_ref = column.str.contains(column_ref_brackets, regex=False).fillna(False).astype(bool)
+        if not has_ref.any():
+            return column
+
+        column = column.copy()
+        is_na = new_values == "n/a"
+        replace_mask = has_ref & ~is_na
+        if replace_mask.any():
+            column[replace_mask] = [text.replace(column_ref_brackets, value) for text, value
+                                    in zip(column[replace_mask], new_values[replace_mask])]
+
+        remove_mask = has_ref & is_na
+        if remove_mask.any():
+            pattern = _get_ref_pattern(column_ref)
+            to_remove = column[remove_mask]
+            removed = {text: pattern.sub(_remove_ref_match, text) for text in to_remove.unique()}
+            column[remove_mask] = to_remove.map(removed)
+
+        return column
 
     @staticmethod
     def _handle_curly_braces_refs(df, refs, column_names):
@@ -478,13 +500,10 @@ class BaseInput:
         # Replace references in the columns we are saving out.
         saved_columns = df[refs]
         for column_name in remaining_columns:
+            column = df[column_name]
             for replacing_name in refs:
-                # If the data has no n/a values, this version is MUCH faster.
-                # column_name_brackets = f"{{{replacing_name}}}"
-                # df[column_name] = pd.Series(x.replace(column_name_brackets, y) for x, y
-                #                             in zip(df[column_name], saved_columns[replacing_name]))
-                df[column_name] = pd.Series(BaseInput._replace_ref(x, y, replacing_name) for x, y
-                                            in zip(df[column_name], saved_columns[replacing_name]))
+                column = BaseInput._replace_ref_column(column, saved_columns[replacing_name], replacing_name)
+            df[column_name] = column
         df = df[remaining_columns]
 
         return df
@@ -531,6 +550,85 @@ class BaseInput:
         """
         return []
 
+    @classmethod
+    def _read_chunks(cls, file, has_column_names, chunk_size):
+        """ Read a tsv file in pieces of roughly chunk_size rows.
+
+        Parameters:
+            file (str or file-like): A tsv file to open.
+            has_column_names (bool): True if file has column names.
+            chunk_size (int): The number of rows to read at a time.
+
+        Yields:
+            tuple:
+                int: The number of data rows before this chunk.
+                DataFrame: The rows of this chunk, indexed from 0.
+
+        :raises HedFileError:
+            - file is blank
+            - An invalid extension was provided
+            - The file had an invalid format and could not be read
+            - The file has no rows
+
+        Notes:
+            - If the file has an onset column, consecutive rows that share an onset are never split between two
+              chunks.  The trailing rows of each chunk that share an onset are held over to the start of the next
+              chunk.
+            - This assumes the onsets are sorted.  A row whose onset matches a row in an earlier chunk, but not the
+              row just before it, is not grouped with that row as it would be when reading the whole file.
+        """
+        if not file:
+            raise HedFileError(HedExceptions.FILE_NOT_FOUND, "Empty file passed to BaseInput.", file)
+        if isinstance(file, str) and os.path.splitext(file)[1] not in cls.TEXT_EXTENSION:
+            raise HedFileError(HedExceptions.INVALID_EXTENSION, "Only tsv files can be read in chunks", file)
+
+        pandas_header = 0
+        if not has_column_names:
+            pandas_header = None
+        try:
+            reader = pandas.read_csv(file, delimiter='\t', header=pandas_header, dtype=str, keep_default_na=True,
+                                     na_values=["", "null"], chunksize=chunk_size)
+            row_offset = 0
+            held_rows = None
+            for chunk in reader:
+                chunk = chunk.fillna("n/a")
+                if held_rows is not None:
+                    chunk = pd.concat([held_rows, chunk])
+                chunk = chunk.reset_index(drop=True)
+                held_rows = None
+                if "onset" in chunk.columns:
+                    split_index = cls._last_onset_group_start(pd.to_numeric(chunk["onset"], errors="coerce"))
+                    held_rows = chunk.iloc[split_index:]
+                    chunk = chunk.iloc[:split_index]
+                if len(chunk):
+                    yield row_offset, chunk
+                    row_offset += len(chunk)
+        except HedFileError:
+            raise
+        except Exception as e:
+            raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, str(e), file) from e
+
+        if held_rows is not None and len(held_rows):
+            yield row_offset, held_rows.reset_index(drop=True)
+            row_offset += len(held_rows)
+        if not row_offset:
+            raise HedFileError(HedExceptions.INVALID_DATAFRAME, "Invalid dataframe(malformed datafile, etc)", file)
+
+    @staticmethod
+    def _last_onset_group_start(onsets):
+        """ Return the position of the first row of the last group of rows sharing an onset.
+
+            Rows are grouped the same way as _indexed_dict_from_onsets.
+        """
+        current_onset = -1000000.0
+        tol = 1e-9
+        group_start = 0
+        for i, onset in enumerate(onsets):
+            if abs(onset - current_onset) > tol:
+                current_onset = onset
+                group_start = i
+        return group_start
+
     def _open_dataframe_file(self, file, has_column_names, input_type):
         pandas_header = 0
         if not has_column_names:
@@ -561,3 +659,33 @@ class BaseInput:
 
         if self._dataframe.size == 0:
             raise HedFileError(HedExceptions.INVALID_DATAFRAME, "Invalid dataframe(malformed datafile, etc)", file)
+
+
+@lru_cache(maxsize=None)
+def _get_ref_pattern(column_ref):
+    """ Return the compiled pattern matching a column ref and the commas and parentheses surrounding it. """
+    # this finds all surrounding commas and parentheses to a reference.
+    # c1/c2 contain the comma(and possibly spaces) separating this ref from other tags
+    # p1/p2 contain the parentheses directly surrounding the tag
+    # All four groups can have spaces.
+    return re.compile(r'(?P<c1>[\s,]*)(?P<p1>[(\s]*)\{' + re.escape(column_ref) + r'\}(?P<p2>[\s)]*)(?P<c2>[\s,]*)')
+
+
+def _remove_ref_match(match):
+    """ Return the replacement text for a ref matched by _get_ref_pattern, keeping the parentheses balanced. """
+    p1 = match.group("p1").count("(")
+    p2 = match.group("p2").count(")")
+    if p1 > p2:  # We have more starting parens than ending.  Make sure we don't remove comma before
+        output = match.group("c1") + "(" * (p1 - p2)
+    elif p2 > p1:  # We have more ending parens.  Make sure we don't remove comma after
+        output = ")" * (p2 - p1) + match.group("c2")
+    else:
+        c1 = match.group("c1")
+        c2 = match.group("c2")
+        if c1:
+            c1 = ""
+        elif c2:
+            c2 = ""
+        output = c1 + c2
+
+    return output
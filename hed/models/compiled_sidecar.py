@@ -0,0 +1,242 @@
+""" The HED strings of a sidecar parsed once, so the rows of every data file using it can be built from copies. """
+import re
+
+from hed.models.column_metadata import ColumnType
+from hed.models.hed_string import HedString
+from hed.models.hed_tag import HedTag
+from hed.models.hed_string_cache import get_hed_string, copy_hed_tree
+
+# Values that could change how the filled in string splits into tags, so it must be parsed again.
+_UNSAFE_VALUE_PATTERN = re.compile(r"^$|^\s|\s$|[,()]")
+
+
+class CompiledSidecar:
+    """ Parsed templates for the categorical and value HED strings of a sidecar.
+
+    Notes:
+        - Categorical strings are parsed once and copied for each row using them.
+        - Value strings are parsed once with the # in place.  Each row copies the template and only parses the tag
+          holding the #, with the value plugged in.
+        - Templates are looked up by their text, so strings that aren't in the sidecar (or were changed since)
+          are parsed as usual.
+
+    """
+
+    def __init__(self, sidecar, hed_schema, def_dict=None):
+        """ Parse the HED strings of a sidecar.
+
+        Parameters:
+            sidecar (Sidecar): The sidecar whose strings should be parsed.
+            hed_schema (HedSchema or HedSchemaGroup): The schema to use to identify tags.
+            def_dict (DefinitionDict or None): The def dict to use to identify def/def expand tags.
+
+        """
+        self.hed_schema = hed_schema
+        self.def_dict = def_dict
+        # Categorical HED string text to its parse, or None if it could not be parsed.
+        self._templates = {}
+        # Value column HED string text to its _ValueTemplate.
+        self._value_templates = {}
+        for column_data in sidecar:
+            if column_data.column_type == ColumnType.Categorical:
+                for hed_string in column_data.hed_dict.values():
+                    if isinstance(hed_string, str) and hed_string not in self._templates:
+                        self._templates[hed_string] = self._parse(hed_string)
+            elif column_data.column_type == ColumnType.Value and isinstance(column_data.hed_dict, str):
+                self._get_value_template(column_data.hed_dict)
+
+    def get_hed_strings(self, tabular_input):
+        """ Return the assembled HedString of each row of a data file.
+
+        Parameters:
+            tabular_input (BaseInput): The data file, usually a TabularInput using the compiled sidecar.
+
+        Returns:
+            list: A HedString for each row, equivalent to parsing the matching row of tabular_input.series_a.
+
+        Notes:
+            - The spans of the tags and groups are positions in the row text, as they would be from parsing it.
+
+        """
+        assembled = tabular_input.assemble()
+        column_metadata = {column.column_name: column for column in tabular_input.column_metadata().values()}
+        column_texts = []
+        column_functions = []
+        for column_name in assembled.columns:
+            column_texts.append([str(text) for text in assembled[column_name]])
+            column_functions.append(self._get_column_function(column_metadata.get(column_name),
+                                                              tabular_input.dataframe, column_name))
+
+        hed_strings = []
+        rows = zip(*column_texts) if column_texts else [()] * len(assembled)
+        for row_number, row_texts in enumerate(rows):
+            texts = []
+            parts = []
+            for text, get_string in zip(row_texts, column_functions):
+                if not text or text == "n/a":
+                    continue
+                texts.append(text)
+                parts.append(get_string(text, row_number))
+            row_text = ", ".join(texts)
+            if any(part is None for part in parts):
+                # Something in this row doesn't parse on its own, so parse it the same way as the assembled text.
+                hed_strings.append(get_hed_string(row_text, self.hed_schema, self.def_dict))
+                continue
+            children = []
+            offset = 0
+            for text, part in zip(texts, parts):
+                _move_to_row(part, row_text, offset)
+                children += part.children
+                offset += len(text) + 2
+            hed_strings.append(HedString(row_text, self.hed_schema, self.def_dict, _contents=children))
+        return hed_strings
+
+    def get_string(self, hed_string):
+        """ Return a parsed copy of a HED string, using the template if it is one of the categorical strings.
+
+        Parameters:
+            hed_string (str): The HED string.
+
+        Returns:
+            HedString or None: The parsed string, or None if it has mismatched parentheses.
+
+        """
+        if hed_string in self._templates:
+            template = self._templates[hed_string]
+            if template is None:
+                return None
+            return copy_hed_tree(template)
+        return self._parse(hed_string)
+
+    def get_value_string(self, value_string, value):
+        """ Return the parse of a value column HED string with a value plugged in for the #.
+
+        Parameters:
+            value_string (str): The HED string of the value column, with a #.
+            value (str): The value to plug in.
+
+        Returns:
+            HedString or None: The parsed string, or None if it has mismatched parentheses.
+
+        """
+        template = self._get_value_template(value_string)
+        hed_string = value_string.replace("#", value)
+        placeholder = template.placeholder
+        if placeholder is None or _UNSAFE_VALUE_PATTERN.search(value):
+            if template.hed_string is not None and "#" not in value_string:
+                return copy_hed_tree(template.hed_string)
+            return self._parse(hed_string)
+
+        position = template.position
+        shift = len(value) - 1
+        new_tag = HedTag(hed_string, self.hed_schema, span=(placeholder.span[0], placeholder.span[1] + shift),
+                         def_dict=self.def_dict)
+        copies = {id(placeholder): new_tag}
+        new_string = copy_hed_tree(template.hed_string, copies)
+        new_tag._parent = copies[id(placeholder._parent)]
+        source = template.hed_string._hed_string
+        for node in copies.values():
+            if node._hed_string is not source:
+                continue
+            node._hed_string = hed_string
+            if isinstance(node, HedTag):
+                node.span = _shift_span(node.span, position, shift)
+            else:
+                node._startpos, node._endpos = _shift_span((node._startpos, node._endpos), position, shift)
+        return new_string
+
+    def _get_column_function(self, column, dataframe, column_name):
+        """ Return a function of the text and row number returning the HedString for a cell of a column. """
+        if column is None or column.column_type != ColumnType.Value:
+            return lambda text, row_number: self.get_string(text)
+        value_string = column.hed_dict
+        if not isinstance(value_string, str) or "{" in value_string:
+            # Column references were already plugged in, so the text can't be rebuilt from the value.
+            return lambda text, row_number: self._parse(text)
+        values = dataframe[column_name].tolist()
+        return lambda text, row_number: self.get_value_string(value_string, str(values[row_number]))
+
+    def _get_value_template(self, value_string):
+        template = self._value_templates.get(value_string)
+        if template is None:
+            template = _ValueTemplate(value_string, self._parse(value_string))
+            self._value_templates[value_string] = template
+        return template
+
+    def _parse(self, hed_string):
+        """ Return the parse of a HED string, or None if it has mismatched parentheses. """
+        new_string = get_hed_string(hed_string, self.hed_schema, self.def_dict)
+        if not new_string.children and ("(" in hed_string or ")" in hed_string):
+            return None
+        return new_string
+
+
+class _ValueTemplate:
+    """ The parse of a value column HED string and the tag holding its #. """
+
+    def __init__(self, value_string, hed_string):
+        """ Find the # in a parsed value column string.
+
+        Parameters:
+            value_string (str): The HED string of the value column.
+            hed_string (HedString or None): Its parse, or None if it could not be parsed.
+
+        Notes:
+            - The placeholder is None unless there is exactly one #, so the string must be parsed with each value.
+
+        """
+        self.hed_string = hed_string
+        self.position = value_string.find("#")
+        self.placeholder = None
+        if hed_string is None or value_string.count("#") != 1:
+            return
+        for tag in hed_string.get_all_tags():
+            if tag.span[0] <= self.position < tag.span[1]:
+                self.placeholder = tag
+                break
+
+
+def _move_to_row(hed_string, row_text, offset):
+    """ Point the tags and groups of a column's HedString at the row text, moving their spans by offset.
+
+    Parameters:
+        hed_string (HedString): The parse of the column text, which starts at offset in the row text.
+        row_text (str): The text of the whole row.
+        offset (int): The position of the column text in the row text.
+
+    Notes:
+        - Only the tags and groups written in the column text are moved.  The group made for a Def tag takes
+          the span of the tag, but the definition contents in it keep their own spans, even when the Definition
+          is in the same column text.
+
+    """
+    source = hed_string._hed_string
+    visited = set()
+    nodes = [hed_string]
+    while nodes:
+        node = nodes.pop()
+        if id(node) in visited or node._hed_string is not source:
+            continue
+        visited.add(id(node))
+        node._hed_string = row_text
+        if isinstance(node, HedTag):
+            node.span = (node.span[0] + offset, node.span[1] + offset)
+            expandable = node._expandable
+            if expandable is not None and not node._expanded and expandable._hed_string is source:
+                expandable._hed_string = row_text
+                expandable._startpos += offset
+                expandable._endpos += offset
+        else:
+            node._startpos += offset
+            node._endpos += offset
+            nodes.extend(node.children)
+
+
+def _shift_span(span, position, shift):
+    """ Return a span moved to account for the text at position growing by shift characters. """
+    start, end = span
+    if start > position:
+        return start + shift, end + shift
+    if end > position:
+        return start, end + shift
+    return span
@@ -3,7 +3,7 @@ import pandas as pd
 
 from hed.models.sidecar import Sidecar
 from hed.models.tabular_input import TabularInput
-from hed.models.hed_string import HedString
+from hed.models.hed_string_cache import get_hed_string
 from hed.models.definition_dict import DefinitionDict
 
 
@@ -42,16 +42,20 @@ def get_assembled(tabular_file, sidecar, hed_schema, extra_def_dicts=None, join_
         def_dict = sidecar.get_def_dict(hed_schema=hed_schema, extra_def_dicts=extra_def_dicts)
 
     if join_columns:
+        if sidecar:
+            hed_strings = sidecar.compile(hed_schema, extra_def_dicts).get_hed_strings(tabular_file)
+        else:
+            hed_strings = [get_hed_string(x, hed_schema, def_dict) for x in tabular_file.series_a]
         if expand_defs:
-            return [HedString(x, hed_schema, def_dict).expand_defs() for x in tabular_file.series_a], def_dict
+            return [hed_string.expand_defs() for hed_string in hed_strings], def_dict
         elif shrink_defs:
-            return [HedString(x, hed_schema, def_dict).shrink_defs() for x in tabular_file.series_a], def_dict
+            return [hed_string.shrink_defs() for hed_string in hed_strings], def_dict
         else:
-            return [HedString(x, hed_schema, def_dict) for x in tabular_file.series_a], def_dict
+            return hed_strings, def_dict
     else:
-        return [[HedString(x, hed_schema, def_dict).expand_defs() if expand_defs
-                 else HedString(x, hed_schema, def_dict).shrink_defs() if shrink_defs
-                 else HedString(x, hed_schema, def_dict)
+        return [[get_hed_string(x, hed_schema, def_dict).expand_defs() if expand_defs
+                 else get_hed_string(x, hed_schema, def_dict).shrink_defs() if shrink_defs
+                 else get_hed_string(x, hed_schema, def_dict)
                  for x in text_file_row] for text_file_row in tabular_file.dataframe_a.itertuples(index=False)], \
                def_dict
 
@@ -121,15 +125,15 @@ def expand_defs(df, hed_schema, def_dict, columns=None):
 
 
 def _convert_to_form(hed_string, hed_schema, tag_form):
-    return str(HedString(hed_string, hed_schema).get_as_form(tag_form))
+    return str(get_hed_string(hed_string, hed_schema).get_as_form(tag_form))
 
 
 def _shrink_defs(hed_string, hed_schema):
-    return str(HedString(hed_string, hed_schema).shrink_defs())
+    return str(get_hed_string(hed_string, hed_schema).shrink_defs())
 
 
 def _expand_defs(hed_string, hed_schema, def_dict):
-    return str(HedString(hed_string, hed_schema, def_dict).expand_defs())
+    return str(get_hed_string(hed_string, hed_schema, def_dict).expand_defs())
 
 
 def process_def_expands(hed_strings, hed_schema, known_defs=None, ambiguous_defs=None):
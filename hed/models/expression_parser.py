@@ -1,4 +1,10 @@
 import re
+from collections import OrderedDict
+
+# Maximum number of distinct queries whose parsed expression trees are kept.
+MAX_QUERY_CACHE = 1024
+
+_query_cache = OrderedDict()
 
 
 class SearchResult:
@@ -132,6 +138,13 @@ class Expression:
             output_str += str(self.right)
         return output_str
 
+    def has_match(self, hed_group):
+        """ Return True if this expression finds anything in the group.
+
+            Equivalent to bool(self.handle_expr(hed_group)), but subclasses may stop as soon as the answer is known.
+        """
+        return bool(self.handle_expr(hed_group))
+
     def handle_expr(self, hed_group, exact=False):
         if self._match_mode == 2:
             groups_found = hed_group.find_wildcard_tags([self.token.text], recursive=True, include_groups=2)
@@ -162,6 +175,20 @@ class Expression:
 
 
 class ExpressionAnd(Expression):
+    def has_match(self, hed_group):
+        groups1 = self.left.handle_expr(hed_group)
+        if not groups1:
+            return False
+        groups2 = self.right.handle_expr(hed_group)
+
+        # The first pair merge_groups would keep is enough.
+        for group in groups1:
+            for other_group in groups2:
+                if group.group is other_group.group and \
+                        not any(tag is tag2 and tag is not None for tag in group.tags for tag2 in other_group.tags):
+                    return True
+        return False
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         if not groups1:
@@ -233,6 +260,10 @@ class ExpressionWildcardNew(Expression):
 
 
 class ExpressionOr(Expression):
+    def has_match(self, hed_group):
+        # Unlike handle_expr, we only need to know if either side matches.
+        return self.left.has_match(hed_group) or self.right.has_match(hed_group)
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         # Don't early out as we need to gather all groups in case tags appear more than once etc
@@ -351,10 +382,13 @@ class QueryParser:
 
         Parameters:
             expression_string(str): The query string
+
+        Notes:
+            - Parsed expression trees are cached by query text, so creating a parser for a repeated query is cheap.
         """
         self.tokens = []
         self.at_token = -1
-        self.tree = self._parse(expression_string.lower())
+        self.tree = self._get_tree(expression_string)
         self._org_string = expression_string
 
     def __str__(self):
@@ -454,6 +488,24 @@ class QueryParser:
 
         return expr
 
+    def _get_tree(self, expression_string):
+        """ Return the expression tree for a query, parsing it only if it isn't cached.
+
+            The trees are shared between parsers, and are never modified after parsing.
+        """
+        normalized_string = " ".join(expression_string.lower().split())
+        tree = _query_cache.get(normalized_string)
+        if tree is not None:
+            _query_cache.move_to_end(normalized_string)
+            return tree
+
+        tree = self._parse(normalized_string)
+        if tree is not None:
+            _query_cache[normalized_string] = tree
+            while len(_query_cache) > MAX_QUERY_CACHE:
+                _query_cache.popitem(last=False)
+        return tree
+
     def _parse(self, expression_string):
         self.tokens = self._tokenize(expression_string)
 
@@ -465,13 +517,7 @@ class QueryParser:
         return expr
 
     def _tokenize(self, expression_string):
-        grouping_re = r"\[\[|\[|\]\]|\]|}|{|:"
-        paren_re = r"\)|\(|~"
-        word_re = r"\?+|\band\b|\bor\b|,|[\"_\-a-zA-Z0-9/.^#\*@]+"
-        re_string = fr"({grouping_re}|{paren_re}|{word_re})"
-        token_re = re.compile(re_string)
-
-        tokens = token_re.findall(expression_string)
+        tokens = _token_re.findall(expression_string)
         tokens = [Token(token) for token in tokens]
 
         return tokens
@@ -481,3 +527,25 @@ class QueryParser:
 
         result = current_node.handle_expr(hed_string_obj)
         return result
+
+    def matches(self, hed_string_obj):
+        """ Return True if this query finds anything in the hed string.
+
+        Parameters:
+            hed_string_obj (HedString): The hed string to search.
+
+        Returns:
+            bool: Equivalent to bool(self.search(hed_string_obj)), but stops as soon as the answer is known.
+        """
+        return self.tree.has_match(hed_string_obj)
+
+
+def clear_query_cache():
+    """ Remove all parsed queries from the cache. """
+    _query_cache.clear()
+
+
+_grouping_re = r"\[\[|\[|\]\]|\]|}|{|:"
+_paren_re = r"\)|\(|~"
+_word_re = r"\?+|\band\b|\bor\b|,|[\"_\-a-zA-Z0-9/.^#\*@]+"
+_token_re = re.compile(fr"({_grouping_re}|{_paren_re}|{_word_re})")
@@ -1,4 +1,4 @@
-from hed.models.hed_tag import HedTag
+from hed.models.hed_tag import HedTag, shallow_copy_node
 import copy
 from typing import Iterable, Union
 
@@ -6,6 +6,8 @@ from typing import Iterable, Union
 class HedGroup:
     """ A single parenthesized hed string. """
 
+    __slots__ = ("_startpos", "_endpos", "_hed_string", "_parent", "_flat_cache", "children", "_original_children")
+
     def __init__(self, hed_string="", startpos=None, endpos=None, contents=None):
         """ Return an empty HedGroup object.
 
@@ -20,6 +22,7 @@ class HedGroup:
         self._endpos = endpos
         self._hed_string = hed_string
         self._parent = None
+        self._flat_cache = None  # The (tags, groups) of this group in depth-first order, until the tree changes.
 
         if contents:
             self.children = contents
@@ -37,6 +40,7 @@ class HedGroup:
         """
         tag_or_group._parent = self
         self.children.append(tag_or_group)
+        self._invalidate()
 
     def check_if_in_original(self, tag_or_group):
         """ Check if the tag or group in original string.
@@ -47,15 +51,13 @@ class HedGroup:
         Returns:
             bool:  True if in this group.
         """
-        node_list = [self]
         final_list = []
-
-        # Using an iterator is worse performance wise here.
+        node_list = [self]
         while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = current_group_or_tag._original_children + node_list
+            current_group_or_tag = node_list.pop()
             final_list.append(current_group_or_tag)
+            if isinstance(current_group_or_tag, HedGroup):
+                node_list.extend(reversed(current_group_or_tag._original_children))
 
         return self._check_in_group(tag_or_group, final_list)
 
@@ -96,6 +98,7 @@ class HedGroup:
             if item_to_replace is child:
                 self.children[i] = new_contents
                 new_contents._parent = self
+                self._invalidate()
                 return
 
         raise KeyError(f"The tag {item_to_replace} not found in the group.")
@@ -120,6 +123,7 @@ class HedGroup:
                 group._original_children = group.children.copy()
 
             group.children.remove(item)
+            group._invalidate()
             if not group.children and group is not self:
                 empty_groups.append(group)
 
@@ -133,6 +137,21 @@ class HedGroup:
     def __copy__(self):
         raise ValueError("Cannot make shallow copies of HedGroups")
 
+    def __deepcopy__(self, memo):
+        # check if the object has already been copied
+        if id(self) in memo:
+            return memo[id(self)]
+
+        new_group = shallow_copy_node(self)
+        memo[id(self)] = new_group
+
+        # The cached tag and group lists are rebuilt when needed rather than copied.
+        new_group._parent = copy.deepcopy(self._parent, memo)
+        new_group.children = copy.deepcopy(self.children, memo)
+        new_group._original_children = copy.deepcopy(self._original_children, memo)
+        new_group._flat_cache = None
+        return new_group
+
     def copy(self):
         """ Return a deep copy of this group.
 
@@ -183,6 +202,7 @@ class HedGroup:
         output_list = tag_list + group_list
         if update_self:
             self.children = [x[0] for x in output_list]
+            self._invalidate()
         return [x[1] for x in output_list]
 
     @property
@@ -197,17 +217,7 @@ class HedGroup:
             list:  A list of all the tags in this group including descendants.
 
         """
-        node_list = [self]
-        final_list = []
-
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = list(current_group_or_tag.children) + node_list
-            else:
-                final_list.append(current_group_or_tag)
-        return final_list
+        return list(self._get_flat_lists()[0])
 
     def get_all_groups(self, also_return_depth=False):
         """ Return HedGroups, including descendants and self.
@@ -219,21 +229,45 @@ class HedGroup:
             list: The list of all HedGroups in this group, including descendants and self.
 
         """
-        node_list = [self]
-        final_list = []
+        final_list = list(self._get_flat_lists()[1])
+        if also_return_depth:
+            top_groups = {id(group) for group in self.groups()}
+            final_list = [(group, id(group) in top_groups) for group in final_list]
+        return final_list
 
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = list(current_group_or_tag.children) + node_list
-                final_list.append(current_group_or_tag)
+    def _get_flat_lists(self):
+        """ Return the tags and the groups (including self) in this group in depth-first order.
 
-        if also_return_depth:
-            top_groups = self.groups()
+        Returns:
+            tuple: The list of HedTags and the list of HedGroups.  These are cached and must not be modified.
 
-            final_list = [(group, self._check_in_group(group, top_groups)) for group in final_list]
-        return final_list
+        Notes:
+            - The lists are kept until append, replace, remove or sort changes this group or a group in it.
+
+        """
+        if self._flat_cache is None:
+            tags = []
+            groups = []
+            node_list = [self]
+            while node_list:
+                current_group_or_tag = node_list.pop()
+                if isinstance(current_group_or_tag, HedGroup):
+                    groups.append(current_group_or_tag)
+                    node_list.extend(reversed(current_group_or_tag.children))
+                else:
+                    tags.append(current_group_or_tag)
+            self._flat_cache = (tags, groups)
+        return self._flat_cache
+
+    def _invalidate(self):
+        """ Clear the cached tag and group lists of this group and of the groups containing it. """
+        group = self
+        visited = set()
+        # A malformed tree can have a cycle in its parents, so stop at the first group seen twice.
+        while group is not None and id(group) not in visited:
+            visited.add(id(group))
+            group._flat_cache = None
+            group = group._parent
 
     @staticmethod
     def _check_in_group(group, group_list):
@@ -2,8 +2,9 @@
 This module is used to split tags in a HED string.
 """
 import copy
+import re
 from hed.models.hed_group import HedGroup
-from hed.models.hed_tag import HedTag
+from hed.models.hed_tag import HedTag, shallow_copy_node
 from hed.models.model_constants import DefTagNames
 
 
@@ -13,6 +14,15 @@ class HedString(HedGroup):
     OPENING_GROUP_CHARACTER = '('
     CLOSING_GROUP_CHARACTER = ')'
 
+    __slots__ = ("_schema", "_from_strings", "_def_dict")
+
+    # A tag is a run of characters other than delimiters that starts and ends with a non-space.
+    # Each token is a tag, a delimiter with the spaces around it, the spaces at the start of the string,
+    # or the spaces after the last tag.
+    _TOKEN_PATTERN = re.compile(r"[^,() ][^,()]*(?<! )|^ +| *[,()] *| +")
+    # Only the tags and the parentheses are needed to build the parse tree.
+    _TAG_OR_PAREN_PATTERN = re.compile(r"[^,() ][^,()]*(?<! )|[()]")
+
     def __init__(self, hed_string, hed_schema, def_dict=None, _contents=None):
         """ Constructor for the HedString class.
 
@@ -88,8 +98,7 @@ class HedString(HedGroup):
             return memo[id(self)]
 
         # create a new instance of HedString class, and direct copy all parameters
-        new_string = self.__class__.__new__(self.__class__)
-        new_string.__dict__.update(self.__dict__)
+        new_string = shallow_copy_node(self)
 
         # add the new object to the memo dictionary
         memo[id(self)] = new_string
@@ -98,6 +107,7 @@ class HedString(HedGroup):
         new_string._original_children = copy.deepcopy(self._original_children, memo)
         new_string._from_strings = copy.deepcopy(self._from_strings, memo)
         new_string.children = copy.deepcopy(self.children, memo)
+        new_string._flat_cache = None
 
         return new_string
 
@@ -190,37 +200,23 @@ class HedString(HedGroup):
         """
         current_tag_group = [[]]
 
-        input_tags = HedString.split_hed_string(hed_string)
-        for is_hed_tag, (startpos, endpos) in input_tags:
-            if is_hed_tag:
+        for match in HedString._TAG_OR_PAREN_PATTERN.finditer(hed_string):
+            startpos, endpos = match.span()
+            first_char = hed_string[startpos]
+            if first_char == HedString.OPENING_GROUP_CHARACTER:
+                current_tag_group.append(HedGroup(hed_string, startpos))
+            elif first_char == HedString.CLOSING_GROUP_CHARACTER:
+                # Terminate existing group, and save it off.
+                if len(current_tag_group) > 1:
+                    new_group = current_tag_group.pop()
+                    new_group._endpos = endpos
+
+                    current_tag_group[-1].append(new_group)
+                else:
+                    raise ValueError(f"Closing parentheses in hed string {hed_string}")
+            else:
                 new_tag = HedTag(hed_string, hed_schema, (startpos, endpos), def_dict)
                 current_tag_group[-1].append(new_tag)
-            else:
-                string_portion = hed_string[startpos:endpos]
-                delimiter_index = 0
-                for i, char in enumerate(string_portion):
-                    if not char.isspace():
-                        delimiter_index = i
-                        break
-
-                delimiter_char = string_portion[delimiter_index]
-
-                if delimiter_char is HedString.OPENING_GROUP_CHARACTER:
-                    current_tag_group.append(HedGroup(hed_string, startpos + delimiter_index))
-
-                if delimiter_char is HedString.CLOSING_GROUP_CHARACTER:
-                    # if prev_delimiter == ",":
-                    #     raise ValueError(f"Closing parentheses in hed string {hed_string}")
-                    # Terminate existing group, and save it off.
-                    paren_end = startpos + delimiter_index + 1
-
-                    if len(current_tag_group) > 1:
-                        new_group = current_tag_group.pop()
-                        new_group._endpos = paren_end
-
-                        current_tag_group[-1].append(new_group)
-                    else:
-                        raise ValueError(f"Closing parentheses in hed string {hed_string}")
 
         # Comma delimiter issues are ignored and assumed already validated currently.
         if len(current_tag_group) != 1:
@@ -283,6 +279,24 @@ class HedString(HedGroup):
                 - end_pos (int):     Index of end of string in hed_string
 
             - This function does not validate tags or delimiters in any form.
+            - The string is split by a regular expression rather than a loop over its characters.
+
+        """
+        return [(hed_string[match.start()] not in " ,()", match.span())
+                for match in HedString._TOKEN_PATTERN.finditer(hed_string)]
+
+    @staticmethod
+    def _split_hed_string_by_character(hed_string):
+        """ Split a HED string into delimiters and tags one character at a time.
+
+        Parameters:
+            hed_string (str): The HED string to split.
+
+        Returns:
+            list:  A list of tuples where each tuple is (is_hed_tag, (start_pos, end_pos)).
+
+        Notes:
+            - This is the original implementation of split_hed_string, kept as a reference for testing.
 
         """
         tag_delimiters = ",()"
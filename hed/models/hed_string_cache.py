@@ -0,0 +1,167 @@
+""" A bounded cache of parsed HedString objects keyed by the string, schema and definitions used to parse them. """
+from collections import OrderedDict, namedtuple
+
+from hed.models.hed_string import HedString
+from hed.models.hed_tag import HedTag, shallow_copy_node
+
+DEFAULT_MAX_SIZE = 4096
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class HedStringCache:
+    """ Least recently used cache of parsed HED strings.
+
+    Notes:
+        - Entries are keyed by the string text and the identity of the schema and def dict.
+        - Each lookup returns an independent copy of the cached parse tree, so callers can freely modify the result.
+        - The cache holds references to the schema and def dict of each entry, so identities are not reused while
+          an entry is cached.  Mutating a cached schema or def dict requires a call to clear.
+
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """ Constructor for the HedStringCache class.
+
+        Parameters:
+            max_size (int): Maximum number of parsed strings to keep.  If 0, caching is disabled.
+        """
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        """ The maximum number of parsed strings this cache keeps. """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        self._max_size = max_size
+        self._trim()
+
+    def get(self, hed_string, hed_schema, def_dict=None):
+        """ Return a HedString parsed from the given text, using a cached parse if available.
+
+        Parameters:
+            hed_string (str): A HED string consisting of tags and tag groups.
+            hed_schema (HedSchema or HedSchemaGroup): The schema to use to identify tags.
+            def_dict (DefinitionDict or None): The def dict to use to identify def/def expand tags.
+
+        Returns:
+            HedString: A newly created HedString equivalent to HedString(hed_string, hed_schema, def_dict).
+        """
+        if not self._max_size:
+            self._misses += 1
+            return HedString(hed_string, hed_schema, def_dict)
+
+        key = (hed_string, id(hed_schema), id(def_dict))
+        cached_string = self._cache.get(key)
+        if cached_string is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return copy_hed_tree(cached_string)
+
+        self._misses += 1
+        new_string = HedString(hed_string, hed_schema, def_dict)
+        self._cache[key] = new_string
+        self._trim()
+        return copy_hed_tree(new_string)
+
+    def clear(self):
+        """ Remove all cached strings and reset the statistics. """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self):
+        """ Return the statistics for this cache.
+
+        Returns:
+            CacheInfo: A named tuple of (hits, misses, maxsize, currsize).
+        """
+        return CacheInfo(self._hits, self._misses, self._max_size, len(self._cache))
+
+    def __len__(self):
+        return len(self._cache)
+
+    def _trim(self):
+        while len(self._cache) > max(self._max_size, 0):
+            self._cache.popitem(last=False)
+
+
+def copy_hed_tree(hed_group, memo=None):
+    """ Return an independent copy of a parsed HedString or HedGroup.
+
+    Parameters:
+        hed_group (HedGroup): The string or group to copy.
+        memo (dict or None): The ids of nodes already copied mapped to their copies.  Filled in with every new copy.
+
+    Returns:
+        HedGroup: The copy.  Schema entries, the schema and the source text are shared rather than copied.
+
+    Notes:
+        - This is equivalent to copy.deepcopy on a HedString, but avoids the overhead of the generic copy machinery.
+    """
+    if memo is None:
+        memo = {}
+    return _copy_node(hed_group, memo)
+
+
+def _copy_node(node, memo):
+    """ Copy a single HedTag or HedGroup, recursively copying the nodes it refers to. """
+    found = memo.get(id(node))
+    if found is not None:
+        return found
+
+    new_node = shallow_copy_node(node)
+    memo[id(node)] = new_node
+
+    if node._parent is not None:
+        new_node._parent = _copy_node(node._parent, memo)
+    if isinstance(node, HedTag):
+        if node._expandable is not None:
+            new_node._expandable = _copy_node(node._expandable, memo)
+        return new_node
+
+    new_node.children = [_copy_node(child, memo) for child in node.children]
+    new_node._flat_cache = None
+    if node._original_children is node.children:
+        new_node._original_children = new_node.children
+    else:
+        new_node._original_children = [_copy_node(child, memo) for child in node._original_children]
+    if isinstance(node, HedString) and node._from_strings:
+        new_node._from_strings = [_copy_node(child, memo) for child in node._from_strings]
+    return new_node
+
+
+default_cache = HedStringCache()
+
+
+def get_hed_string(hed_string, hed_schema, def_dict=None):
+    """ Return a HedString using the default cache.
+
+    Parameters:
+        hed_string (str): A HED string consisting of tags and tag groups.
+        hed_schema (HedSchema or HedSchemaGroup): The schema to use to identify tags.
+        def_dict (DefinitionDict or None): The def dict to use to identify def/def expand tags.
+
+    Returns:
+        HedString: A newly created HedString equivalent to HedString(hed_string, hed_schema, def_dict).
+    """
+    return default_cache.get(hed_string, hed_schema, def_dict)
+
+
+def clear_cache():
+    """ Remove all strings from the default cache and reset its statistics. """
+    default_cache.clear()
+
+
+def cache_info():
+    """ Return the statistics of the default cache.
+
+    Returns:
+        CacheInfo: A named tuple of (hits, misses, maxsize, currsize).
+    """
+    return default_cache.cache_info()
@@ -1,5 +1,7 @@
 from hed.schema.hed_schema_constants import HedKey
+from hed.schema.hed_schema_entry import HedTagEntry
 import copy
+from functools import lru_cache
 
 
 class HedTag:
@@ -8,9 +10,13 @@ class HedTag:
     Notes:
         - HedTag is a smart class in that it keeps track of its original value and positioning
           as well as pointers to the relevant HED schema information, if relevant.
+        - Tags use __slots__ rather than an instance dictionary, since a parsed file can hold millions of them.
 
     """
 
+    __slots__ = ("_hed_string", "span", "_tag", "_namespace", "_schema", "_schema_entry", "_extension_value",
+                 "_parent", "_expandable", "_expanded", "tag_terms")
+
     def __init__(self, hed_string, hed_schema, span=None, def_dict=None):
         """ Creates a HedTag.
 
@@ -559,6 +565,16 @@ class HedTag:
         if not units:
             return None, None, None
 
+        if self._schema_entry and tag_unit_classes is self._schema_entry.unit_classes:
+            # The tag's own unit classes, so use the lookup table of its schema entry.
+            (unit_index, unit_entry), _ = self._schema_entry.get_unit_matches(units)
+            _, (prefix_index, prefix_entry) = self._schema_entry.get_unit_matches(value)
+            if unit_entry and (not prefix_entry or unit_index <= prefix_index):
+                return value, units, unit_entry
+            if prefix_entry:
+                return units, value, prefix_entry
+            return None, None, None
+
         for unit_class_entry in tag_unit_classes.values():
             all_valid_unit_permutations = unit_class_entry.derivative_units
 
@@ -575,17 +591,7 @@ class HedTag:
 
     @staticmethod
     def _find_modifier_unit_entry(units, all_valid_unit_permutations):
-        possible_match = all_valid_unit_permutations.get(units)
-        # If we have a match that's a unit symbol, we're done, return it.
-        if possible_match and possible_match.has_attribute(HedKey.UnitSymbol):
-            return possible_match
-
-        possible_match = all_valid_unit_permutations.get(units.lower())
-        # Unit symbols must match including case, a match of a unit symbol now is something like M becoming m.
-        if possible_match and possible_match.has_attribute(HedKey.UnitSymbol):
-            possible_match = None
-
-        return possible_match
+        return HedTagEntry.find_unit_entry(units, all_valid_unit_permutations)
 
     def is_placeholder(self):
         if "#" in self.org_tag or "#" in self._extension_value:
@@ -635,8 +641,7 @@ class HedTag:
             return memo[id(self)]
 
         # create a new instance of HedTag class
-        new_tag = self.__class__.__new__(self.__class__)
-        new_tag.__dict__.update(self.__dict__)
+        new_tag = shallow_copy_node(self)
 
         # add the new object to the memo dictionary
         memo[id(self)] = new_tag
@@ -647,3 +652,32 @@ class HedTag:
         new_tag._expanded = copy.deepcopy(self._expanded, memo)
 
         return new_tag
+
+
+@lru_cache(maxsize=None)
+def _get_slot_names(cls):
+    """ Return the names of the slots of a class and its base classes. """
+    return tuple(name for base in cls.__mro__ for name in base.__dict__.get("__slots__", ()))
+
+
+def shallow_copy_node(node):
+    """ Return a new HedTag, HedGroup or HedString with the same attribute values as node.
+
+    Parameters:
+        node (HedTag or HedGroup): The node to copy.
+
+    Returns:
+        HedTag or HedGroup: A new instance of the same class sharing all of the attribute values of node.
+
+    Notes:
+        - This replaces updating the instance dictionary, as these classes use __slots__.
+        - Used by the deep copies, which then replace the attributes that must not be shared.
+
+    """
+    new_node = node.__class__.__new__(node.__class__)
+    for name in _get_slot_names(node.__class__):
+        try:
+            setattr(new_node, name, getattr(node, name))
+        except AttributeError:
+            pass
+    return new_node
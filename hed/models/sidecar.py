@@ -8,6 +8,7 @@ from hed.errors.exceptions import HedFileError, HedExceptions
 from hed.models.hed_string import HedString
 from hed.models.column_metadata import ColumnType
 from hed.models.definition_dict import DefinitionDict
+from hed.models.compiled_sidecar import CompiledSidecar
 
 
 class Sidecar:
@@ -26,6 +27,7 @@ class Sidecar:
         self.loaded_dict = self.load_sidecar_files(files)
         self._def_dict = None
         self._extract_definition_issues = []
+        self._compiled = {}
 
     def __iter__(self):
         """ An iterator to go over the individual column metadata.
@@ -93,6 +95,27 @@ class Sidecar:
             def_dicts += extra_def_dicts
         return DefinitionDict(def_dicts)
 
+    def compile(self, hed_schema, extra_def_dicts=None):
+        """ Returns the HED strings of this sidecar parsed for reuse by every data file using it.
+
+        Parameters:
+            hed_schema(HedSchema): used to identify tags
+            extra_def_dicts (list, DefinitionDict, or None): Extra dicts to add to the definitions of this sidecar.
+
+        Returns:
+            CompiledSidecar: The parsed strings.  The same object is returned for the same schema and extra dicts.
+        """
+        if extra_def_dicts and not isinstance(extra_def_dicts, list):
+            extra_def_dicts = [extra_def_dicts]
+        key = (id(hed_schema),) + tuple(id(def_dict) for def_dict in extra_def_dicts or [])
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            # Keep the extra dicts with the result, so their ids aren't reused while it is remembered.
+            compiled = (CompiledSidecar(self, hed_schema, self.get_def_dict(hed_schema, extra_def_dicts)),
+                        extra_def_dicts)
+            self._compiled[key] = compiled
+        return compiled[0]
+
     def save_as_json(self, save_filename):
         """ Save column metadata to a JSON file.
 
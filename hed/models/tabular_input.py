@@ -43,6 +43,41 @@ class TabularInput(BaseInput):
             raise ValueError("You are attempting to open a bids_old style file with no column headers provided.\n"
                              "This is probably not intended.")
 
+    @classmethod
+    def iter_chunks(cls, file, sidecar=None, name=None, chunk_size=10000):
+        """ Read a tsv file in pieces, so memory use is bounded by the chunk size rather than the file size.
+
+        Parameters:
+            file (str or FileLike): A tsv file to open.
+            sidecar (str or Sidecar or FileLike): A Sidecar or source file/filename.  Shared by all the chunks.
+            name (str): The name to display for this file for error purposes.
+            chunk_size (int): The number of rows to read at a time.
+
+        Yields:
+            TabularInput: The next chunk of rows.  Its row_offset is the number of data rows before it in the file.
+
+        :raises HedFileError:
+            - file is blank
+            - An invalid extension was provided
+            - The file had an invalid format and could not be read
+            - The file has no rows
+
+        Notes:
+            - Consecutive rows sharing an onset are always in the same chunk, so if the onsets are sorted
+              series_filtered is the same as for the whole file.  With unsorted onsets, rows are only combined with
+              the rows of the same onset in their own chunk.
+            - Use SpreadsheetValidator.iter_validate to validate the chunks with onsets tracked across them.
+        """
+        if sidecar and not isinstance(sidecar, Sidecar):
+            sidecar = Sidecar(sidecar)
+        if name is None and isinstance(file, str):
+            name = file
+
+        for row_offset, chunk in cls._read_chunks(file, True, chunk_size):
+            chunk_input = cls(chunk, sidecar=sidecar, name=name)
+            chunk_input._row_offset = row_offset
+            yield chunk_input
+
     def reset_column_mapper(self, sidecar=None):
         """ Change the sidecars and settings.
 
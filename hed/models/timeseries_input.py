@@ -23,3 +23,30 @@ class TimeseriesInput(BaseInput):
 
         super().__init__(file, file_type=".tsv", worksheet_name=None, has_column_names=False, mapper=None,
                          name=name)
+
+    @classmethod
+    def iter_chunks(cls, file, sidecar=None, name=None, chunk_size=10000):
+        """ Read a time series file in pieces, so memory use is bounded by the chunk size rather than the file size.
+
+        Parameters:
+            file (str or file like): A tsv file to open.
+            sidecar (str or Sidecar): A json sidecar to pull metadata from.
+            name (str): The name to display for this file for error purposes.
+            chunk_size (int): The number of rows to read at a time.
+
+        Yields:
+            TimeseriesInput: The next chunk of rows.  Its row_offset is the number of rows before it in the file.
+
+        :raises HedFileError:
+            - file is blank
+            - An invalid extension was provided
+            - The file had an invalid format and could not be read
+            - The file has no rows
+        """
+        if name is None and isinstance(file, str):
+            name = file
+
+        for row_offset, chunk in cls._read_chunks(file, False, chunk_size):
+            chunk_input = cls(chunk, sidecar=sidecar, name=name)
+            chunk_input._row_offset = row_offset
+            yield chunk_input
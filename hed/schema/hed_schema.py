@@ -11,6 +11,9 @@ from hed.errors.error_types import ValidationErrors
 from hed.schema.hed_schema_base import HedSchemaBase
 from hed.errors.exceptions import HedFileError, HedExceptions
 
+# Maximum number of distinct tag strings remembered by each schema's tag lookup cache.
+MAX_TAG_LOOKUP_CACHE = 50000
+
 
 class HedSchema(HedSchemaBase):
     """ A HED schema suitable for processing. """
@@ -32,6 +35,9 @@ class HedSchema(HedSchemaBase):
 
         self._sections = self._create_empty_sections()
 
+        # Resolved tag lookups {tag text: (entry, remainder, error)} - see _find_tag_entry.
+        self._tag_lookup_cache = {}
+
     # ===============================================
     # Basic schema properties
     # ===============================================
@@ -278,6 +284,12 @@ class HedSchema(HedSchemaBase):
                                self.filename)
 
         self._namespace = schema_namespace
+        self._tag_lookup_cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tag_lookup_cache"] = {}
+        return state
 
     def __eq__(self, other):
         """ Return True if these schema match exactly.
@@ -433,9 +445,36 @@ class HedSchema(HedSchemaBase):
 
         Notes:
             Works left to right (which is mostly relevant for errors).
+            The result for each distinct tag text is cached, so repeated tags are only identified once.
 
         """
         clean_tag = str(tag)
+        lookup = self._tag_lookup_cache.get(clean_tag)
+        if lookup is None:
+            lookup = self._identify_tag(clean_tag, schema_namespace)
+            if len(self._tag_lookup_cache) >= MAX_TAG_LOOKUP_CACHE:
+                self._tag_lookup_cache.clear()
+            self._tag_lookup_cache[clean_tag] = lookup
+
+        found_entry, remainder, error = lookup
+        if error:
+            error_type, error_kwargs = error
+            return None, None, ErrorHandler.format_error(error_type, tag, **error_kwargs)
+        return found_entry, remainder, []
+
+    def _identify_tag(self, clean_tag, schema_namespace):
+        """ Find the schema entry for the text of a tag.
+
+        Parameters:
+            clean_tag (str):  The text of the tag, including the namespace.
+            schema_namespace (str):  The schema namespace of the tag, if any.
+
+        Returns:
+            HedTagEntry or None: The located tag entry for this tag.
+            str or None: The remainder of the tag that isn't part of the base tag.
+            tuple or None: The (error_type, kwargs) needed to format the error for this tag, if any.
+
+        """
         namespace = schema_namespace
         clean_tag = clean_tag[len(namespace):]
         working_tag = clean_tag.lower()
@@ -449,15 +488,14 @@ class HedSchema(HedSchemaBase):
             else:
                 remainder = ""
 
-            return found_entry, remainder, []
+            return found_entry, remainder, None
 
         prefix_tag_adj = len(namespace)
 
         try:
-            found_entry, current_slash_index = self._find_tag_subfunction(tag, working_tag, prefix_tag_adj)
+            found_entry, current_slash_index = self._find_tag_subfunction(working_tag, prefix_tag_adj)
         except self._TagIdentifyError as e:
-            issue = e.issue
-            return None, None, issue
+            return None, None, e.issue
 
         remainder = None
         if current_slash_index != -1:
@@ -465,9 +503,9 @@ class HedSchema(HedSchemaBase):
         if remainder and found_entry.takes_value_child_entry:
             found_entry = found_entry.takes_value_child_entry
 
-        return found_entry, remainder, []
+        return found_entry, remainder, None
 
-    def _find_tag_subfunction(self, tag, working_tag, prefix_tag_adj):
+    def _find_tag_subfunction(self, working_tag, prefix_tag_adj):
         """Finds the base tag and remainder from the left, raising exception on issues"""
         current_slash_index = -1
         current_entry = None
@@ -482,15 +520,13 @@ class HedSchema(HedSchemaBase):
             if not parent_entry:
                 # We haven't found any tag at all yet
                 if current_entry is None:
-                    error = ErrorHandler.format_error(ValidationErrors.NO_VALID_TAG_FOUND,
-                                                      tag,
-                                                      index_in_tag=prefix_tag_adj,
-                                                      index_in_tag_end=prefix_tag_adj + next_index)
+                    error = (ValidationErrors.NO_VALID_TAG_FOUND,
+                             {"index_in_tag": prefix_tag_adj, "index_in_tag_end": prefix_tag_adj + next_index})
                     raise self._TagIdentifyError(error)
                 # If this is not a takes value node, validate each term in the remainder.
                 if not current_entry.takes_value_child_entry:
                     # This will raise _TagIdentifyError on any issues
-                    self._validate_remaining_terms(tag, working_tag, prefix_tag_adj, current_slash_index)
+                    self._validate_remaining_terms(working_tag, prefix_tag_adj, current_slash_index)
                 break
 
             current_entry = parent_entry
@@ -500,7 +536,7 @@ class HedSchema(HedSchemaBase):
 
         return current_entry, current_slash_index
 
-    def _validate_remaining_terms(self, tag, working_tag, prefix_tag_adj, current_slash_index):
+    def _validate_remaining_terms(self, working_tag, prefix_tag_adj, current_slash_index):
         """ Validates the terms past current_slash_index.
         
         :raises _TagIdentifyError:
@@ -509,12 +545,12 @@ class HedSchema(HedSchemaBase):
         child_names = working_tag[current_slash_index + 1:].split("/")
         word_start_index = current_slash_index + 1 + prefix_tag_adj
         for name in child_names:
-            if self._get_tag_entry(name):
-                error = ErrorHandler.format_error(ValidationErrors.INVALID_PARENT_NODE,
-                                                  tag,
-                                                  index_in_tag=word_start_index,
-                                                  index_in_tag_end=word_start_index + len(name),
-                                                  expected_parent_tag=self.tags[name].name)
+            found_entry = self._get_tag_entry(name)
+            if found_entry:
+                error = (ValidationErrors.INVALID_PARENT_NODE,
+                         {"index_in_tag": word_start_index,
+                          "index_in_tag_end": word_start_index + len(name),
+                          "expected_parent_tag": found_entry.name})
                 raise self._TagIdentifyError(error)
             word_start_index += len(name) + 1
 
@@ -524,6 +560,7 @@ class HedSchema(HedSchemaBase):
     def finalize_dictionaries(self):
         """ Call to finish loading. """
         self._has_duplicate_tags = bool(self.tags.duplicate_names)
+        self._tag_lookup_cache = {}
         self._update_all_entries()
 
     def _update_all_entries(self):
@@ -751,6 +788,6 @@ class HedSchema(HedSchemaBase):
         return section._create_tag_entry(long_tag_name)
 
     class _TagIdentifyError(Exception):
-        """Used internally to note when a tag cannot be identified."""
+        """Used internally to note when a tag cannot be identified.  The issue is an (error_type, kwargs) tuple."""
         def __init__(self, issue):
             self.issue = issue
@@ -243,6 +243,8 @@ class HedTagEntry(HedSchemaEntry):
         self.inherited_attributes = self.attributes
         # Descendent tags below this one
         self.children = {}
+        # The unit and unit prefix matches of each unit name of this tag's unit classes.  Built on first use.
+        self._unit_matches = None
 
     def has_attribute(self, attribute, return_value=False):
         """ Returns th existence or value of an attribute in this entry.
@@ -349,7 +351,77 @@ class HedTagEntry(HedSchemaEntry):
                     result[attribute_name] = entry
         return result
 
+    def get_unit_matches(self, unit_string):
+        """ Find the first unit class in which a string is a unit and the first in which it is a unit prefix.
+
+        Parameters:
+            unit_string (str): A possible unit, such as "ms" or "$".
+
+        Returns:
+            tuple: ((index, UnitEntry), (index, UnitEntry)) with the position of the unit class in unit_classes
+                   and the matching unit, first as a unit and then as a unit prefix.
+                   Each is (None, None) if the string doesn't match in that role.
+
+        Notes:
+            - Unit symbols must match including case, other units can be in any case.
+            - The matches of every unit name of this tag are found once and kept.
+
+        """
+        if self._unit_matches is None:
+            self._unit_matches = {unit_name: self._find_unit_matches(unit_name)
+                                  for unit_class_entry in self.unit_classes.values()
+                                  for unit_name in unit_class_entry.derivative_units}
+        matches = self._unit_matches.get(unit_string)
+        if matches is None:
+            # Only a different case of a unit name can still match.
+            if unit_string.lower() not in self._unit_matches:
+                return (None, None), (None, None)
+            matches = self._find_unit_matches(unit_string)
+        return matches
+
+    def _find_unit_matches(self, unit_string):
+        """ Return the first unit and unit prefix matches of the string in the unit classes of this tag. """
+        unit_match = prefix_match = (None, None)
+        for index, unit_class_entry in enumerate(self.unit_classes.values()):
+            unit_entry = self.find_unit_entry(unit_string, unit_class_entry.derivative_units)
+            if not unit_entry:
+                continue
+            if unit_entry.has_attribute(HedKey.UnitPrefix):
+                if prefix_match[1] is None:
+                    prefix_match = (index, unit_entry)
+            elif unit_match[1] is None:
+                unit_match = (index, unit_entry)
+        return unit_match, prefix_match
+
+    @staticmethod
+    def find_unit_entry(unit_string, derivative_units):
+        """ Return the unit entry matching a string in a dictionary of unit names.
+
+        Parameters:
+            unit_string (str): A possible unit.
+            derivative_units (dict): The unit names (with modifiers and plurals) and their UnitEntry.
+
+        Returns:
+            UnitEntry or None: The matching unit.
+
+        Notes:
+            - Unit symbols must match including case.  Other units are matched in lower case.
+
+        """
+        possible_match = derivative_units.get(unit_string)
+        # If we have a match that's a unit symbol, we're done, return it.
+        if possible_match and possible_match.has_attribute(HedKey.UnitSymbol):
+            return possible_match
+
+        possible_match = derivative_units.get(unit_string.lower())
+        # Unit symbols must match including case, a match of a unit symbol now is something like M becoming m.
+        if possible_match and possible_match.has_attribute(HedKey.UnitSymbol):
+            possible_match = None
+
+        return possible_match
+
     def _finalize_takes_value_tag(self, schema):
+        self._unit_matches = None
         if self.name.endswith("/#"):
             self.unit_classes = self._finalize_classes(schema, HedKey.UnitClass, HedSectionKey.UnitClasses)
             self.value_classes = self._finalize_classes(schema, HedKey.ValueClass, HedSectionKey.ValueClasses)
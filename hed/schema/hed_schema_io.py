@@ -2,18 +2,30 @@
 import os
 import json
 import functools
+import hashlib
+import pickle
+import tempfile
 from hed.schema.schema_io.xml2schema import SchemaLoaderXML
 from hed.schema.schema_io.wiki2schema import SchemaLoaderWiki
 from hed.schema import hed_cache
 
 from hed.errors.exceptions import HedFileError, HedExceptions
 from hed.schema.schema_io import schema_util
+from hed.schema.hed_schema import HedSchema
 from hed.schema.hed_schema_group import HedSchemaGroup
 from hed.schema.schema_validation_util import validate_version_string
 
 
 MAX_MEMORY_CACHE = 20
 
+# If COMPILED_SCHEMA_CACHE is True, schemas loaded by version are also saved pickled in this folder of the hed cache
+# directory, so later processes can skip parsing them.  Loading a pickle can run any code in it, so only turn this on
+# if no one else can write to the hed cache directory.
+COMPILED_SCHEMA_CACHE = False
+COMPILED_SCHEMA_FOLDER = "compiled_schemas"
+# Increase this if the saved form of a schema changes without the hedtools version changing.
+COMPILED_SCHEMA_FORMAT = 1
+
 
 def from_string(schema_string, schema_format=".xml", schema_namespace=None):
     """ Create a schema from the given string.
@@ -106,6 +118,97 @@ def get_hed_xml_version(xml_file_path):
     return parser.schema.version
 
 
+def _load_schema_file(hed_path):
+    """ Load a schema file, using the compiled copy in the hed cache directory if there is one.
+
+    Parameters:
+        hed_path (str): A filepath to open a schema from.
+
+    Returns:
+        HedSchema: The loaded schema.
+
+    :raises HedFileError:
+        - Any fatal issues when loading the schema.
+
+    Notes:
+        - The compiled copy is found by a hash of the schema file contents and the hedtools version,
+          so changing either means the file is parsed (and compiled) again.
+        - The compiled copy is only used if COMPILED_SCHEMA_CACHE is True.
+        - A compiled copy that can't be read is deleted and the file is parsed (and compiled) again.
+
+    """
+    if not COMPILED_SCHEMA_CACHE or not hed_path:
+        # load_schema raises the usual errors for a missing path.
+        return load_schema(hed_path)
+
+    try:
+        with open(hed_path, "rb") as file:
+            source = file.read()
+    except OSError:
+        return load_schema(hed_path)
+
+    compiled_path = _get_compiled_schema_path(hed_path, source)
+    hed_schema = _read_compiled_schema(compiled_path)
+    if hed_schema is not None:
+        return hed_schema
+
+    hed_schema = load_schema(hed_path)
+    _save_compiled_schema(hed_schema, compiled_path)
+    return hed_schema
+
+
+def _get_compiled_schema_path(hed_path, source):
+    """ Return the path of the compiled copy of a schema file with the given contents. """
+    import hed
+    hasher = hashlib.sha256(source)
+    hasher.update(f"{COMPILED_SCHEMA_FORMAT}:{hed.__version__}".encode())
+    basename = os.path.splitext(os.path.basename(hed_path))[0]
+    return os.path.join(hed_cache.get_cache_directory(), COMPILED_SCHEMA_FOLDER,
+                        f"{basename}_{hasher.hexdigest()[:32]}.pickle")
+
+
+def _read_compiled_schema(compiled_path):
+    """ Return the compiled schema saved at compiled_path, or None (deleting the file) if it can't be read. """
+    try:
+        with open(compiled_path, "rb") as file:
+            hed_schema = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        hed_schema = None
+    if isinstance(hed_schema, HedSchema):
+        return hed_schema
+    try:
+        os.remove(compiled_path)
+    except OSError:
+        pass
+    return None
+
+
+def _save_compiled_schema(hed_schema, compiled_path):
+    """ Save a compiled schema, replacing any out of date copies of the same file.  Failures are ignored. """
+    compiled_folder, compiled_name = os.path.split(compiled_path)
+    basename = compiled_name.rpartition("_")[0]
+    temp_path = None
+    try:
+        os.makedirs(compiled_folder, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=compiled_folder, suffix=".tmp", delete=False) as file:
+            temp_path = file.name
+            pickle.dump(hed_schema, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, compiled_path)
+        temp_path = None
+        for old_name in os.listdir(compiled_folder):
+            if old_name != compiled_name and old_name.endswith(".pickle") and \
+                    old_name.rpartition("_")[0] == basename:
+                os.remove(os.path.join(compiled_folder, old_name))
+    except (OSError, pickle.PicklingError, RecursionError):
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
 @functools.lru_cache(maxsize=MAX_MEMORY_CACHE)
 def _load_schema_version(xml_version=None, xml_folder=None):
     """ Return specified version or latest if not specified.
@@ -138,7 +241,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
         if not final_hed_xml_file:
             hed_cache.cache_local_versions(xml_folder)
             final_hed_xml_file = hed_cache.get_hed_version_path(xml_version, library_name, xml_folder)
-        hed_schema = load_schema(final_hed_xml_file)
+        hed_schema = _load_schema_file(final_hed_xml_file)
     except HedFileError as e:
         if e.code == HedExceptions.FILE_NOT_FOUND:
             hed_cache.cache_xml_versions(cache_folder=xml_folder)
@@ -147,7 +250,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
                 raise HedFileError(HedExceptions.FILE_NOT_FOUND,
                                    f"HED version '{xml_version}' not found in cache: {hed_cache.get_cache_directory()}",
                                    filename=xml_folder)
-            hed_schema = load_schema(final_hed_xml_file)
+            hed_schema = _load_schema_file(final_hed_xml_file)
         else:
             raise e
 
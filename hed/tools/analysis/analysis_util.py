@@ -7,6 +7,7 @@ from hed.models.hed_tag import HedTag
 from hed.models.hed_group import HedGroup
 from hed.models import df_util
 from hed.models import QueryParser
+from hed.tools.analysis.search_index import SearchIndex
 
 
 def assemble_hed(data_input, sidecar, schema, columns_included=None, expand_defs=False):
@@ -95,16 +96,14 @@ def search_strings(hed_strings, queries, query_names=None):
     :raises ValueError:
         - If query names are invalid or duplicated.
 
+    Notes:
+        - The strings are indexed by tag once, so each query is only run on the strings that could match it.
+
     """
 
     expression_parsers, query_names = get_expression_parsers(queries, query_names=query_names)
-    df_factors = pd.DataFrame(0, index=range(len(hed_strings)), columns=query_names)
-    for parse_ind, parser in enumerate(expression_parsers):
-        for index, next_item in enumerate(hed_strings):
-            match = parser.search(next_item)
-            if match:
-                df_factors.at[index, query_names[parse_ind]] = 1
-    return df_factors
+    factors = SearchIndex(hed_strings).search_all(expression_parsers)
+    return pd.DataFrame(factors, index=range(len(hed_strings)), columns=query_names)
 
 # def get_assembled_strings(table, hed_schema=None, expand_defs=False):
 #     """ Return HED string objects for a tabular file.
@@ -1,6 +1,9 @@
 """ Manages events of temporal extent. """
 
-from hed.models import HedString
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from hed.models.hed_string_cache import get_hed_string
 from hed.models.model_constants import DefTagNames
 from hed.models.df_util import get_assembled
 from hed.models.string_util import split_base_tags, split_def_tags
@@ -33,6 +36,7 @@ class EventManager:
         self.onsets = input_data.dataframe['onset'].tolist()
         self.hed_strings = None  # Remaining HED strings copy.deepcopy(hed_strings)
         self._create_event_list(input_data)
+        self._create_interval_index()
 
     def _create_event_list(self, input_data):
         """ Populate the event_list with the events with temporal extent indexed by event number.
@@ -87,6 +91,160 @@ class EventManager:
             to_remove.append(tup[1])
         hed.remove(to_remove)
 
+    def _create_interval_index(self):
+        """ Index the temporal events by their start and end positions so ongoing events are found without a scan.
+
+        Notes:
+            - temporal_events holds all the temporal events ordered by start (and by position in a row).
+
+        """
+        self.temporal_events = [event for events in self.event_list for event in events]
+        self._starts = np.array([event.start_index for event in self.temporal_events], dtype=np.int64)
+        self._ends = np.array([event.end_index for event in self.temporal_events], dtype=np.int64)
+        self._event_strings = None
+        self._create_time_index()
+
+    def _create_time_index(self):
+        """ Index the onsets of the events and the start and end times of the temporal events for time queries.
+
+        Notes:
+            - onset_times has the onsets as floats with NaN for onsets that are not numbers.
+            - Temporal events that have no end extend to infinity.
+
+        """
+        self.onset_times = pd.to_numeric(pd.Series(self.onsets, dtype=object), errors='coerce').to_numpy(
+            dtype=np.float64)
+        self._onset_order = np.argsort(self.onset_times, kind='stable')
+        self._sorted_onsets = self.onset_times[self._onset_order]
+        self._start_times = np.array([event.start_time for event in self.temporal_events], dtype=np.float64)
+        end_times = [np.inf if event.end_time is None else event.end_time for event in self.temporal_events]
+        self._end_times = pd.to_numeric(pd.Series(end_times, dtype=object), errors='coerce').to_numpy(
+            dtype=np.float64)
+        self._time_order = np.argsort(self._start_times, kind='stable')
+        self._sorted_start_times = self._start_times[self._time_order]
+
+    def get_ongoing_events(self, index):
+        """ Return the temporal events that started before the event at index and have not ended by it.
+
+        Parameters:
+            index (int): The position of an event in the data.
+
+        Returns:
+            list:  The TemporalEvent objects that are the ongoing context of the event, in order of their starts.
+
+        """
+        started = np.searchsorted(self._starts, index, side='left')
+        positions = np.flatnonzero(self._ends[:started] > index)
+        return [self.temporal_events[position] for position in positions]
+
+    def get_events_at_time(self, time):
+        """ Return the temporal events in effect at a time.
+
+        Parameters:
+            time (float): The time in seconds.
+
+        Returns:
+            list:  The TemporalEvent objects with start_time <= time < end_time, in order of their starts.
+
+        """
+        started = self._time_order[:np.searchsorted(self._sorted_start_times, time, side='right')]
+        positions = np.sort(started[self._end_times[started] > time])
+        return [self.temporal_events[position] for position in positions]
+
+    def get_events_in_window(self, start_time, end_time):
+        """ Return the temporal events that overlap the time window [start_time, end_time).
+
+        Parameters:
+            start_time (float): The start of the window in seconds.
+            end_time (float): The end of the window in seconds (not included).
+
+        Returns:
+            list:  The TemporalEvent objects that are in effect at some time in the window, in order of their starts.
+
+        Notes:
+            - A temporal event with no extent is included if it starts in the window.
+
+        """
+        started = self._time_order[:np.searchsorted(self._sorted_start_times, end_time, side='left')]
+        overlapping = (self._end_times[started] > start_time) | (self._start_times[started] >= start_time)
+        positions = np.sort(started[overlapping])
+        return [self.temporal_events[position] for position in positions]
+
+    def get_rows_in_window(self, start_time, end_time):
+        """ Return the positions of the events whose onsets are in the time window [start_time, end_time).
+
+        Parameters:
+            start_time (float): The start of the window in seconds.
+            end_time (float): The end of the window in seconds (not included).
+
+        Returns:
+            numpy.ndarray:  The sorted positions of the events in the window.
+
+        """
+        first, last = np.searchsorted(self._sorted_onsets, [start_time, end_time], side='left')
+        return np.sort(self._onset_order[first:last])
+
+    def get_epochs(self, anchor, before=0.0, after=0.0):
+        """ Return the events in a time window around each temporal event with a given anchor.
+
+        Parameters:
+            anchor (str): A definition name such as Face-image (or Def/Face-image).  Values of the def are ignored.
+            before (float): The seconds before the start of each anchor event to include.
+            after (float): The seconds after the start of each anchor event to include (not included).
+
+        Returns:
+            list:  A tuple of the anchor TemporalEvent and the array of positions of the events in its window
+                for each temporal event with the anchor, in order of their starts.
+
+        """
+        name = anchor.lower()
+        if name.startswith("def/"):
+            name = name[4:]
+        epochs = []
+        for event in self.temporal_events:
+            if not event.anchor:
+                continue
+            def_name = event.anchor.lower().split("/")[1]
+            if def_name == name:
+                epochs.append((event, self.get_rows_in_window(event.start_time - before, event.start_time + after)))
+        return epochs
+
+    def iter_context(self):
+        """ Generate the onset and ongoing context strings for each event in order.
+
+        Yields:
+            tuple:  The comma-separated contents of the temporal events starting at the event and of those ongoing.
+
+        Notes:
+            - This sweeps once through the events keeping the set of ongoing temporal events.
+            - Consecutive events with the same ongoing context share a single string.
+
+        """
+        event_strings = self._get_event_strings()
+        ending = defaultdict(list)  # Positions of the active temporal events keyed by their end index.
+        active = {}  # Strings of the ongoing temporal events keyed by position, in the order of their starts.
+        context = ""
+        position = 0
+        for index, starting in enumerate(self.event_list):
+            changed = False
+            for ended in ending.pop(index, []):
+                del active[ended]
+                changed = True
+            while position < len(self._starts) and self._starts[position] < index:
+                if self._ends[position] > index:
+                    active[position] = event_strings[position]
+                    ending[self._ends[position]].append(position)
+                    changed = True
+                position += 1
+            if changed:
+                context = ",".join(active.values())
+            yield ",".join(event_strings[position:position + len(starting)]), context
+
+    def _get_event_strings(self):
+        if self._event_strings is None:
+            self._event_strings = [str(event.contents) for event in self.temporal_events]
+        return self._event_strings
+
     def unfold_context(self, remove_types=[]):
         """ Unfolds the event information into hed, base, and contexts either as arrays of str or of HedString.
 
@@ -100,41 +258,54 @@ class EventManager:
 
         """
 
-        placeholder = ""
+        if not self.event_list:
+            return [], [], []
+        new_hed, new_base, new_contexts = zip(*self.iter_unfolded_context(remove_types=remove_types))
+        return list(new_hed), list(new_base), list(new_contexts)   # these are each a list of strings
+
+    def iter_unfolded_context(self, remove_types=[]):
+        """ Generate the hed, base, and context strings of each event in order without building the full lists.
+
+        Parameters:
+            remove_types (list):  List of types to remove.
+
+        Yields:
+            tuple:  The strings for the event without the events of temporal extent, the onsets of the events of
+                temporal extent and the ongoing context information.
+
+        Notes:
+            - The base and context strings repeat from event to event, so each distinct one is processed once.
+
+        """
         remove_defs = self.get_type_defs(remove_types)
-        new_hed = [placeholder for _ in range(len(self.hed_strings))]
-        new_base = [placeholder for _ in range(len(self.hed_strings))]
-        new_contexts = [placeholder for _ in range(len(self.hed_strings))]
-        base, contexts = self._expand_context()
-        for index, item in enumerate(self.hed_strings):
-            new_hed[index] = self._process_hed(item, remove_types=remove_types,
-                                               remove_defs=remove_defs, remove_group=False)
-            new_base[index] = self._process_hed(base[index], remove_types=remove_types,
-                                                remove_defs=remove_defs, remove_group=True)
-            new_contexts[index] = self._process_hed(contexts[index], remove_types=remove_types,
-                                                    remove_defs=remove_defs, remove_group=True)
-        return new_hed, new_base, new_contexts   # these are each a list of strings
+        processed = {}
+        for item, (base, context) in zip(self.hed_strings, self.iter_context()):
+            new_hed = self._process_hed(item, remove_types=remove_types, remove_defs=remove_defs, remove_group=False)
+            new_items = []
+            for group_str in (base, context):
+                new_item = processed.get(group_str)
+                if new_item is None:
+                    new_item = self._process_hed(group_str, remove_types=remove_types,
+                                                 remove_defs=remove_defs, remove_group=True)
+                    processed[group_str] = new_item
+                new_items.append(new_item)
+            yield new_hed, new_items[0], new_items[1]
 
     def _expand_context(self):
         """ Expands the onset and the ongoing context for additional processing.
 
         """
-        base = [[] for _ in range(len(self.hed_strings))]
-        contexts = [[] for _ in range(len(self.hed_strings))]
-        for events in self.event_list:
-            for event in events:
-                this_str = str(event.contents)
-                base[event.start_index].append(this_str)
-                for i in range(event.start_index + 1, event.end_index):
-                    contexts[i].append(this_str)
-
-        return self.compress_strings(base), self.compress_strings(contexts)
+        base, contexts = [], []
+        for base_str, context_str in self.iter_context():
+            base.append(base_str)
+            contexts.append(context_str)
+        return base, contexts
 
     def _process_hed(self, hed, remove_types=[], remove_defs=[], remove_group=False):
         if not hed:
             return ""
         # Reconvert even if hed is already a HedString to make sure a copy and expandable.
-        hed_obj = HedString(str(hed), hed_schema=self.hed_schema, def_dict=self.def_dict)
+        hed_obj = get_hed_string(str(hed), self.hed_schema, def_dict=self.def_dict)
         hed_obj, temp1 = split_base_tags(hed_obj, remove_types, remove_group=remove_group)
         if remove_defs:
             hed_obj, temp2 = split_def_tags(hed_obj, remove_defs, remove_group=remove_group)
@@ -153,7 +324,7 @@ class EventManager:
         filtered_list = [item for item in str_list if item != '']  # list of strings
         if not filtered_list:  # empty lists don't contribute
             return None
-        return HedString(",".join(filtered_list), self.hed_schema, def_dict=self.def_dict)
+        return get_hed_string(",".join(filtered_list), self.hed_schema, def_dict=self.def_dict)
 
     @staticmethod
     def compress_strings(list_to_compress):
@@ -1,6 +1,8 @@
 """ Counts of HED tags in a file's annotations. """
 
 import copy
+from collections import Counter
+import numpy as np
 
 
 class HedTagCount:
@@ -37,6 +39,29 @@ class HedTagCount:
         else:
             self.value_dict[value] = 1
 
+    @classmethod
+    def from_counts(cls, tag, tag_terms, events, files, value_dict):
+        """ Create a HedTagCount from counts that have already been made.
+
+        Parameters:
+            tag (str):  The short base tag.
+            tag_terms (tuple):  The tag terms of the tag.
+            events (int):  The number of events with the tag.
+            files (dict):  The names of the files with the tag as keys.
+            value_dict (dict):  The number of times each value of the tag occurs.
+
+        Returns:
+            HedTagCount: The counts.
+
+        """
+        count = cls.__new__(cls)
+        count.tag = tag
+        count.tag_terms = tag_terms
+        count.events = events
+        count.files = files
+        count.value_dict = value_dict
+        return count
+
     def get_info(self, verbose=False):
         if verbose:
             files = [name for name in self.files]
@@ -68,13 +93,32 @@ class HedTagCounts:
         name (str):  An identifier for these counts (usually the filename of the tabular file)
         total_events (int):  The total number of events in the tabular file.
 
+    Notes:
+        - The counts are kept by column, one for each distinct tag, so counts for files can be merged cheaply.
+        - tag_dict gives the counts as HedTagCount objects keyed by lowercase short base tag.
+
     """
 
     def __init__(self, name, total_events=0):
-        self.tag_dict = {}
         self.name = name
         self.files = {}
         self.total_events = total_events
+        self._columns = {}  # Lowercase short base tag to its column in the counts.
+        self._tags = []  # Short base tag and tag terms of the first tag seen for each column.
+        self._events = np.zeros(0, dtype=np.int64)
+        self._tag_files = []  # Files containing the tag of each column, kept as dictionary keys.
+        self._values = []  # Counter of the values of the tag of each column.
+        self._tag_dict = None
+
+    @property
+    def tag_dict(self):
+        """ The counts for each tag as a dictionary of HedTagCount keyed by lowercase short base tag. """
+        if self._tag_dict is None:
+            self._tag_dict = {key: HedTagCount.from_counts(self._tags[column][0], self._tags[column][1],
+                                                           int(self._events[column]), dict(self._tag_files[column]),
+                                                           dict(self._values[column]))
+                              for key, column in self._columns.items()}
+        return self._tag_dict
 
     def update_event_counts(self, hed_string_obj, file_name):
         """ Update the tag counts based on a hed string object.
@@ -83,21 +127,59 @@ class HedTagCounts:
             hed_string_obj (HedString): The HED string whose tags should be counted.
             file_name (str): The name of the file corresponding to these counts.
 
+        """
+        self.update_counts([hed_string_obj], file_name)
+
+    def update_counts(self, hed_strings, file_name):
+        """ Update the tag counts with the events of a file.
+
+        Parameters:
+            hed_strings (list): The HedString (or None) for each event.
+            file_name (str): The name of the file corresponding to these counts.
+
         """
         if file_name not in self.files:
             self.files[file_name] = ""
-        if not hed_string_obj:
+        event_columns = []
+        for hed_string_obj in hed_strings:
+            if not hed_string_obj:
+                continue
+            columns = set()
+            for tag in hed_string_obj.get_all_tags():
+                column = self._get_column(tag.short_base_tag.lower(), tag.short_base_tag, tag.tag_terms)
+                self._values[column][tag.extension or None] += 1
+                columns.add(column)
+            event_columns.extend(columns)
+        if not event_columns:
             return
-        tag_list = hed_string_obj.get_all_tags()
-        tag_dict = {}
-        for tag in tag_list:
-            str_tag = tag.short_base_tag.lower()
-            if str_tag not in tag_dict:
-                tag_dict[str_tag] = HedTagCount(tag, file_name)
-            else:
-                tag_dict[str_tag].set_value(tag)
+        self._resize()
+        self._events += np.bincount(event_columns, minlength=len(self._tags))
+        for column in set(event_columns):
+            self._tag_files[column][file_name] = ''
+        self._tag_dict = None
+
+    def merge(self, other):
+        """ Add the counts, files and total events of another HedTagCounts to these counts.
+
+        Parameters:
+            other (HedTagCounts): The counts to add.  They are not modified.
 
-        self.merge_tag_dicts(tag_dict)
+        Notes:
+            - Counts made separately (for example by parallel workers) can be merged in any grouping.
+
+        """
+        columns = np.array([self._get_column(key, *other._tags[column]) for key, column in other._columns.items()],
+                           dtype=np.int64)
+        self._resize()
+        if len(columns):
+            self._events[columns] += other._events[np.array(list(other._columns.values()), dtype=np.int64)]
+        for column, other_column in zip(columns, other._columns.values()):
+            self._tag_files[column].update(other._tag_files[other_column])
+            self._values[column].update(other._values[other_column])
+        for file_name in other.files:
+            self.files[file_name] = ""
+        self.total_events = self.total_events + other.total_events
+        self._tag_dict = None
 
     def organize_tags(self, tag_template):
         """ Organize tags into categories as specified by the tag_template.
@@ -117,19 +199,19 @@ class HedTagCounts:
         return template, unmatched
 
     def merge_tag_dicts(self, other_dict):
+        """ Add the counts in a dictionary of HedTagCount keyed by lowercase short base tag to these counts.
+
+        Parameters:
+            other_dict (dict): The counts to add, such as the tag_dict of another HedTagCounts.
+
+        """
         for tag, count in other_dict.items():
-            if tag not in self.tag_dict:
-                self.tag_dict[tag] = count.get_empty()
-            self.tag_dict[tag].events = self.tag_dict[tag].events + count.events
-            for file in count.files:
-                self.tag_dict[tag].files[file] = ''
-            if not self.tag_dict[tag].value_dict:
-                continue
-            for value, val_count in count.value_dict.items():
-                if value in self.tag_dict[tag].value_dict:
-                    self.tag_dict[tag].value_dict[value] = self.tag_dict[tag].value_dict + val_count
-                else:
-                    self.tag_dict[tag].value_dict[value] = val_count
+            column = self._get_column(tag, count.tag, count.tag_terms)
+            self._resize()
+            self._events[column] += count.events
+            self._tag_files[column].update(count.files)
+            self._values[column].update(count.value_dict)
+        self._tag_dict = None
 
     def get_summary(self):
         details = {}
@@ -138,6 +220,23 @@ class HedTagCounts:
         return {'name': str(self.name), 'files': list(self.files.keys()),
                 'total_events': self.total_events, 'details': details}
 
+    def _get_column(self, key, tag, tag_terms):
+        """ Return the column of the counts for a tag, adding a column if the tag has not been seen. """
+        column = self._columns.get(key)
+        if column is None:
+            column = len(self._tags)
+            self._columns[key] = column
+            self._tags.append((tag, tag_terms))
+            self._tag_files.append({})
+            self._values.append(Counter())
+        return column
+
+    def _resize(self):
+        """ Extend the event counts with zeros for columns added since they were last resized. """
+        if len(self._events) < len(self._tags):
+            self._events = np.concatenate([self._events, np.zeros(len(self._tags) - len(self._events),
+                                                                  dtype=np.int64)])
+
     @staticmethod
     def create_template(tags):
         template_dict = {}
@@ -1,4 +1,5 @@
 """ Manages a type variable and its associated context. """
+import numpy as np
 import pandas as pd
 from hed.models import HedGroup, HedTag
 from hed.tools.analysis.hed_type_defs import HedTypeDefs
@@ -75,30 +76,31 @@ class HedType:
             summary[var_name] = var_sum.get_summary()
         return summary
 
-    def get_type_factors(self, type_values=None, factor_encoding="one-hot"):
+    def get_type_factors(self, type_values=None, factor_encoding="one-hot", sparse=False):
         """ Create a dataframe with the indicated type tag values as factors.
 
         Parameters:
             type_values (list or None): A list of values of type tags for which to generate factors.
             factor_encoding (str):      Type of factor encoding (one-hot or categorical).
+            sparse (bool):              If True, one-hot columns are stored as pandas sparse arrays.
 
         Returns:
             DataFrame:  Contains the specified factors associated with this type tag.
 
+        Notes:
+            - Values that are not type values of this file are skipped.
 
         """
         if type_values is None:
             type_values = self.get_type_value_names()
-        df_list = []
-        for index, type_value in enumerate(type_values):
-            var_sum = self._type_map.get(type_value, None)
-            if not var_sum:
-                continue
-            df_list.append(var_sum.get_factors(factor_encoding=factor_encoding))
-        if not df_list:
+        factors = [self._type_map[type_value] for type_value in type_values if self._type_map.get(type_value, None)]
+        if not factors:
             return None
-        else:
-            return pd.concat(df_list, axis=1)
+        if factor_encoding == "one-hot" and not sparse:
+            arrays, columns = zip(*[factor.get_factor_array() for factor in factors])
+            return pd.DataFrame(np.hstack(arrays), columns=[column for names in columns for column in names])
+        return pd.concat([factor.get_factors(factor_encoding=factor_encoding, sparse=sparse) for factor in factors],
+                         axis=1)
 
     def __str__(self):
         return f"{self.type_tag} type_variables: {str(list(self._type_map.keys()))}"
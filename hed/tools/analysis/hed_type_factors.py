@@ -1,5 +1,6 @@
 """ Manages factor information for a tabular file. """
 
+import numpy as np
 import pandas as pd
 from hed.errors.exceptions import HedFileError
 
@@ -29,60 +30,91 @@ class HedTypeFactors:
         return f"[{self.type_value},{self.type_tag}]: {self.number_elements} elements " + \
             f"{str(self.levels)} levels {len(self.direct_indices)} references"
 
-    def get_factors(self, factor_encoding="one-hot"):
+    def get_level_indices(self):
+        """ Return the positions of the events with each level of this type value.
+
+        Returns:
+            dict: Sorted integer arrays of event positions keyed by level, or keyed by the type value if no levels.
+
+        """
+        if not self.levels:
+            return {self.type_value: self._to_array(self.direct_indices)}
+        return {level: self._to_array(indices) for level, indices in self.levels.items()}
+
+    def get_factor_array(self, dtype=np.int64):
+        """ Return the one-hot factor vectors as the columns of an array along with the column names.
+
+        Parameters:
+            dtype (numpy.dtype): The type of the array elements.  A small type such as numpy.int8 saves memory.
+
+        Returns:
+            tuple:
+                - numpy.ndarray: Array of shape (number_elements, number of levels) with a 1 where a level is present.
+                - list: The factor names of the columns.
+
+        """
+        level_indices = self.get_level_indices()
+        factors = np.zeros((self.number_elements, len(level_indices)), dtype=dtype)
+        for column, indices in enumerate(level_indices.values()):
+            factors[indices, column] = 1
+        return factors, self.get_factor_names()
+
+    def get_factor_names(self):
+        """ Return the names of the one-hot factor vectors: the type value or type_value.level for each level. """
+        if not self.levels:
+            return [self.type_value]
+        return [f"{self.type_value}.{level}" for level in self.levels]
+
+    def get_factors(self, factor_encoding="one-hot", sparse=False):
         """ Return a DataFrame of factor vectors for this type factor.
 
         Parameters:
             factor_encoding (str):   Specifies type of factor encoding (one-hot or categorical).
+            sparse (bool):   If True, one-hot columns are stored as pandas sparse arrays with a fill value of 0.
 
         Returns:
             DataFrame:   DataFrame containing the factor vectors as the columns.
 
         """
 
-        if not self.levels:
-            df = pd.DataFrame(0, index=range(self.number_elements), columns=[self.type_value])
-            df.loc[list(self.direct_indices.keys()), [self.type_value]] = 1
-            return df
-
-        levels = list(self.levels.keys())
-        levels_list = [f"{self.type_value}.{level}" for level in levels]
-        factors = pd.DataFrame(0, index=range(self.number_elements), columns=levels_list)
-        for index, level in enumerate(levels):
-            index_keys = list(self.levels[level].keys())
-            factors.loc[index_keys, [levels_list[index]]] = 1
-        if factor_encoding == "one-hot":
-            return factors
+        if sparse and (not self.levels or factor_encoding == "one-hot"):
+            return pd.DataFrame({name: self._to_sparse(indices) for name, indices
+                                 in zip(self.get_factor_names(), self.get_level_indices().values())})
+        factors, columns = self.get_factor_array()
+        if not self.levels or factor_encoding == "one-hot":
+            return pd.DataFrame(factors, columns=columns)
         sum_factors = factors.sum(axis=1)
-        if factor_encoding == "categorical" and sum_factors.max() > 1:
+        if factor_encoding == "categorical" and len(sum_factors) and sum_factors.max() > 1:
             raise HedFileError("MultipleFactorSameEvent",
-                               f"{self.type_value} has multiple occurrences at index {sum_factors.idxmax()}", "")
+                               f"{self.type_value} has multiple occurrences at index {sum_factors.argmax()}", "")
         elif factor_encoding == "categorical":
-            return self._one_hot_to_categorical(factors, levels)
+            return self._one_hot_to_categorical(pd.DataFrame(factors, columns=columns), list(self.levels.keys()))
         else:
             raise ValueError("BadFactorEncoding",
                              f"{factor_encoding} is not in the allowed encodings: {str(self.ALLOWED_ENCODINGS)}")
 
     def _one_hot_to_categorical(self, factors, levels):
-        df = pd.DataFrame('n/a', index=range(len(factors.index)), columns=[self.type_value])
-        for index, row in factors.iterrows():
-            if self.type_value in row.index and row[self.type_value]:
-                df.at[index, self.type_value] = self.type_value
-                continue
-            for level in levels:
-                level_str = f"{self.type_value}.{level.lower()}"
-                if level_str in row.index and row[level_str]:
-                    df.at[index, self.type_value] = level.lower()
-                    break
-        return df
+        """ Return a single column DataFrame with the first of the type value or levels present in each row.
+
+        Parameters:
+            factors (DataFrame): One-hot factor vectors named by the type value or type_value.level.
+            levels (list): The levels to look for, in order.
+
+        Returns:
+            DataFrame: The type value or lowercase level present in each row, or n/a if none.
+
+        """
+        labels = [self.type_value] + [level.lower() for level in levels]
+        names = [self.type_value] + [f"{self.type_value}.{label}" for label in labels[1:]]
+        present = [index for index, name in enumerate(names) if name in factors.columns]
+        one_hot = np.hstack([factors[[names[index] for index in present]].to_numpy() != 0,
+                             np.ones((len(factors.index), 1), dtype=bool)])
+        labels = np.array([labels[index] for index in present] + ['n/a'], dtype=object)
+        return pd.DataFrame({self.type_value: labels[one_hot.argmax(axis=1)]})
 
     def get_summary(self):
-        count_list = [0] * self.number_elements
-        for index in list(self.direct_indices.keys()):
-            count_list[index] = count_list[index] + 1
-        for level, cond in self.levels.items():
-            for index, item in cond.items():
-                count_list[index] = count_list[index] + 1
+        indices = [self._to_array(self.direct_indices)] + [self._to_array(cond) for cond in self.levels.values()]
+        count_list = np.bincount(np.concatenate(indices), minlength=self.number_elements)
         number_events, number_multiple, max_multiple = self._count_level_events(count_list)
         summary = {'type_value': self.type_value, 'type_tag': self.type_tag,
                    'levels': len(self.levels.keys()), 'direct_references': len(self.direct_indices.keys()),
@@ -102,21 +134,23 @@ class HedTypeFactors:
         """ Count the number of events and multiples in a list.
 
         Parameters:
-            count_list (list): list of integers of the number of times a level occurs in an event.
+            count_list (list or numpy.ndarray): list of integers of the number of times a level occurs in an event.
 
         Returns:
             int:   Number of events this level
         """
         if not len(count_list):
             return 0, 0, None
-        number_events = 0
-        number_multiple = 0
-        max_multiple = count_list[0]
-        for index, count in enumerate(count_list):
-            if count_list[index] > 0:
-                number_events = number_events + 1
-            if count_list[index] > 1:
-                number_multiple = number_multiple + 1
-            if count_list[index] > max_multiple:
-                max_multiple = count_list[index]
-        return number_events, number_multiple, max_multiple
+        counts = np.asarray(count_list)
+        return int(np.count_nonzero(counts > 0)), int(np.count_nonzero(counts > 1)), int(counts.max())
+
+    @staticmethod
+    def _to_array(indices):
+        """ Return the event positions that are the keys of a dictionary as a sorted integer array. """
+        return np.sort(np.fromiter(indices.keys(), dtype=np.int64, count=len(indices)))
+
+    def _to_sparse(self, indices):
+        """ Return a sparse one-hot vector with a 1 at each of the indices. """
+        vector = np.zeros(self.number_elements, dtype=np.int64)
+        vector[indices] = 1
+        return pd.arrays.SparseArray(vector, fill_value=0)
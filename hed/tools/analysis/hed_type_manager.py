@@ -1,6 +1,5 @@
 """ Manager for type factors and type definitions. """
 
-import pandas as pd
 import json
 from hed.tools.analysis.hed_type import HedType
 
@@ -31,31 +30,34 @@ class HedTypeManager:
         self._type_map[type_name.lower()] = \
             HedType(self.event_manager, 'run-01', type_tag=type_name)
 
-    def get_factor_vectors(self, type_tag, type_values=None, factor_encoding="one-hot"):
+    def get_factor_vectors(self, type_tag, type_values=None, factor_encoding="one-hot", sparse=False):
         """ Return a DataFrame of factor vectors for the indicated HED tag and values
 
         Parameters:
             type_tag (str):    HED tag to retrieve factors for.
             type_values (list or None):  The values of the tag to create factors for or None if all unique values.
             factor_encoding (str):   Specifies type of factor encoding (one-hot or categorical).
+            sparse (bool):   If True, one-hot columns are stored as pandas sparse arrays with a fill value of 0.
 
         Returns:
             DataFrame or None:   DataFrame containing the factor vectors as the columns.
 
+        :raises KeyError:
+            - One of the type_values is not a value of type_tag in this file.
+
+        Notes:
+            - The one-hot factors of all the values are filled into a single array before the DataFrame is made.
+
         """
         this_var = self.get_type(type_tag.lower())
         if this_var is None:
             return None
         variables = this_var.get_type_value_names()
-        if not type_values:
-            type_values = variables
-        df_list = [0]*len(type_values)
-        for index, variable in enumerate(type_values):
-            var_sum = this_var._type_map[variable]
-            df_list[index] = var_sum.get_factors(factor_encoding=factor_encoding)
-        if not df_list:
-            return None
-        return pd.concat(df_list, axis=1)
+        for type_value in type_values or []:
+            if type_value not in variables:
+                raise KeyError(type_value)
+        return this_var.get_type_factors(type_values=type_values or None, factor_encoding=factor_encoding,
+                                         sparse=sparse)
 
     def get_type(self, type_tag):
         """
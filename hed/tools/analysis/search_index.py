@@ -0,0 +1,131 @@
+""" Inverted index of the tags in a list of HED strings for running many queries over the same strings. """
+
+import numpy as np
+from hed.models.expression_parser import Expression, ExpressionAnd, ExpressionOr, ExpressionNegation, \
+    ExpressionDescendantGroup, ExpressionExactMatch, ExpressionWildcardNew
+
+
+class SearchIndex:
+    """ Index of which rows contain each tag term, so that queries only examine rows that could match. """
+
+    def __init__(self, hed_strings):
+        """ Build the index for a list of HedStrings.
+
+        Parameters:
+            hed_strings (list):  A list of HedString objects (None entries never match).
+
+        """
+        self.hed_strings = list(hed_strings)
+        # Rows containing each tag term, each complete tag and each short tag, all lowercase.
+        self._rows = {"term": {}, "exact": {}, "short": {}}
+        self._arrays = {}
+        for row, hed_string in enumerate(self.hed_strings):
+            if hed_string is None:
+                continue
+            for tag in hed_string.get_all_tags():
+                for term in tag.tag_terms:
+                    self._add_row("term", term, row)
+                self._add_row("exact", tag.lower(), row)
+                self._add_row("short", tag.short_tag.lower(), row)
+
+    def __len__(self):
+        return len(self.hed_strings)
+
+    def search(self, query):
+        """ Return a factor vector with a 1 for each row matching the query.
+
+        Parameters:
+            query (QueryParser): The compiled query.
+
+        Returns:
+            numpy.ndarray: An integer array with a 1 for each row matching the query and 0 otherwise.
+
+        """
+        factors = np.zeros(len(self.hed_strings), dtype=np.int64)
+        for row in self.get_candidates(query):
+            hed_string = self.hed_strings[row]
+            if hed_string is not None and query.matches(hed_string):
+                factors[row] = 1
+        return factors
+
+    def search_all(self, queries):
+        """ Return a factor matrix with one column per query.
+
+        Parameters:
+            queries (list):  A list of QueryParser objects.
+
+        Returns:
+            numpy.ndarray: An integer array of shape (number of strings, number of queries).
+
+        """
+        factors = np.zeros((len(self.hed_strings), len(queries)), dtype=np.int64)
+        for column, query in enumerate(queries):
+            factors[:, column] = self.search(query)
+        return factors
+
+    def get_candidates(self, query):
+        """ Return the rows that could match a query.
+
+        Parameters:
+            query (QueryParser): The compiled query.
+
+        Returns:
+            numpy.ndarray or range: The sorted row numbers that are not ruled out by the index.
+
+        """
+        candidates = self._expression_candidates(query.tree)
+        if candidates is None:
+            return range(len(self.hed_strings))
+        return candidates
+
+    def _expression_candidates(self, expression):
+        """ Return the sorted rows in which the expression could find anything, or None if it could be any row. """
+        if isinstance(expression, ExpressionAnd):
+            left = self._expression_candidates(expression.left)
+            right = self._expression_candidates(expression.right)
+            if left is None:
+                return right
+            if right is None:
+                return left
+            return np.intersect1d(left, right, assume_unique=True)
+        if isinstance(expression, ExpressionOr):
+            left = self._expression_candidates(expression.left)
+            right = self._expression_candidates(expression.right)
+            if left is None or right is None:
+                return None
+            return np.union1d(left, right)
+        if isinstance(expression, (ExpressionDescendantGroup, ExpressionExactMatch)):
+            # These only match groups around something their required expression found.
+            return self._expression_candidates(expression.right)
+        if not isinstance(expression, Expression) or isinstance(expression, (ExpressionNegation,
+                                                                             ExpressionWildcardNew)):
+            return None
+        if expression._must_not_be_in_line:
+            # These match rows that don't have the tag.
+            return None
+
+        text = expression.token.text
+        if expression._match_mode == 2:
+            keys = [key for key in self._rows["short"] if key.startswith(text)]
+            if not keys:
+                return np.zeros(0, dtype=np.int64)
+            return np.unique(np.concatenate([self._get_rows("short", key) for key in keys]))
+        if expression._match_mode:
+            return self._get_rows("exact", text)
+        return self._get_rows("term", text)
+
+    def _get_rows(self, kind, key):
+        """ Return the rows for a key of the given kind as a sorted array, remembering the array for reuse. """
+        rows = self._arrays.get((kind, key))
+        if rows is None:
+            rows = np.array(self._rows[kind].get(key, []), dtype=np.int64)
+            self._arrays[(kind, key)] = rows
+        return rows
+
+    def _add_row(self, kind, key, row):
+        row_dict = self._rows[kind]
+        rows = row_dict.get(key)
+        if rows is None:
+            row_dict[key] = [row]
+        elif rows[-1] != row:
+            rows.append(row)
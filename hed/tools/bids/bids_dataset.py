@@ -2,6 +2,7 @@
 
 import os
 import json
+from hed.errors.issue_sinks import as_issue_sink
 from hed.schema.hed_schema import HedSchema
 from hed.schema.hed_schema_io import load_schema_version
 from hed.schema.hed_schema_group import HedSchemaGroup
@@ -66,12 +67,15 @@ class BidsDataset:
         else:
             return None
 
-    def validate(self, types=None, check_for_warnings=True):
+    def validate(self, types=None, check_for_warnings=True, num_workers=1, issue_sink=None):
         """ Validate the specified file group types.
 
         Parameters:
             types (list):  A list of strings indicating the file group types to be validated.
             check_for_warnings (bool):  If True, check for warnings.
+            num_workers (int or None):  Number of processes used to validate the datafiles of each group.
+                                        If 1, validate in this process.  If None, use one process per CPU.
+            issue_sink (IssueSink, function, or None): If given, the issues are sent here instead of returned.
 
         Returns:
             list:  List of issues encountered during validation. Each issue is a dictionary.
@@ -81,10 +85,15 @@ class BidsDataset:
         if not types:
             types = list(self.tabular_files.keys())
         issues = []
+        issue_sink = as_issue_sink(issue_sink)
         for tab_type in types:
+            if issue_sink is not None and issue_sink.done:
+                break
             files = self.tabular_files[tab_type]
-            issues += files.validate_sidecars(self.schema, check_for_warnings=check_for_warnings)
-            issues += files.validate_datafiles(self.schema, check_for_warnings=check_for_warnings)
+            issues += files.validate_sidecars(self.schema, check_for_warnings=check_for_warnings,
+                                              issue_sink=issue_sink)
+            issues += files.validate_datafiles(self.schema, check_for_warnings=check_for_warnings,
+                                               num_workers=num_workers, issue_sink=issue_sink)
         return issues
 
     def get_summary(self):
@@ -1,7 +1,11 @@
 """ A group of BIDS files with specified suffix name. """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from hed.errors.error_reporter import ErrorHandler
+from hed.errors.error_types import ErrorContext
+from hed.models.sidecar import Sidecar
+from hed.models.tabular_input import TabularInput
 from hed.validator.sidecar_validator import SidecarValidator
 from hed.tools.analysis.tabular_summary import TabularSummary
 from hed.tools.bids.bids_tabular_file import BidsTabularFile
@@ -112,30 +116,34 @@ class BidsFileGroup:
         info.update(list(self.datafile_dict.keys()))
         return info
 
-    def validate_sidecars(self, hed_schema, extra_def_dicts=None, check_for_warnings=True):
+    def validate_sidecars(self, hed_schema, extra_def_dicts=None, check_for_warnings=True, issue_sink=None):
         """ Validate merged sidecars.
 
         Parameters:
             hed_schema (HedSchema):  HED schema for validation.
             extra_def_dicts (DefinitionDict): Extra definitions
             check_for_warnings (bool):  If True, include warnings in the check.
+            issue_sink (IssueSink, function, or None): If given, the issues are sent here instead of returned.
 
         Returns:
             list:   A list of validation issues found. Each issue is a dictionary.
 
         """
 
-        error_handler = ErrorHandler(check_for_warnings)
+        error_handler = ErrorHandler(check_for_warnings, issue_sink=issue_sink)
         issues = []
         validator = SidecarValidator(hed_schema)
 
         for sidecar in self.sidecar_dict.values():
+            if error_handler.stop_requested:
+                break
             name = os.path.basename(sidecar.file_path)
             issues += validator.validate(sidecar.contents, extra_def_dicts=extra_def_dicts, name=name,
                                          error_handler=error_handler)
         return issues
 
-    def validate_datafiles(self, hed_schema, extra_def_dicts=None, check_for_warnings=True, keep_contents=False):
+    def validate_datafiles(self, hed_schema, extra_def_dicts=None, check_for_warnings=True, keep_contents=False,
+                           num_workers=1, issue_sink=None):
         """ Validate the datafiles and return an error list.
 
         Parameters:
@@ -143,15 +151,27 @@ class BidsFileGroup:
             extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
             check_for_warnings (bool):  If True, include warnings in the check.
             keep_contents (bool):       If True, the underlying data files are read and their contents retained.
+            num_workers (int or None):  Number of processes to validate with.  If 1, validate in this process.
+                                        If None, use one process per CPU.
+            issue_sink (IssueSink, function, or None): If given, the issues are sent here instead of returned.
 
         Returns:
             list:    A list of validation issues found. Each issue is a dictionary.
 
-        """
+        Notes:
+            - When validating with multiple processes, the schema is sent to each worker once and the issues are
+              returned in the same order as a serial validation.  The HED string and source tag of each issue
+              are replaced by their text.
 
-        error_handler = ErrorHandler(check_for_warnings)
+        """
+        error_handler = ErrorHandler(check_for_warnings, issue_sink=issue_sink)
+        if num_workers != 1 and len(self.datafile_dict) > 1:
+            return self._validate_datafiles_parallel(hed_schema, extra_def_dicts, error_handler,
+                                                     keep_contents, num_workers)
         issues = []
         for data_obj in self.datafile_dict.values():
+            if error_handler.stop_requested:
+                break
             data_obj.set_contents(overwrite=False)
             name = os.path.basename(data_obj.file_path)
             issues += data_obj.contents.validate(hed_schema, extra_def_dicts=extra_def_dicts, name=name,
@@ -160,6 +180,49 @@ class BidsFileGroup:
                 data_obj.clear_contents()
         return issues
 
+    def _validate_datafiles_parallel(self, hed_schema, extra_def_dicts, error_handler, keep_contents,
+                                     num_workers):
+        """ Validate the datafiles using a pool of processes.
+
+        Parameters:
+            hed_schema (HedSchema):  Schema to apply to the validation.
+            extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
+            error_handler (ErrorHandler):  Gives the warning setting and receives the issues of each file in order.
+            keep_contents (bool):       If True, the underlying data files are read and their contents retained.
+            num_workers (int or None):  Number of processes to validate with.
+
+        Returns:
+            list:    A list of validation issues found. Each issue is a dictionary.
+
+        """
+        # Only the JSON of each sidecar is sent to the workers, once each, rather than a Sidecar with every file.
+        # A Sidecar that has been validated holds its definitions and parsed strings, which refer to the schema.
+        tasks = []
+        sidecars = {}
+        for data_obj in self.datafile_dict.values():
+            sidecar_path = None
+            if data_obj.sidecar:
+                sidecar_path = data_obj.sidecar.file_path
+                sidecars[sidecar_path] = (data_obj.sidecar.contents.name, data_obj.sidecar.contents.loaded_dict)
+            tasks.append((data_obj.file_path, sidecar_path))
+
+        issues = []
+        worker_args = (hed_schema, extra_def_dicts, error_handler._check_for_warnings, sidecars)
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_validation_worker,
+                                 initargs=worker_args) as executor:
+            futures = [executor.submit(_validate_datafile_worker, task) for task in tasks]
+            for future in futures:
+                issues += error_handler.report_issues(future.result())
+                if error_handler.stop_requested:
+                    for remaining in futures:
+                        remaining.cancel()
+                    break
+
+        if keep_contents:
+            for data_obj in self.datafile_dict.values():
+                data_obj.set_contents(overwrite=False)
+        return issues
+
     def _make_datafile_dict(self):
         """ Get a dictionary of objects  corresponding to the underlying obj_type with underlying contents unset.
 
@@ -210,3 +273,61 @@ class BidsFileGroup:
                 new_dir_list.append(self.sidecar_dict[os.path.realpath(s_file)])
             sidecar_dir_dict[os.path.realpath(this_dir)] = new_dir_list
         return sidecar_dir_dict
+
+
+_worker_state = {}
+
+
+def _init_validation_worker(hed_schema, extra_def_dicts, check_for_warnings, sidecar_json):
+    """ Store the state shared by every file validated in this worker process.
+
+    Parameters:
+        hed_schema (HedSchema):  Schema to apply to the validation.
+        extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
+        check_for_warnings (bool):  If True, include warnings in the issues.
+        sidecar_json (dict):  The (name, loaded_dict) of each sidecar keyed by its path.
+
+    """
+    _worker_state["hed_schema"] = hed_schema
+    _worker_state["extra_def_dicts"] = extra_def_dicts
+    _worker_state["check_for_warnings"] = check_for_warnings
+    _worker_state["sidecar_json"] = sidecar_json
+    _worker_state["sidecars"] = {}
+
+
+def _get_worker_sidecar(sidecar_path):
+    """ Return the Sidecar for a path, creating it the first time this worker needs it. """
+    sidecar = _worker_state["sidecars"].get(sidecar_path)
+    if sidecar is None:
+        name, loaded_dict = _worker_state["sidecar_json"][sidecar_path]
+        sidecar = Sidecar(files=None, name=name)
+        sidecar.loaded_dict = loaded_dict
+        _worker_state["sidecars"][sidecar_path] = sidecar
+    return sidecar
+
+
+def _validate_datafile_worker(task):
+    """ Validate a single datafile in a worker process.
+
+    Parameters:
+        task (tuple): The (file_path, sidecar_path) of the file to validate.  The sidecar_path may be None.
+
+    Returns:
+        list: The issues found, with the HedString and HedTag references replaced by their text.
+
+    """
+    file_path, sidecar_path = task
+    sidecar = None
+    if sidecar_path:
+        # Reuse the sidecar so its definitions are only extracted once per worker.
+        sidecar = _get_worker_sidecar(sidecar_path)
+    contents = TabularInput(file=file_path, sidecar=sidecar, name=os.path.realpath(file_path))
+    issues = contents.validate(_worker_state["hed_schema"], extra_def_dicts=_worker_state["extra_def_dicts"],
+                               name=os.path.basename(file_path),
+                               error_handler=ErrorHandler(_worker_state["check_for_warnings"]))
+    for issue in issues:
+        if ErrorContext.HED_STRING in issue:
+            issue[ErrorContext.HED_STRING] = issue[ErrorContext.HED_STRING].get_original_hed_string()
+        if 'source_tag' in issue:
+            issue['source_tag'] = str(issue['source_tag'])
+    return issues
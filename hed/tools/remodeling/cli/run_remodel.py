@@ -1,13 +1,20 @@
 """ Main command-line program for running the remodeling tools. """
 
 import os
+import sys
 import json
+import shutil
+import hashlib
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from hed.errors.exceptions import HedFileError
 from hed.tools.util.io_util import get_file_list, get_task_from_file
 from hed.tools.bids.bids_dataset import BidsDataset
 from hed.tools.remodeling.dispatcher import Dispatcher
 from hed.tools.remodeling.backup_manager import BackupManager
+from hed.tools.remodeling.operations.base_summary import BaseSummary
 
 
 def get_parser():
@@ -30,6 +37,9 @@ def get_parser():
                         help="File extensions to allow in locating files.")
     parser.add_argument("-f", "--file-suffix", dest="file_suffix", default='events',
                         help="Filename suffix excluding file type of items to be analyzed (events by default).")
+    parser.add_argument("-in", "--incremental", action='store_true', dest="incremental",
+                        help="If present, files whose contents and operations are unchanged since the last " +
+                             "incremental run are skipped and their stored summaries are reused.")
     parser.add_argument("-i", "--individual-summaries", dest="individual_summaries", default="separate",
                         choices=["separate", "consolidated", "none"],
                         help="Controls individual file summaries ('none', 'separate', 'consolidated')")
@@ -43,6 +53,8 @@ def get_parser():
                         help="If present, the summaries are not saved, but rather discarded.")
     parser.add_argument("-nu", "--no-update", action='store_true', dest="no_update",
                         help="If present, the files are not saved, but rather discarded.")
+    parser.add_argument("-p", "--processes", type=int, default=1, dest="processes",
+                        help="Number of processes to use for the files (0 uses all of the CPUs).")
     parser.add_argument("-r", "--hed-versions", dest="hed_versions", nargs="*", default=[],
                         help="Optional list of HED schema versions used for annotation, include prefixes.")
     parser.add_argument("-s", "--save-formats", nargs="*", default=['.json', '.txt'], dest="save_formats",
@@ -69,6 +81,9 @@ def handle_backup(args):
     Returns:
         str or None:  backup name if there was a backup done.
 
+    Notes:
+        - In incremental mode only the files that are run again are restored (by run_files).
+
     """
     if args.no_backup:
         backup_name = None
@@ -77,7 +92,8 @@ def handle_backup(args):
         if not backup_man.get_backup(args.backup_name):
             raise HedFileError("BackupDoesNotExist", f"Backup {args.backup_name} does not exist. "
                                f"Please run_remodel_backup first", "")
-        backup_man.restore_backup(args.backup_name, args.task_names, verbose=args.verbose)
+        if not getattr(args, 'incremental', False):
+            backup_man.restore_backup(args.backup_name, args.task_names, verbose=args.verbose)
         backup_name = args.backup_name
     return backup_name
 
@@ -133,13 +149,14 @@ def parse_tasks(files, task_args):
     return task_dict
 
 
-def run_bids_ops(dispatch, args, tabular_files):
+def run_bids_ops(dispatch, args, tabular_files, task_name=""):
     """ Run the remodeler on a BIDS dataset.
 
     Parameters:
         dispatch (Dispatcher): Manages the execution of the operations.
         args (Object): The command-line arguments as an object.
         tabular_files (list): List of tabular files to run the ops on.
+        task_name (str): The task these files belong to if tasks are run separately.
 
     """
     bids = BidsDataset(dispatch.data_root, tabular_types=['events'], exclude_dirs=args.exclude_dirs)
@@ -150,26 +167,25 @@ def run_bids_ops(dispatch, args, tabular_files):
     if args.verbose:
         print(f"Processing {dispatch.data_root}")
     filtered_events = [data.datafile_dict[key] for key in tabular_files]
+    file_list = []
     for data_obj in filtered_events:
         sidecar_list = data.get_sidecars_from_path(data_obj)
         if sidecar_list:
             sidecar = data.sidecar_dict[sidecar_list[-1]].contents
         else:
             sidecar = None
-        if args.verbose:
-            print(f"Tabular file {data_obj.file_path}  sidecar {sidecar}")
-        df = dispatch.run_operations(data_obj.file_path, sidecar=sidecar, verbose=args.verbose)
-        if not args.no_update:
-            df.to_csv(data_obj.file_path, sep='\t', index=False, header=True)
+        file_list.append((data_obj.file_path, sidecar))
+    run_files(dispatch, args, file_list, task_name=task_name)
 
 
-def run_direct_ops(dispatch, args, tabular_files):
+def run_direct_ops(dispatch, args, tabular_files, task_name=""):
     """ Run the remodeler on files of a specified form in a directory tree.
 
     Parameters:
         dispatch (Dispatcher):  Controls the application of the operations and backup.
         args (argparse.Namespace): Dictionary of arguments and their values.
         tabular_files (list): List of files to include in this run.
+        task_name (str): The task these files belong to if tasks are run separately.
 
     """
 
@@ -179,12 +195,305 @@ def run_direct_ops(dispatch, args, tabular_files):
         sidecar = args.json_sidecar
     else:
         sidecar = None
-    for file_path in tabular_files:
-        if args.verbose:
-            print(f"Tabular file {file_path}  sidecar {sidecar}")
-        df = dispatch.run_operations(file_path, verbose=args.verbose, sidecar=sidecar)
-        if not args.no_update:
-            df.to_csv(file_path, sep='\t', index=False, header=True)
+    run_files(dispatch, args, [(file_path, sidecar) for file_path in tabular_files], task_name=task_name)
+
+
+def run_files(dispatch, args, file_list, task_name=""):
+    """ Run the operations on a list of files, in parallel and/or incrementally if requested.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        args (argparse.Namespace): Dictionary of arguments and their values.
+        file_list (list): List of (file path, sidecar) tuples to run the operations on.
+        task_name (str): The task these files belong to if tasks are run separately.
+
+    Notes:
+        - The summaries of files run separately are merged into dispatch in the order of file_list,
+          so the results are the same as those of a serial run.
+        - Files are always run serially in a single dispatcher if an operation needs the earlier files.
+          In incremental mode all of the files are then restored from the backup and run again.
+
+    """
+    processes = getattr(args, 'processes', 1)
+    incremental = getattr(args, 'incremental', False)
+    if (processes == 1 and not incremental) or not dispatch.has_independent_files():
+        if args.verbose and (processes != 1 or incremental):
+            print("The operations depend on the order of the files, so the files are run serially in full")
+        for file_path, sidecar in file_list:
+            if incremental:
+                _restore_file(dispatch, file_path)
+            _run_file(dispatch, file_path, sidecar, args.no_update, args.verbose)
+        return
+
+    state_path = None
+    old_state = {}
+    if incremental:
+        state_path = _get_incremental_path(dispatch, args, task_name)
+        old_state = _load_incremental_state(state_path)
+    run_key = _get_run_key(dispatch, args)
+    new_state = {}
+    results = {}
+    to_run = []
+    for file_path, sidecar in file_list:
+        key = [run_key, _get_input_hash(dispatch, file_path), _get_sidecar_hash(sidecar)]
+        entry = old_state.get(file_path)
+        summary_dicts = None
+        if isinstance(entry, dict) and entry.get("key") == key and entry.get("output") == _get_file_hash(file_path):
+            summary_dicts = _summaries_from_state(dispatch, entry.get("summaries"))
+        if summary_dicts is not None:
+            if args.verbose:
+                print(f"Skipping unchanged tabular file {file_path}")
+            results[file_path] = summary_dicts
+            new_state[file_path] = entry
+            continue
+        if incremental:
+            _restore_file(dispatch, file_path)
+        to_run.append((file_path, sidecar))
+        new_state[file_path] = {"key": key}
+
+    if processes == 1 or len(to_run) < 2:
+        run_results = [_run_file_separately(dispatch, file_path, sidecar, args.no_update, args.verbose)
+                       for file_path, sidecar in to_run]
+    else:
+        max_workers = min(processes if processes > 0 else os.cpu_count(), len(to_run))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_remodel_worker,
+                                 initargs=(dispatch, args.no_update, args.verbose)) as executor:
+            run_results = list(executor.map(_run_remodel_worker, to_run))
+    for (file_path, sidecar), summary_dicts in zip(to_run, run_results):
+        results[file_path] = summary_dicts
+        if incremental:
+            new_state[file_path].update({"output": _get_file_hash(file_path),
+                                         "summaries": _summaries_to_state(summary_dicts)})
+
+    for file_path, sidecar in file_list:
+        dispatch.merge_summaries(results[file_path])
+    if incremental:
+        _save_incremental_state(state_path, new_state)
+
+
+def _run_file(dispatch, file_path, sidecar, no_update, verbose):
+    """ Run the operations on one file and save the result unless no_update is True. """
+    if verbose:
+        print(f"Tabular file {file_path}  sidecar {sidecar}")
+    df = dispatch.run_operations(file_path, sidecar=sidecar, verbose=verbose)
+    if not no_update:
+        df.to_csv(file_path, sep='\t', index=False, header=True)
+
+
+def _restore_file(dispatch, file_path):
+    """ Copy the backup of a file over it if there is a backup. """
+    if dispatch.backup_man:
+        shutil.copy(dispatch.backup_man.get_backup_path(dispatch.backup_name, file_path), file_path)
+
+
+def _run_file_separately(dispatch, file_path, sidecar, no_update, verbose):
+    """ Run the operations on one file and return the summaries of this file alone. """
+    summary_dicts = dispatch.summary_dicts
+    dispatch.summary_dicts = {}
+    try:
+        _run_file(dispatch, file_path, sidecar, no_update, verbose)
+        return dispatch.summary_dicts
+    finally:
+        dispatch.summary_dicts = summary_dicts
+
+
+_worker_state = {}
+
+
+def _init_remodel_worker(dispatch, no_update, verbose):
+    """ Keep the dispatcher for the files run in this worker process. """
+    _worker_state["args"] = (dispatch, no_update, verbose)
+
+
+def _run_remodel_worker(file_item):
+    """ Run the operations on one (file path, sidecar) tuple in a worker process. """
+    dispatch, no_update, verbose = _worker_state["args"]
+    return _run_file_separately(dispatch, file_item[0], file_item[1], no_update, verbose)
+
+
+def _get_incremental_path(dispatch, args, task_name):
+    """ Return the path of the file holding the state of the last incremental run. """
+    if args.work_dir:
+        remodel_dir = os.path.realpath(os.path.join(args.work_dir, 'remodel'))
+    else:
+        remodel_dir = os.path.realpath(os.path.join(dispatch.data_root, 'derivatives', 'remodel'))
+    base_name = os.path.splitext(os.path.basename(args.model_path))[0]
+    if task_name:
+        base_name = base_name + '_' + task_name
+    return os.path.join(remodel_dir, 'incremental', base_name + '.json')
+
+
+def _load_incremental_state(state_path):
+    """ Return the state of the last incremental run or an empty dictionary if it cannot be read. """
+    try:
+        with open(state_path, 'r') as fp:
+            state = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_incremental_state(state_path, state):
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    with open(state_path, 'w') as fp:
+        json.dump(state, fp)
+
+
+def _summaries_to_state(summary_dicts):
+    """ Return the summaries of one file in a form that can be saved as JSON or None if they can't be saved. """
+    try:
+        return {name: {"class": type(summary).__name__, "summary_dict": _to_json(summary.summary_dict)}
+                for name, summary in summary_dicts.items()}
+    except TypeError:
+        return None
+
+
+def _summaries_from_state(dispatch, saved):
+    """ Return the summaries of one file saved by _summaries_to_state or None if they can't be rebuilt.
+
+    Notes:
+        - Each summary is made by its operation in dispatch, and only the classes in the saved per-file
+          summaries are taken from the state, so nothing in the dataset can run code.
+
+    """
+    if not isinstance(saved, dict):
+        return None
+    operations = {getattr(operation, 'summary_name', None): operation for operation in dispatch.parsed_ops}
+    summary_classes = _get_summary_classes()
+    summary_dicts = {}
+    try:
+        for name, item in saved.items():
+            summary = summary_classes[item["class"]](operations[name])
+            summary.summary_dict = _from_json(item["summary_dict"])
+            summary_dicts[name] = summary
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+    return summary_dicts
+
+
+def _get_summary_classes():
+    """ Return the subclasses of BaseSummary keyed by class name. """
+    summary_classes = {}
+    classes = [BaseSummary]
+    while classes:
+        summary_class = classes.pop()
+        summary_classes[summary_class.__name__] = summary_class
+        classes.extend(summary_class.__subclasses__())
+    return summary_classes
+
+
+_STATE_OBJECT_MODULE = "hed.tools.analysis."
+
+
+def _to_json(value):
+    """ Return a copy of value that can be saved as JSON, with its containers and analysis objects tagged.
+
+    Parameters:
+        value (object): Python containers, numbers, strings, numpy arrays and objects of hed.tools.analysis classes.
+
+    Returns:
+        object: The value in a form that _from_json turns back into a copy of value.
+
+    :raises TypeError:
+        - If value holds anything else.
+
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_to_json(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_to_json(item) for item in value]}
+    if isinstance(value, Counter):
+        return {"__counter__": _to_json(dict(value))}
+    if type(value) is dict:
+        if all(isinstance(key, str) and not key.startswith("__") for key in value):
+            return {key: _to_json(item) for key, item in value.items()}
+        return {"__items__": [[_to_json(key), _to_json(item)] for key, item in value.items()]}
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": _to_json(value.tolist()), "dtype": value.dtype.str, "shape": list(value.shape)}
+    value_type = type(value)
+    if value_type.__module__.startswith(_STATE_OBJECT_MODULE) and hasattr(value, '__dict__'):
+        return {"__object__": [value_type.__module__, value_type.__qualname__], "state": _to_json(vars(value))}
+    raise TypeError(f"{value_type.__name__} values can't be saved in the incremental state")
+
+
+def _from_json(value):
+    """ Return the value saved by _to_json.
+
+    Parameters:
+        value (object): The value as loaded from JSON.
+
+    Returns:
+        object: A copy of the value passed to _to_json.
+
+    :raises ValueError:
+        - If an object is not of a hed.tools.analysis class that is already loaded.
+
+    """
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__tuple__" in value:
+        return tuple(_from_json(item) for item in value["__tuple__"])
+    if "__set__" in value:
+        return set(_from_json(item) for item in value["__set__"])
+    if "__counter__" in value:
+        return Counter(_from_json(value["__counter__"]))
+    if "__items__" in value:
+        return {_from_json(key): _from_json(item) for key, item in value["__items__"]}
+    if "__ndarray__" in value:
+        return np.array(_from_json(value["__ndarray__"]), dtype=value["dtype"]).reshape(value["shape"])
+    if "__object__" in value:
+        module_name, class_name = value["__object__"]
+        module = sys.modules.get(module_name) if module_name.startswith(_STATE_OBJECT_MODULE) else None
+        object_class = getattr(module, class_name, None)
+        if not isinstance(object_class, type) or object_class.__module__ != module_name:
+            raise ValueError(f"{module_name}.{class_name} is not an analysis class")
+        new_object = object_class.__new__(object_class)
+        new_object.__dict__.update(_from_json(value["state"]))
+        return new_object
+    return {key: _from_json(item) for key, item in value.items()}
+
+
+def _get_run_key(dispatch, args):
+    """ Return a hash of everything other than the file and sidecar that determines the results of a file. """
+    hasher = hashlib.sha256()
+    with open(args.model_path, 'rb') as fp:
+        hasher.update(fp.read())
+    if dispatch.hed_schema:
+        hasher.update(str(dispatch.hed_schema.get_schema_versions()).encode('utf-8'))
+    hasher.update(str(args.no_update).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _get_input_hash(dispatch, file_path):
+    """ Return a hash of the file the operations read for file_path (the backup if there is one). """
+    if dispatch.backup_man:
+        return _get_file_hash(dispatch.backup_man.get_backup_path(dispatch.backup_name, file_path))
+    return _get_file_hash(file_path)
+
+
+def _get_sidecar_hash(sidecar):
+    if sidecar is None:
+        return None
+    if isinstance(sidecar, str):
+        return _get_file_hash(sidecar)
+    return hashlib.sha256(json.dumps(sidecar.loaded_dict, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _get_file_hash(file_path):
+    """ Return the sha256 hash of the contents of a file or None if it cannot be read. """
+    try:
+        with open(file_path, 'rb') as fp:
+            return hashlib.sha256(fp.read()).hexdigest()
+    except OSError:
+        return None
 
 
 def main(arg_list=None):
@@ -213,9 +522,9 @@ def main(arg_list=None):
         dispatch = Dispatcher(operations, data_root=args.data_dir, backup_name=backup_name,
                               hed_versions=args.hed_versions)
         if args.use_bids:
-            run_bids_ops(dispatch, args, files)
+            run_bids_ops(dispatch, args, files, task_name=task)
         else:
-            run_direct_ops(dispatch, args, files)
+            run_direct_ops(dispatch, args, files, task_name=task)
         if not args.no_summaries:
             dispatch.save_summaries(args.save_formats, individual_summaries=args.individual_summaries, 
                                     summary_dir=save_dir, task_name=task)
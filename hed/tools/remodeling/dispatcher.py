@@ -1,12 +1,17 @@
 """ Controller for applying operations to tabular files and saving the results. """
 
 import os
+import copy
+import hashlib
 import numpy as np
 import pandas as pd
 import json
 from hed.errors.exceptions import HedFileError
+from hed.models.sidecar import Sidecar
+from hed.models.tabular_input import TabularInput
 from hed.schema.hed_schema_io import load_schema_version
 from hed.schema import HedSchema, HedSchemaGroup
+from hed.tools.analysis.event_manager import EventManager
 from hed.tools.remodeling.backup_manager import BackupManager
 from hed.tools.remodeling.operations.valid_operations import valid_operations
 from hed.tools.util.io_util import clean_filename, extract_suffix_path, get_timestamp
@@ -49,6 +54,7 @@ class Dispatcher:
         self.parsed_ops = op_list
         self.hed_schema = self.get_schema(hed_versions)
         self.summary_dicts = {}
+        self._hed_cache = {}  # TabularInputs and EventManagers for the file being run, shared by its operations.
 
     def get_summaries(self, file_formats=['.txt', '.json']):
         """ Return the summaries in a dictionary of strings suitable for saving or archiving.
@@ -148,12 +154,96 @@ class Dispatcher:
         if verbose:
             print(f"Reading {file_path}...")
         df = self.get_data_file(file_path)
+        self._hed_cache = {}
         for operation in self.parsed_ops:
             df = self.prep_data(df)
             df = operation.do_op(self, df, file_path, sidecar=sidecar)
             df = self.post_proc_data(df)
         return df
 
+    def get_tabular_input(self, df, name, sidecar=None):
+        """ Return a TabularInput for the data, reusing one made by an earlier operation on the same data.
+
+        Parameters:
+            df (DataFrame): The data as it is passed to the summary (with n/a for missing values).
+            name (str): Unique identifier for the dataframe -- often the original file path.
+            sidecar (Sidecar or file-like):  The sidecar for the data if any.
+
+        Returns:
+            TabularInput:  The data and sidecar.  It is shared by the operations and must not be modified.
+
+        Notes:
+            - Objects are cached by a hash of the data, the sidecar and the schema version while a file is run.
+
+        """
+        key = ("tabular", self._get_cache_key(df, name, sidecar))
+        tabular_input = self._hed_cache.get(key)
+        if tabular_input is None:
+            if sidecar and not isinstance(sidecar, Sidecar):
+                sidecar = Sidecar(sidecar)
+            tabular_input = TabularInput(df, sidecar=sidecar, name=name)
+            self._hed_cache[key] = tabular_input
+        return tabular_input
+
+    def get_event_manager(self, df, name, sidecar=None):
+        """ Return an EventManager for the data, reusing one made by an earlier operation on the same data.
+
+        Parameters:
+            df (DataFrame): The data as it is passed to the summary (with n/a for missing values).
+            name (str): Unique identifier for the dataframe -- often the original file path.
+            sidecar (Sidecar or file-like):  The sidecar for the data if any.
+
+        Returns:
+            EventManager:  The events of the data.  It is shared by the operations and must not be modified.
+
+        """
+        key = ("events", self._get_cache_key(df, name, sidecar))
+        event_manager = self._hed_cache.get(key)
+        if event_manager is None:
+            event_manager = EventManager(self.get_tabular_input(df, name, sidecar), self.hed_schema)
+            self._hed_cache[key] = event_manager
+        return event_manager
+
+    def _get_cache_key(self, df, name, sidecar):
+        """ Return a key identifying the contents of the data and the sidecar and the schema version. """
+        data_hash = hashlib.sha256(str(list(df.columns)).encode('utf-8'))
+        data_hash.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        if isinstance(sidecar, Sidecar):
+            sidecar_key = hashlib.sha256(json.dumps(sidecar.loaded_dict, sort_keys=True).encode('utf-8')).hexdigest()
+        elif sidecar is None or isinstance(sidecar, str):
+            sidecar_key = sidecar
+        else:
+            sidecar_key = id(sidecar)
+        schema_key = str(self.hed_schema.get_schema_versions()) if self.hed_schema else None
+        return data_hash.hexdigest(), name, sidecar_key, schema_key
+
+    def has_independent_files(self):
+        """ Return True if each file can be run separately and the summaries merged afterwards.
+
+        Returns:
+            bool:  False if any operation's results for a file depend on the files processed before it.
+
+        """
+        return all(operation.INDEPENDENT_FILES for operation in self.parsed_ops)
+
+    def merge_summaries(self, summary_dicts):
+        """ Add summaries produced by running the operations separately on other files.
+
+        Parameters:
+            summary_dicts (dict):  The summary_dicts of a dispatcher that ran these operations on other files.
+
+        Notes:
+            - The summaries passed in are not modified.
+
+        """
+        for summary_name, summary_item in summary_dicts.items():
+            if summary_name in self.summary_dicts:
+                self.summary_dicts[summary_name].merge_summary(summary_item)
+            else:
+                new_summary = copy.copy(summary_item)
+                new_summary.summary_dict = dict(summary_item.summary_dict)
+                self.summary_dicts[summary_name] = new_summary
+
     def save_summaries(self, save_formats=['.json', '.txt'], individual_summaries="separate",
                        summary_dir=None, task_name=""):
         """ Save the summary files in the specified formats.
@@ -8,6 +8,10 @@ class BaseOp:
 
     """
 
+    # False if the operation's results for a file can depend on the files processed before it.
+    # Files are then always processed in order by a single dispatcher rather than separately.
+    INDEPENDENT_FILES = True
+
     def __init__(self, op_spec, parameters):
         """ Base class constructor for operations.
 
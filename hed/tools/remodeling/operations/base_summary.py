@@ -21,6 +21,20 @@ class BaseSummary(ABC):
         self.op = sum_op
         self.summary_dict = {}
 
+    def merge_summary(self, other):
+        """ Add the individual file summaries from another summary of the same operation.
+
+        Parameters:
+            other (BaseSummary):  A summary produced by the same operation on other files.
+
+        Notes:
+            - This is used to combine summaries of files that were processed separately.
+            - Operations whose summaries have information beyond the individual file summaries must set
+              INDEPENDENT_FILES to False, so their files are never processed separately.
+
+        """
+        self.summary_dict.update(other.summary_dict)
+
     def get_summary_details(self, include_individual=True):
         """ Return a dictionary with the details for individual files and the overall dataset.
 
@@ -1,5 +1,6 @@
 """ Merge consecutive rows with same column value. """
 
+import numpy as np
 import pandas as pd
 from hed.tools.remodeling.operations.base_op import BaseOp
 
@@ -99,49 +100,53 @@ class MergeConsecutiveOp(BaseOp):
         match_columns.append(self.column_name)
         match_df = df_new.loc[:, match_columns]
         remove_groups = self._get_remove_groups(match_df, code_mask)
-        if self.set_durations and max(remove_groups) > 0:
+        if self.set_durations and remove_groups.any():
             self._update_durations(df_new, remove_groups)
-        keep_mask = [remove_group == 0 for remove_group in remove_groups]
-        df_new = df_new.loc[keep_mask, :].reset_index(drop=True)
+        df_new = df_new.loc[remove_groups == 0, :].reset_index(drop=True)
         return df_new
 
     @staticmethod
     def _get_remove_groups(match_df, code_mask):
-        """ Return a list of same length as match_df with group numbers of consecutive items.
+        """ Return an array of same length as match_df with group numbers of consecutive items.
 
         Parameters:
             match_df (DataFrame): DataFrame containing columns to be matched.
             code_mask (DataSeries):  Same length as match_df with the names.
 
         Returns:
-            list:  Group numbers set (starting at 1).
+            numpy.ndarray:  Group numbers (starting at 1) of the rows to remove and 0 for the rows to keep.
+
+        Notes:
+            - A row is removed if it and the row before it have the event code and they agree in all match columns.
+            - Each row with the event code that is kept starts a new group.
 
         # TODO: Handle round off in rows for comparison.
         """
-        in_group = False
-        remove_groups = [0] * len(match_df)
-        group_count = 0
-        for index, row in match_df.iterrows():
-            if not code_mask.iloc[index]:
-                in_group = False
-                continue
-            elif not in_group:
-                in_group = True
-                group_count += 1
-                continue
-            if in_group and row.equals(match_df.loc[index - 1, :]):
-                remove_groups[index] = group_count
-            else:
-                group_count += 1
-        return remove_groups
+        codes = np.asarray(code_mask, dtype=bool)
+        same_as_previous = np.zeros(len(codes), dtype=bool)
+        same_as_previous[1:] = codes[1:] & codes[:-1]
+        for column in match_df.columns:
+            values = match_df[column].to_numpy()
+            missing = pd.isna(values)
+            same_as_previous[1:] &= (values[1:] == values[:-1]) | (missing[1:] & missing[:-1])
+        group_starts = codes & ~same_as_previous
+        return np.where(same_as_previous, np.cumsum(group_starts), 0)
 
     @staticmethod
     def _update_durations(df_new, remove_groups):
-        remove_df = pd.DataFrame(remove_groups, columns=["remove"])
-        max_groups = max(remove_groups)
-        for index in range(max_groups):
-            df_group = df_new.loc[remove_df["remove"] == index + 1, ["onset", "duration"]]
-            max_group = df_group.sum(axis=1, skipna=True).max()
-            anchor = df_group.index[0] - 1
-            max_anchor = df_new.loc[anchor, ["onset", "duration"]].sum(skipna=True).max()
-            df_new.loc[anchor, "duration"] = max(max_group, max_anchor) - df_new.loc[anchor, "onset"]
+        """ Extend the duration of the row starting each group to the latest end of the rows removed from it.
+
+        Parameters:
+            df_new (DataFrame): The DataFrame whose duration column is updated in place.
+            remove_groups (numpy.ndarray): The group numbers of the rows to be removed (0 for rows to keep).
+
+        """
+        removed = np.flatnonzero(remove_groups)
+        ends = df_new[["onset", "duration"]].sum(axis=1, skipna=True).to_numpy()
+        _, first_removed = np.unique(remove_groups[removed], return_index=True)
+        anchors = removed[first_removed] - 1
+        group_ends = pd.Series(ends[removed]).groupby(remove_groups[removed]).max().to_numpy()
+        group_ends = np.maximum(group_ends, ends[anchors])
+        duration_column = df_new.columns.get_loc("duration")
+        onsets = df_new["onset"].to_numpy()[anchors]
+        df_new.iloc[anchors, duration_column] = group_ends - onsets
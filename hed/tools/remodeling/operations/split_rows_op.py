@@ -71,7 +71,7 @@ class SplitRowsOp(BaseOp):
             df_list = [df_new]
         self._split_rows(df, df_list)
         df_ret = pd.concat(df_list, axis=0, ignore_index=True)
-        df_ret["onset"] = df_ret["onset"].apply(pd.to_numeric)
+        df_ret["onset"] = pd.to_numeric(df_ret["onset"])
         df_ret = df_ret.sort_values('onset').reset_index(drop=True)
         return df_ret
 
@@ -83,30 +83,45 @@ class SplitRowsOp(BaseOp):
             df_list (list):  The list of split events and possibly the
 
         """
+        columns = list(df.columns)
+        if self.anchor_column not in columns:
+            columns.append(self.anchor_column)
+        empty = pd.Series(np.nan, index=df.index, dtype=object)
         for event, event_parms in self.new_events.items():
-            add_events = pd.DataFrame([], columns=df.columns)
-            add_events['onset'] = self._create_onsets(df, event_parms['onset_source'])
-            add_events[self.anchor_column] = event
-            self._add_durations(df, add_events, event_parms['duration'])
-            if len(event_parms['copy_columns']) > 0:
-                for column in event_parms['copy_columns']:
-                    add_events[column] = df[column]
-
-            # add_events['event_type'] = event
-            add_events = add_events.dropna(axis='rows', subset=['onset'])
-            df_list.append(add_events)
+            new_columns = {column: empty for column in columns}
+            new_columns['onset'] = self._create_onsets(df, event_parms['onset_source'])
+            new_columns[self.anchor_column] = pd.Series(event, index=df.index)
+            new_columns['duration'] = self._get_durations(df, event_parms['duration'])
+            for column in event_parms['copy_columns']:
+                new_columns[column] = df[column]
+            add_events = pd.DataFrame(new_columns, index=df.index, columns=columns)
+            df_list.append(add_events[add_events['onset'].notna()])
 
     @staticmethod
-    def _add_durations(df, add_events, duration_sources):
-        add_events['duration'] = 0
+    def _get_durations(df, duration_sources):
+        """ Create a vector of durations for the new events.
+
+        Parameters:
+            df (DataFrame):  The dataframe to process.
+            duration_sources (list):  List of numbers and column names whose values are added.
+
+        Returns:
+            Series:  Series of same length as df with the durations.
+
+        :raises TypeError:
+            - If one of the duration specifiers is invalid.
+
+        """
+        durations = pd.Series(0, index=df.index)
         for duration in duration_sources:
             if isinstance(duration, float) or isinstance(duration, int):
-                add_events['duration'] = add_events['duration'].add(duration)
-            elif isinstance(duration, str) and duration in list(df.columns):
-                add_events['duration'] = add_events['duration'].add(pd.to_numeric(df[duration], errors='coerce'))
+                durations = durations + duration
+            elif isinstance(duration, str) and duration in df.columns:
+                durations = durations.add(pd.to_numeric(df[duration], errors='coerce'))
             else:
                 raise TypeError("BadDurationInModel",
                                 f"Remodeling duration {str(duration)} must either be numeric or a column name", "")
+        return durations
 
     @staticmethod
     def _create_onsets(df, onset_source):
@@ -128,7 +143,7 @@ class SplitRowsOp(BaseOp):
         for onset in onset_source:
             if isinstance(onset, float) or isinstance(onset, int):
                 onsets = onsets + onset
-            elif isinstance(onset, str) and onset in list(df.columns):
+            elif isinstance(onset, str) and onset in df.columns:
                 onsets = onsets.add(pd.to_numeric(df[onset], errors='coerce'))
             else:
                 raise TypeError("BadOnsetInModel",
@@ -30,6 +30,9 @@ class SummarizeDefinitionsOp(BaseOp):
 
     SUMMARY_TYPE = 'type_defs'
 
+    # Definitions gathered from earlier files are used to resolve the definitions in later ones.
+    INDEPENDENT_FILES = False
+
     def __init__(self, parameters):
         """ Constructor for the summarize column values operation.
 
@@ -67,8 +70,9 @@ class SummarizeDefinitionsOp(BaseOp):
         df_new = df.copy()
         summary = dispatcher.summary_dicts.setdefault(self.summary_name,
                                                       DefinitionSummary(self, dispatcher.hed_schema))
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name, 'sidecar': sidecar,
-                                'schema': dispatcher.hed_schema})
+        df_post = dispatcher.post_proc_data(df_new)
+        summary.update_summary({'df': df_post, 'name': name, 'sidecar': sidecar, 'schema': dispatcher.hed_schema,
+                                'tabular_input': dispatcher.get_tabular_input(df_post, name, sidecar)})
         return df_new
 
 
@@ -85,9 +89,12 @@ class DefinitionSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema" and a "Sidecar".
+            - A "tabular_input" for the df, if given, is used rather than making a new one.
 
         """
-        data_input = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
+        data_input = new_info.get('tabular_input')
+        if data_input is None:
+            data_input = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
         series, def_dict = data_input.series_a, data_input.get_def_dict(new_info['schema'])
         self.def_gatherer.process_def_expands(series, def_dict)
 
@@ -87,10 +87,9 @@ class SummarizeHedTagsOp(BaseOp):
         if not summary:
             summary = HedTagSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
-        x = {'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar}
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
+        df_post = dispatcher.post_proc_data(df_new)
+        summary.update_summary({'df': df_post, 'name': name, 'schema': dispatcher.hed_schema, 'sidecar': sidecar,
+                                'event_manager': dispatcher.get_event_manager(df_post, name, sidecar)})
         return df_new
 
 
@@ -108,16 +107,18 @@ class HedTagSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - An "event_manager" for the df, if given, is used rather than making a new one.
 
         """
         counts = HedTagCounts(new_info['name'], total_events=len(new_info['df']))
-        input_data = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
-        tag_man = HedTagManager(EventManager(input_data, new_info['schema']), 
-                                remove_types=self.sum_op.remove_types)
+        event_manager = new_info.get('event_manager')
+        if event_manager is None:
+            input_data = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
+            event_manager = EventManager(input_data, new_info['schema'])
+        tag_man = HedTagManager(event_manager, remove_types=self.sum_op.remove_types)
         hed_objs = tag_man.get_hed_objs(include_context=self.sum_op.include_context, 
                                         replace_defs=self.sum_op.replace_defs)
-        for hed in hed_objs:
-            counts.update_event_counts(hed, new_info['name'])
+        counts.update_counts(hed_objs, new_info['name'])
         self.summary_dict[new_info["name"]] = counts
 
     def get_details_dict(self, tag_counts):
@@ -170,10 +171,7 @@ class HedTagSummary(BaseSummary):
 
         all_counts = HedTagCounts('Dataset')
         for key, counts in self.summary_dict.items():
-            all_counts.merge_tag_dicts(counts.tag_dict)
-            for file_name in counts.files.keys():
-                all_counts.files[file_name] = ""
-            all_counts.total_events = all_counts.total_events + counts.total_events
+            all_counts.merge(counts)
         return all_counts
 
     @staticmethod
@@ -77,8 +77,9 @@ class SummarizeHedTypeOp(BaseOp):
         if not summary:
             summary = HedTypeSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
+        df_post = dispatcher.post_proc_data(df_new)
+        summary.update_summary({'df': df_post, 'name': name, 'schema': dispatcher.hed_schema, 'sidecar': sidecar,
+                                'event_manager': dispatcher.get_event_manager(df_post, name, sidecar)})
         return df_new
 
 
@@ -96,14 +97,18 @@ class HedTypeSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - An "event_manager" for the df, if given, is used rather than making a new one.
 
         """
 
-        sidecar = new_info['sidecar']
-        if sidecar and not isinstance(sidecar, Sidecar):
-            sidecar = Sidecar(sidecar)
-        input_data = TabularInput(new_info['df'], sidecar=sidecar, name=new_info['name'])
-        type_values = HedType(EventManager(input_data, new_info['schema']), new_info['name'], type_tag=self.type_tag)
+        event_manager = new_info.get('event_manager')
+        if event_manager is None:
+            sidecar = new_info['sidecar']
+            if sidecar and not isinstance(sidecar, Sidecar):
+                sidecar = Sidecar(sidecar)
+            input_data = TabularInput(new_info['df'], sidecar=sidecar, name=new_info['name'])
+            event_manager = EventManager(input_data, new_info['schema'])
+        type_values = HedType(event_manager, new_info['name'], type_tag=self.type_tag)
         counts = HedTypeCounts(new_info['name'], self.type_tag)
         counts.update_summary(type_values.get_summary(), type_values.total_events, new_info['name'])
         counts.add_descriptions(type_values.type_defs)
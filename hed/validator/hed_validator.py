@@ -6,7 +6,7 @@ the get_validation_issues() function.
 """
 
 from hed.errors.error_types import ValidationErrors, DefinitionErrors
-from hed.errors.error_reporter import ErrorHandler, check_for_any_errors
+from hed.errors.error_reporter import ErrorHandler, check_for_any_errors, skip_error_messages
 
 from hed.models.hed_string import HedString
 from hed.models import HedTag
@@ -55,6 +55,23 @@ class HedValidator:
         error_handler.add_context_and_filter(issues)
         return issues
 
+    def is_valid(self, hed_string, allow_placeholders=False):
+        """ Return True if the string has no errors, stopping at the first check that finds one.
+
+        Parameters:
+            hed_string(HedString): the string to validate
+            allow_placeholders(bool): allow placeholders in the string
+        Returns:
+            bool: True if there are no errors.  Warnings are ignored.
+
+        Notes:
+            - This is much faster than validate for invalid strings, as no error messages are formatted.
+        """
+        with skip_error_messages():
+            if check_for_any_errors(self.run_basic_checks(hed_string, allow_placeholders=allow_placeholders)):
+                return False
+            return not check_for_any_errors(self.run_full_string_checks(hed_string))
+
     def run_basic_checks(self, hed_string, allow_placeholders):
         issues = []
         issues += self._tag_validator.run_hed_string_validators(hed_string, allow_placeholders)
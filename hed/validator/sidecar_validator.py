@@ -7,7 +7,8 @@ from hed import Sidecar
 from hed.models.column_metadata import ColumnMetadata
 from hed.errors.error_reporter import sort_issues
 from hed.models.model_constants import DefTagNames
-from hed.errors.error_reporter import check_for_any_errors
+from hed.errors.error_reporter import check_for_any_errors, skip_error_messages
+from hed.errors.issue_sinks import FirstErrorsIssueSink
 
 
 # todo: Add/improve validation for definitions being in known columns(right now it just assumes they aren't)
@@ -34,6 +35,9 @@ class SidecarValidator:
             error_handler (ErrorHandler): Error context to use.  Creates a new one if None
         Returns:
             issues (list of dict): A list of issues associated with each level in the HED string.
+
+        Notes:
+            - If error_handler has an issue sink, the issues go to the sink as they are found and are not returned.
         """
         from hed.validator import HedValidator
         issues = []
@@ -41,11 +45,12 @@ class SidecarValidator:
             error_handler = ErrorHandler()
 
         error_handler.push_error_context(ErrorContext.FILE_NAME, name)
-        issues += self.validate_structure(sidecar, error_handler=error_handler)
-        issues += self._validate_refs(sidecar, error_handler)
+        structure_issues = self.validate_structure(sidecar, error_handler=error_handler)
+        structure_issues += self._validate_refs(sidecar, error_handler)
+        issues += error_handler.report_issues(structure_issues)
 
         # only allowed early out, something is very wrong with structure or refs
-        if check_for_any_errors(issues):
+        if check_for_any_errors(structure_issues) or error_handler.stop_requested:
             error_handler.pop_error_context()
             return issues
         sidecar_def_dict = sidecar.get_def_dict(hed_schema=self._schema, extra_def_dicts=extra_def_dicts)
@@ -53,11 +58,12 @@ class SidecarValidator:
                                      def_dicts=sidecar_def_dict,
                                      definitions_allowed=True)
 
-        issues += sidecar._extract_definition_issues
-        issues += sidecar_def_dict.issues
+        issues += error_handler.report_issues(sidecar._extract_definition_issues + sidecar_def_dict.issues)
 
         definition_checks = {}
         for column_data in sidecar:
+            if error_handler.stop_requested:
+                break
             column_name = column_data.column_name
             column_data = column_data._get_unvalidated_data()
             hed_strings = column_data.get_hed_strings()
@@ -83,14 +89,36 @@ class SidecarValidator:
                 if len(hed_strings) > 1:
                     error_handler.pop_error_context()
                 error_handler.add_context_and_filter(new_issues)
-                issues += new_issues
+                issues += error_handler.report_issues(new_issues)
+                if error_handler.stop_requested:
+                    break
             error_handler.pop_error_context()
         error_handler.pop_error_context()
-        issues += self._check_definitions_bad_spot(definition_checks, error_handler)
+        if not error_handler.stop_requested:
+            issues += error_handler.report_issues(self._check_definitions_bad_spot(definition_checks, error_handler))
         issues = sort_issues(issues)
 
         return issues
 
+    def is_valid(self, sidecar, extra_def_dicts=None):
+        """Return True if the sidecar has no errors, stopping at the first HED string with an error.
+
+        Parameters:
+            sidecar (Sidecar): Input data to be checked.
+            extra_def_dicts(list or DefinitionDict): extra def dicts in addition to sidecar
+        Returns:
+            bool: True if there are no errors.  Warnings are ignored.
+
+        Notes:
+            - No error messages are formatted, so this is much faster than validate for invalid sidecars.
+        """
+        # The sidecar keeps its definitions and their issues, so extract them with their messages.
+        sidecar.get_def_dict(hed_schema=self._schema)
+        sink = FirstErrorsIssueSink(max_errors=1, keep_warnings=False)
+        with skip_error_messages():
+            self.validate(sidecar, extra_def_dicts=extra_def_dicts, error_handler=ErrorHandler(False, issue_sink=sink))
+        return sink.error_count == 0
+
     def validate_structure(self, sidecar, error_handler):
         """ Validate the raw structure of this sidecar.
 
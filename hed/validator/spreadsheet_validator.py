@@ -4,7 +4,9 @@ from hed.errors import ErrorHandler, ValidationErrors, ErrorContext
 from hed.errors.error_types import ColumnErrors
 from hed.models import ColumnType
 from hed import HedString
-from hed.errors.error_reporter import sort_issues, check_for_any_errors
+from hed.models.hed_string_cache import get_hed_string, copy_hed_tree
+from hed.errors.error_reporter import sort_issues, check_for_any_errors, skip_error_messages
+from hed.errors.issue_sinks import FirstErrorsIssueSink
 from hed.validator.onset_validator import OnsetValidator
 from hed.validator.hed_validator import HedValidator
 
@@ -12,14 +14,17 @@ PANDAS_COLUMN_PREFIX_TO_IGNORE = "Unnamed: "
 
 
 class SpreadsheetValidator:
-    def __init__(self, hed_schema):
+    def __init__(self, hed_schema, deduplicate=False):
         """
         Constructor for the HedValidator class.
 
         Parameters:
             hed_schema (HedSchema): HED schema object to use for validation.
+            deduplicate (bool): If True, run the basic checks only once per unique value in each column.
+                                The issues found are reported for every row containing that value.
         """
         self._schema = hed_schema
+        self._deduplicate = deduplicate
         self._hed_validator = None
         self._onset_validator = None
 
@@ -35,23 +40,80 @@ class SpreadsheetValidator:
             error_handler (ErrorHandler): Error context to use.  Creates a new one if None
         Returns:
             issues (list of dict): A list of issues for hed string
+
+        Notes:
+            - If error_handler has an issue sink, the issues go to the sink a row at a time and are not returned.
+              Validation stops after the row in which the sink asks to stop.
         """
+        if error_handler is None:
+            error_handler = ErrorHandler()
 
-        issues = []
+        self._hed_validator = HedValidator(self._schema, def_dicts=def_dicts)
+        self._onset_validator = OnsetValidator()
+        return self._validate_data(data, name, error_handler)
+
+    def is_valid(self, data, def_dicts=None):
+        """
+        Return True if the input data has no errors, stopping after the first row with an error.
+
+        Parameters:
+            data (BaseInput or pd.DataFrame): Input data to be checked.
+                If a dataframe, it is assumed to be assembled already.
+            def_dicts(list of DefDict or DefDict): all definitions to use for validation
+        Returns:
+            bool: True if there are no errors.  Warnings are ignored.
+
+        Notes:
+            - No error messages are formatted, so this is much faster than validate for invalid data.
+        """
+        sink = FirstErrorsIssueSink(max_errors=1, keep_warnings=False)
+        with skip_error_messages():
+            self.validate(data, def_dicts=def_dicts, error_handler=ErrorHandler(False, issue_sink=sink))
+        return sink.error_count == 0
+
+    def iter_validate(self, chunks, def_dicts=None, name=None, error_handler=None):
+        """
+        Validate a file one chunk at a time, such as the chunks from TabularInput.iter_chunks.
+
+        Parameters:
+            chunks (iterable of BaseInput): The consecutive chunks of a single file.
+            def_dicts(list of DefDict or DefDict): all definitions to use for validation
+            name(str): The name to report errors from this file as
+            error_handler (ErrorHandler): Error context to use.  Creates a new one if None
+        Yields:
+            issues (list of dict): The issues found in each chunk, in the order of the chunks.
+
+        Notes:
+            - Onsets and offsets are tracked across chunk boundaries.
+            - The chunks must have sorted onsets to give the same issues as validating the whole file.
+            - Column mapping issues are the same for every chunk, so they are only reported with the first chunk.
+        """
         if error_handler is None:
             error_handler = ErrorHandler()
 
-        error_handler.push_error_context(ErrorContext.FILE_NAME, name)
         self._hed_validator = HedValidator(self._schema, def_dicts=def_dicts)
         self._onset_validator = OnsetValidator()
+        for chunk_number, chunk in enumerate(chunks):
+            yield self._validate_data(chunk, name, error_handler, check_mapping=chunk_number == 0)
+            if error_handler.stop_requested:
+                return
+
+    def _validate_data(self, data, name, error_handler, check_mapping=True):
+        issues = []
+        error_handler.push_error_context(ErrorContext.FILE_NAME, name)
         onset_filtered = None
         # Adjust to account for 1 based
         row_adj = 1
         if isinstance(data, BaseInput):
-            # Adjust to account for column names
+            # Adjust to account for column names and any rows before this chunk of the file
             if data.has_column_names:
                 row_adj += 1
-            issues += self._validate_column_structure(data, error_handler, row_adj)
+            row_adj += data.row_offset
+            issues += error_handler.report_issues(
+                self._validate_column_structure(data, error_handler, row_adj, check_mapping))
+            if error_handler.stop_requested:
+                error_handler.pop_error_context()
+                return issues
             onset_filtered = data.series_filtered
             data = data.dataframe_a
 
@@ -65,9 +127,11 @@ class SpreadsheetValidator:
     def _run_checks(self, hed_df, onset_filtered, error_handler, row_adj):
         issues = []
         columns = list(hed_df.columns)
+        checked_cells = {}
         for row_number, text_file_row in enumerate(hed_df.itertuples(index=False)):
             error_handler.push_error_context(ErrorContext.ROW, row_number + row_adj)
             row_strings = []
+            row_issues = []
             new_column_issues = []
             for column_number, cell in enumerate(text_file_row):
                 if not cell or cell == "n/a":
@@ -75,24 +139,30 @@ class SpreadsheetValidator:
 
                 error_handler.push_error_context(ErrorContext.COLUMN, columns[column_number])
 
-                column_hed_string = HedString(cell, self._schema)
+                if self._deduplicate:
+                    column_hed_string, new_column_issues = \
+                        self._run_cell_checks_once(cell, column_number, checked_cells, row_number + row_adj,
+                                                   error_handler)
+                else:
+                    column_hed_string, new_column_issues = self._run_cell_checks(cell, error_handler)
                 row_strings.append(column_hed_string)
-                error_handler.push_error_context(ErrorContext.HED_STRING, column_hed_string)
-                new_column_issues = self._hed_validator.run_basic_checks(column_hed_string, allow_placeholders=False)
-
-                error_handler.add_context_and_filter(new_column_issues)
-                error_handler.pop_error_context()
                 error_handler.pop_error_context()
 
-                issues += new_column_issues
+                row_issues += new_column_issues
             if check_for_any_errors(new_column_issues):
                 error_handler.pop_error_context()
+                issues += error_handler.report_issues(row_issues)
+                if error_handler.stop_requested:
+                    break
                 continue
 
             row_string = None
             if onset_filtered is not None:
-                row_string = HedString(onset_filtered[row_number], self._schema, self._hed_validator._def_validator)
+                row_string = get_hed_string(onset_filtered[row_number], self._schema,
+                                            self._hed_validator._def_validator)
             elif row_strings:
+                if self._deduplicate:
+                    row_strings = [copy_hed_tree(column_string) for column_string in row_strings]
                 row_string = HedString.from_hed_strings(row_strings)
 
             if row_string:
@@ -101,11 +171,63 @@ class SpreadsheetValidator:
                 new_column_issues += self._onset_validator.validate_temporal_relations(row_string)
                 error_handler.add_context_and_filter(new_column_issues)
                 error_handler.pop_error_context()
-                issues += new_column_issues
+                row_issues += new_column_issues
             error_handler.pop_error_context()
+            issues += error_handler.report_issues(row_issues)
+            if error_handler.stop_requested:
+                break
         return issues
 
-    def _validate_column_structure(self, base_input, error_handler, row_adj):
+    def _run_cell_checks(self, cell, error_handler):
+        """ Run the basic checks on a single cell.
+
+        Parameters:
+            cell (str): The text of the cell.
+            error_handler (ErrorHandler): Holds the context, including the row and column of this cell.
+
+        Returns:
+            tuple:
+                HedString: The validated string for this cell.
+                list: The issues found in this cell, with context added.
+        """
+        column_hed_string = get_hed_string(cell, self._schema)
+        error_handler.push_error_context(ErrorContext.HED_STRING, column_hed_string)
+        new_column_issues = self._hed_validator.run_basic_checks(column_hed_string, allow_placeholders=False)
+        error_handler.add_context_and_filter(new_column_issues)
+        error_handler.pop_error_context()
+        return column_hed_string, new_column_issues
+
+    def _run_cell_checks_once(self, cell, column_number, checked_cells, row, error_handler):
+        """ Run the basic checks on a cell, reusing the results from any earlier cell with the same value.
+
+        Parameters:
+            cell (str): The text of the cell.
+            column_number (int): The column of this cell.
+            checked_cells (dict): The (string, issues) already found keyed by (column_number, cell).
+            row (int): The row number to report issues for.
+            error_handler (ErrorHandler): Holds the context, including the row and column of this cell.
+
+        Returns:
+            tuple:
+                HedString: The validated string for this cell.  This is shared between all rows with this value.
+                list: The issues found in this cell, with context added.
+        """
+        key = (column_number, cell)
+        checked = checked_cells.get(key)
+        if checked is None:
+            checked = self._run_cell_checks(cell, error_handler)
+            checked_cells[key] = checked
+            return checked
+
+        column_hed_string, first_issues = checked
+        new_column_issues = []
+        for issue in first_issues:
+            new_issue = issue.copy()
+            new_issue[ErrorContext.ROW] = row
+            new_column_issues.append(new_issue)
+        return column_hed_string, new_column_issues
+
+    def _validate_column_structure(self, base_input, error_handler, row_adj, check_mapping=True):
         """
         Validate that each column in the input data has valid values.
 
@@ -113,13 +235,15 @@ class SpreadsheetValidator:
             base_input (BaseInput): The input data to be validated.
             error_handler (ErrorHandler): Holds context
             row_adj(int): Number to adjust row by for reporting errors
+            check_mapping(bool): If False, skip the column mapping and column reference checks.
         Returns:
             List of issues associated with each invalid value. Each issue is a dictionary.
         """
         issues = []
-        col_issues = base_input._mapper.check_for_mapping_issues(base_input)
-        error_handler.add_context_and_filter(col_issues)
-        issues += col_issues
+        if check_mapping:
+            col_issues = base_input._mapper.check_for_mapping_issues(base_input)
+            error_handler.add_context_and_filter(col_issues)
+            issues += col_issues
         for column in base_input.column_metadata().values():
             if column.column_type == ColumnType.Categorical:
                 error_handler.push_error_context(ErrorContext.COLUMN, column.column_name)
@@ -133,6 +257,9 @@ class SpreadsheetValidator:
                         error_handler.pop_error_context()
                 error_handler.pop_error_context()
 
+        if not check_mapping:
+            return issues
+
         column_refs = base_input.get_column_refs()
         columns = base_input.columns
         for ref in column_refs:
@@ -4,7 +4,7 @@ This module is used to validate the HED tags as strings.
 """
 
 import re
-from hed.errors.error_reporter import ErrorHandler
+from hed.errors.error_reporter import ErrorHandler, error_messages_skipped
 from hed.models.model_constants import DefTagNames
 from hed.schema import HedKey
 from hed.errors.error_types import ValidationErrors
@@ -25,6 +25,8 @@ class TagValidator:
     DEFAULT_ALLOWED_PLACEHOLDER_CHARS = ".+-^ _#"
     # Placeholder characters are checked elsewhere, but by default allowed
     TAG_ALLOWED_CHARS = "-_/"
+    # The number of distinct tags whose individual issues are remembered before the memo is cleared.
+    TAG_ISSUE_MEMO_SIZE = 10000
 
     def __init__(self, hed_schema):
         """Constructor for the Tag_Validator class.
@@ -41,6 +43,9 @@ class TagValidator:
         # Dict contains all the value portion validators for value class.  e.g. "is this a number?"
         self._value_unit_validators = self._register_default_value_validators()
 
+        # The issues found by run_individual_tag_validators for each distinct tag and set of options.
+        self._tag_issue_memo = {}
+
     # ==========================================================================
     # Top level validator functions
     # =========================================================================+
@@ -92,7 +97,27 @@ class TagValidator:
         Returns:
             list: The validation issues associated with the tags. Each issue is dictionary.
 
+        Notes:
+            - The issues depend only on the schema entry and text of the tag and the options, so they are
+              remembered and copied for later tags with the same ones.  Repeated tags are checked once.
+
          """
+        key = (original_tag._schema_entry, original_tag.org_tag, original_tag._tag, original_tag._extension_value,
+               bool(allow_placeholders), bool(is_definition), error_messages_skipped())
+        memo_issues = self._tag_issue_memo.get(key)
+        if memo_issues is not None:
+            return [self._copy_tag_issue(issue, original_tag) for issue in memo_issues]
+
+        validation_issues = self._run_individual_tag_validators(original_tag, allow_placeholders, is_definition)
+        if all(issue.get('source_tag', original_tag) is original_tag for issue in validation_issues):
+            if len(self._tag_issue_memo) >= self.TAG_ISSUE_MEMO_SIZE:
+                self._tag_issue_memo.clear()
+            # Keep copies, since the issues returned get context added to them.
+            self._tag_issue_memo[key] = [issue.copy() for issue in validation_issues]
+        return validation_issues
+
+    def _run_individual_tag_validators(self, original_tag, allow_placeholders, is_definition):
+        """ Run the individual tag validators without using the memo. """
         validation_issues = []
         # validation_issues += self.check_tag_invalid_chars(original_tag, allow_placeholders)
         if self._hed_schema:
@@ -521,6 +546,14 @@ class TagValidator:
                                                 tag=original_tag, tag_namespace=schema_namespace)
         return issues
 
+    @staticmethod
+    def _copy_tag_issue(issue, original_tag):
+        """ Return a copy of a remembered issue reported for original_tag. """
+        new_issue = issue.copy()
+        if 'source_tag' in new_issue:
+            new_issue['source_tag'] = original_tag
+        return new_issue
+
     def _validate_value_class_portion(self, original_tag, portion_to_validate):
         if portion_to_validate is None:
             return False
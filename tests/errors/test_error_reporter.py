@@ -1,7 +1,9 @@
+import pickle
 import unittest
 from hed.errors import ErrorHandler, ErrorContext, ErrorSeverity, ValidationErrors, SchemaWarnings, \
-    get_printable_issue_string, sort_issues, replace_tag_references
-from hed import HedString
+    get_printable_issue_string, sort_issues, replace_tag_references, IssueRecord
+import pandas as pd
+from hed import HedString, TabularInput
 from hed import load_schema_version
 
 
@@ -160,3 +162,40 @@ class Test(unittest.TestCase):
         mixed = {'a': HedString('Hed1', self._schema), 'b': [2, 3, {'c': HedString('Hed2', self._schema)}, 4]}
         replace_tag_references(mixed)
         self.assertEqual(mixed, {'a': 'Hed1', 'b': [2, 3, {'c': 'Hed2'}, 4]})
+
+    def test_compact_issues(self):
+        events = pd.DataFrame({'onset': ['1.0', '2.0', '3.0'],
+                               'HED': ['Red, Def/Missing, Blue, Def/Other', 'Junk/Blah, Event', 'Event']})
+        issues = TabularInput(events.copy()).validate(self._schema, name="my_file.tsv")
+        compact_issues = TabularInput(events.copy()).validate(self._schema, name="my_file.tsv",
+                                                              error_handler=ErrorHandler(compact=True))
+        self.assertEqual(len(compact_issues), 4)
+        self.assertEqual(len(compact_issues), len(issues))
+        for issue, compact_issue in zip(issues, compact_issues):
+            self.assertIsInstance(compact_issue, IssueRecord)
+            self.assertEqual(list(compact_issue), list(issue))
+            self.assertEqual(compact_issue['message'], issue['message'])
+            self.assertTrue(all(isinstance(value, (str, int, float)) for value in compact_issue.values()))
+        self.assertIsInstance(compact_issues[1][ErrorContext.HED_STRING], str)
+        self.assertIs(compact_issues[1][ErrorContext.HED_STRING], compact_issues[2][ErrorContext.HED_STRING])
+        self.assertEqual(get_printable_issue_string(compact_issues, skip_filename=False),
+                         get_printable_issue_string(issues, skip_filename=False))
+        self.assertEqual(sort_issues(compact_issues, reverse=True)[0], compact_issues[-1])
+
+    def test_issue_record(self):
+        record = IssueRecord({'code': 'CODE', 'severity': ErrorSeverity.ERROR,
+                              ErrorContext.HED_STRING: HedString('Red, Blue', self._schema)})
+        self.assertEqual(record, {'code': 'CODE', 'severity': ErrorSeverity.ERROR,
+                                  ErrorContext.HED_STRING: 'Red, Blue'})
+        new_record = record.copy()
+        new_record[ErrorContext.ROW] = 5
+        new_record['code'] = 'OTHER'
+        self.assertNotIn(ErrorContext.ROW, record)
+        self.assertEqual(record['code'], 'CODE')
+        self.assertEqual(list(new_record), ['code', 'severity', ErrorContext.HED_STRING, ErrorContext.ROW])
+        del new_record['severity']
+        self.assertEqual(dict(new_record), {'code': 'OTHER', ErrorContext.HED_STRING: 'Red, Blue',
+                                            ErrorContext.ROW: 5})
+        with self.assertRaises(KeyError):
+            new_record['severity']
+        self.assertEqual(pickle.loads(pickle.dumps(new_record)), new_record)
@@ -0,0 +1,101 @@
+import io
+import os
+import json
+import unittest
+import pandas as pd
+from hed import TabularInput, Sidecar, load_schema_version
+from hed.errors import ErrorHandler, ErrorContext, get_printable_issue_string, CountingIssueSink, \
+    FirstErrorsIssueSink, JsonlIssueSink
+from hed.errors.issue_sinks import IssueSink
+from hed.tools.bids.bids_file_group import BidsFileGroup
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.events = pd.DataFrame({'onset': [str(row) for row in range(1, 11)],
+                                   'HED': ['Junk/Blah, Event' if row % 3 == 0 else 'Red, Blue'
+                                           for row in range(1, 11)]})
+        cls.bids_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                      '../data/bids_tests/eeg_ds003645s_hed'))
+        cls.sidecar_path = os.path.join(cls.bids_path, 'task-FacePerception_events.json')
+
+    def get_issues(self, error_handler=None):
+        return TabularInput(self.events.copy()).validate(self.schema, name="events.tsv", error_handler=error_handler)
+
+    def test_counting_sink(self):
+        issues = self.get_issues()
+        sink = CountingIssueSink()
+        self.assertEqual(self.get_issues(ErrorHandler(issue_sink=sink)), [])
+        self.assertEqual(sink.count, len(issues))
+        self.assertEqual(sink.error_count, 3)
+        self.assertEqual(sink.warning_count, 1)
+        self.assertEqual(sink.code_counts['TAG_INVALID'], 3)
+        self.assertFalse(sink.done)
+
+    def test_jsonl_sink(self):
+        issues = self.get_issues()
+        output = io.StringIO()
+        with JsonlIssueSink(output) as sink:
+            self.get_issues(ErrorHandler(issue_sink=sink))
+        lines = output.getvalue().splitlines()
+        self.assertEqual(sink.count, len(issues))
+        self.assertEqual(len(lines), len(issues))
+        streamed = [json.loads(line) for line in lines]
+        self.assertEqual(sorted(issue['code'] for issue in streamed), sorted(issue['code'] for issue in issues))
+        self.assertEqual(streamed[-1][ErrorContext.HED_STRING], 'Junk/Blah, Event')
+        self.assertEqual(get_printable_issue_string(streamed, skip_filename=False),
+                         get_printable_issue_string(issues, skip_filename=False))
+
+    def test_first_errors_sink(self):
+        sink = FirstErrorsIssueSink(max_errors=2)
+        self.get_issues(ErrorHandler(issue_sink=sink))
+        self.assertTrue(sink.done)
+        self.assertEqual(sink.error_count, 2)
+        self.assertEqual([issue[ErrorContext.ROW] for issue in sink.issues if 'ec_row' in issue], [4, 7])
+
+        sink = FirstErrorsIssueSink(max_errors=1, keep_warnings=False)
+        self.get_issues(ErrorHandler(issue_sink=sink))
+        self.assertEqual(len(sink.issues), 1)
+        self.assertEqual(sink.issues[0]['code'], 'TAG_INVALID')
+
+    def test_base_sink_abstract(self):
+        with self.assertRaises(TypeError):
+            IssueSink()
+
+    def test_callback_sink(self):
+        rows = []
+
+        def stop_at_row_7(issue):
+            rows.append(issue.get(ErrorContext.ROW))
+            return issue.get(ErrorContext.ROW) == 7
+
+        self.get_issues(ErrorHandler(issue_sink=stop_at_row_7))
+        self.assertEqual(rows, [None, 4, 7])
+
+    def test_sidecar_sink(self):
+        sidecar = Sidecar(self.sidecar_path)
+        schema = load_schema_version("score_1.0.0")
+        issues = sidecar.validate(schema)
+        self.assertTrue(issues)
+        sink = CountingIssueSink()
+        self.assertEqual(sidecar.validate(schema, error_handler=ErrorHandler(issue_sink=sink)), [])
+        self.assertEqual(sink.count, len(issues))
+
+    def test_bids_sink(self):
+        events = BidsFileGroup(self.bids_path)
+        schema = load_schema_version("score_1.0.0")
+        issues = events.validate_datafiles(schema)
+        for num_workers in [1, 2]:
+            sink = CountingIssueSink()
+            self.assertEqual(events.validate_datafiles(schema, num_workers=num_workers, issue_sink=sink), [])
+            self.assertEqual(sink.count, len(issues))
+            sink = FirstErrorsIssueSink(max_errors=1)
+            events.validate_datafiles(schema, num_workers=num_workers, issue_sink=sink)
+            self.assertEqual(sink.error_count, 1)
+            self.assertEqual(len({issue[ErrorContext.FILE_NAME] for issue in sink.issues}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -214,6 +214,21 @@ class TestInsertColumns(unittest.TestCase):
         result = BaseInput._handle_curly_braces_refs(df, refs=["column2"], column_names=df.columns)
         pd.testing.assert_frame_equal(result, expected_df)
 
+    def test_insert_columns_matches_replace_ref(self):
+        column1 = ["({column2}), Event", "Event, {column2}", "Action", "{column2}, ({column3})", "n/a",
+                   "({column2}), Event", "(Item, ({column2}))"]
+        column2 = ["n/a", "Item", "n/a", "Item", "Item", "n/a", "n/a"]
+        column3 = ["n/a", "n/a", "Sound", "n/a", "Sound", "Sound", "Sound"]
+        df = pd.DataFrame({"column1": column1, "column2": column2, "column3": column3},
+                          index=range(10, 10 + len(column1)))
+        expected = []
+        for text, value2, value3 in zip(column1, column2, column3):
+            text = BaseInput._replace_ref(text, value2, "column2")
+            expected.append(BaseInput._replace_ref(text, value3, "column3"))
+        expected_df = pd.DataFrame({"column1": expected}, index=df.index)
+        result = BaseInput._handle_curly_braces_refs(df, refs=["column2", "column3"], column_names=df.columns)
+        pd.testing.assert_frame_equal(result, expected_df)
+
 
 class TestCombineDataframe(unittest.TestCase):
     def test_combine_dataframe_with_strings(self):
@@ -0,0 +1,162 @@
+import io
+import os
+import json
+import unittest
+import pandas as pd
+
+from hed import load_schema_version
+from hed.models import HedString, Sidecar, TabularInput, CompiledSidecar
+from hed.models.df_util import get_assembled
+from hed.validator import HedValidator
+from hed.errors import ErrorHandler, ErrorContext, get_printable_issue_string
+
+
+class TestCompiledSidecar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.sidecar_dict = {
+            "defs": {"HED": {"acc": "(Definition/Acc/#, (Acceleration/#, Red))",
+                             "plain": "(Definition/Plain, (Blue))"}},
+            "rate": {"HED": "Def/Acc/#, (Def/Plain, Label/Rate)"},
+            "delay": {"HED": "(Delay/# s, Agent-action), {trial}"},
+            "trial": {"HED": {"go": "Green, (Item-count/3)", "stop": "Def/Acc/2.5", "bad": "(Red"}},
+            "both": {"HED": "(Def-expand/Acc/#, (Acceleration/#, Red))"}}
+        cls.events = pd.DataFrame({"rate": ["3.5", "n/a", " 2", "x y", "7", "1,2"],
+                                   "delay": ["1", "2", "n/a", "4", "5", "6"],
+                                   "trial": ["go", "stop", "go", "n/a", "bad", "other"],
+                                   "both": ["1", "2", "3", "n/a", "q", "4"],
+                                   "HED": ["Red", "n/a", "", "(Blue", "Event", "Square"]})
+        bids_root = os.path.realpath(os.path.join(os.path.dirname(__file__), '../data/bids_tests/eeg_ds003645s_hed'))
+        cls.bids_sidecar = os.path.join(bids_root, "task-FacePerception_events.json")
+        cls.bids_events = os.path.join(bids_root, "sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv")
+
+    def get_sidecar(self):
+        return Sidecar(io.StringIO(json.dumps(self.sidecar_dict)))
+
+    def assert_matches_series(self, compiled, tabular):
+        hed_strings = compiled.get_hed_strings(tabular)
+        expected = [HedString(text, self.schema, compiled.def_dict) for text in tabular.series_a]
+        self.assertEqual(len(hed_strings), len(expected))
+        for hed_string, expected_string in zip(hed_strings, expected):
+            self.assertEqual(str(hed_string), str(expected_string))
+            self.assertEqual(hed_string.get_original_hed_string(), expected_string.get_original_hed_string())
+            self.assertEqual([(tag.org_tag, tag.span) for tag in hed_string.get_all_tags()],
+                             [(tag.org_tag, tag.span) for tag in expected_string.get_all_tags()])
+            self.assertEqual([group.span for group in hed_string.get_all_groups()],
+                             [group.span for group in expected_string.get_all_groups()])
+            self.assertEqual([g.get_original_hed_string() for g in hed_string.get_all_groups()[1:]],
+                             [g.get_original_hed_string() for g in expected_string.get_all_groups()[1:]])
+            self.assertEqual(str(hed_string.expand_defs()), str(expected_string.expand_defs()))
+            for tag in hed_string.get_all_tags():
+                self.assertIn(tag, tag._parent.children)
+        return hed_strings
+
+    def test_matches_assembled_strings(self):
+        sidecar = self.get_sidecar()
+        compiled = sidecar.compile(self.schema)
+        self.assertIsInstance(compiled, CompiledSidecar)
+        self.assert_matches_series(compiled, TabularInput(self.events.copy(), sidecar))
+        # Without the column reference the value column is built from its template.
+        sidecar = self.get_sidecar()
+        sidecar.loaded_dict["delay"]["HED"] = "(Delay/# s, Agent-action)"
+        hed_strings = self.assert_matches_series(sidecar.compile(self.schema),
+                                                 TabularInput(self.events.copy(), sidecar))
+        self.assertEqual(str(hed_strings[0]), "Red,(Def-expand/Acc/1,(Acceleration/1,Red)),(Delay/1 s,Agent-action),"
+                                              "(Def-expand/Acc/3.5,(Acceleration/3.5,Red)),"
+                                              "((Def-expand/Plain,(Blue)),Label/Rate),Green,(Item-count/3)")
+
+    def test_issue_positions(self):
+        sidecar = Sidecar(io.StringIO(json.dumps({"cat": {"HED": {"a": "Red, Blue"}},
+                                                  "val": {"HED": "Label/#, Baloneytag"}})))
+        tabular = TabularInput(pd.DataFrame({"cat": ["a"], "val": ["x"]}), sidecar)
+        hed_strings, def_dict = get_assembled(tabular, sidecar, self.schema, expand_defs=False)
+        row_text = tabular.series_a[0]
+        self.assertEqual(row_text, "Red, Blue, Label/x, Baloneytag")
+        all_issues = []
+        for hed_string in [hed_strings[0], HedString(row_text, self.schema, def_dict)]:
+            error_handler = ErrorHandler()
+            error_handler.push_error_context(ErrorContext.HED_STRING, hed_string)
+            issues = HedValidator(self.schema, def_dict).validate(hed_string, False, error_handler=error_handler)
+            self.assertEqual([issue['code'] for issue in issues], ['TAG_INVALID'])
+            self.assertEqual(issues[0]['source_tag'].span, (20, 30))
+            self.assertEqual(issues[0]['char_index'], 20)
+            all_issues.append(get_printable_issue_string(issues))
+        self.assertEqual(all_issues[0], all_issues[1])
+
+    def test_inline_definition_positions(self):
+        sidecar = Sidecar(io.StringIO(json.dumps({
+            "first": {"HED": {"b": "Green, Item-count/2"}},
+            "val": {"HED": "Label/#, Def/Inl"},
+            "zcat": {"HED": {"a": "Red, (Definition/Inl, (Blue, Baloneytag)), Def/Inl"}}})))
+        tabular = TabularInput(pd.DataFrame({"first": ["b", "b"], "val": ["x", "y"], "zcat": ["a", "a"]}), sidecar)
+        hed_strings, def_dict = get_assembled(tabular, sidecar, self.schema, expand_defs=False)
+        for hed_string, row_text in zip(hed_strings, tabular.series_a):
+            expected = HedString(row_text, self.schema, def_dict)
+            self.assertEqual([(tag.org_tag, tag.span) for tag in hed_string.get_all_tags()],
+                             [(tag.org_tag, tag.span) for tag in expected.get_all_tags()])
+            def_tags = [tag for tag in hed_string.get_all_tags() if tag.expandable is not None]
+            expected_def_tags = [tag for tag in expected.get_all_tags() if tag.expandable is not None]
+            self.assertEqual(len(def_tags), 2)
+            for tag, expected_tag in zip(def_tags, expected_def_tags):
+                self.assertEqual(tag.expandable.span, expected_tag.expandable.span)
+                self.assertEqual([(child.org_tag, child.span) for child in tag.expandable.get_all_tags()],
+                                 [(child.org_tag, child.span) for child in expected_tag.expandable.get_all_tags()])
+            all_issues = []
+            for validated in [hed_string, expected]:
+                error_handler = ErrorHandler()
+                error_handler.push_error_context(ErrorContext.HED_STRING, validated)
+                issues = HedValidator(self.schema, def_dict).validate(validated, False, error_handler=error_handler)
+                all_issues.append([(issue['code'], issue['char_index']) for issue in issues])
+            self.assertEqual(all_issues[0], [('TAG_INVALID', 68)])
+            self.assertEqual(all_issues[0], all_issues[1])
+
+    def test_bids_events(self):
+        sidecar = Sidecar(self.bids_sidecar)
+        compiled = sidecar.compile(self.schema)
+        self.assert_matches_series(compiled, TabularInput(self.bids_events, sidecar))
+        self.assert_matches_series(compiled, TabularInput(self.bids_events, sidecar))
+
+    def test_compile_remembered(self):
+        sidecar = self.get_sidecar()
+        compiled = sidecar.compile(self.schema)
+        self.assertIs(sidecar.compile(self.schema), compiled)
+        self.assertIsNot(sidecar.compile(load_schema_version("8.1.0")), compiled)
+        self.assertEqual(len(compiled.def_dict), 2)
+
+    def test_value_string(self):
+        compiled = self.get_sidecar().compile(self.schema)
+        for value_string in ["(Delay/# s, (Agent-action, Label/x)), Red", "Red, Label/#", "Label/#x, Label/#"]:
+            for value in ["12", "1", "", " 3", "a,b", "x y"]:
+                hed_string = compiled.get_value_string(value_string, value)
+                expected = HedString(value_string.replace("#", value), self.schema)
+                self.assertEqual(str(hed_string), str(expected))
+                self.assertEqual([tag.span for tag in hed_string.get_all_tags()],
+                                 [tag.span for tag in expected.get_all_tags()])
+                self.assertEqual([g.get_original_hed_string() for g in hed_string.get_all_groups()],
+                                 [g.get_original_hed_string() for g in expected.get_all_groups()])
+        hed_string = compiled.get_value_string("Def/Acc/#, (Def/Plain, Label/Rate)", "4.5")
+        self.assertEqual(hed_string.get_all_tags()[0].org_tag, "Def/Acc/4.5")
+        self.assertEqual(str(hed_string.expand_defs()),
+                         "(Def-expand/Acc/4.5,(Acceleration/4.5,Red)),((Def-expand/Plain,(Blue)),Label/Rate)")
+        self.assertIsNone(compiled.get_string("(Red"))
+        self.assertIsNone(compiled.get_value_string("(Label/#", "3"))
+
+    def test_get_assembled(self):
+        sidecar = Sidecar(self.bids_sidecar)
+        tabular = TabularInput(self.bids_events, sidecar)
+        def_dict = sidecar.get_def_dict(self.schema)
+        for expand_defs, shrink_defs in [(True, False), (False, True), (False, False)]:
+            hed_strings, _ = get_assembled(tabular, sidecar, self.schema, expand_defs=expand_defs,
+                                           shrink_defs=shrink_defs)
+            expected = [HedString(text, self.schema, def_dict) for text in tabular.series_a]
+            if expand_defs:
+                expected = [hed_string.expand_defs() for hed_string in expected]
+            elif shrink_defs:
+                expected = [hed_string.shrink_defs() for hed_string in expected]
+            self.assertEqual([str(hed_string) for hed_string in hed_strings],
+                             [str(hed_string) for hed_string in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 from hed.models.hed_string import HedString
-from hed.models.expression_parser import QueryParser
+from hed.models.expression_parser import QueryParser, MAX_QUERY_CACHE, clear_query_cache, _query_cache
 import os
+import pickle
 from hed import schema
 from hed import HedTag
 
@@ -35,6 +36,33 @@ class TestParser(unittest.TestCase):
             # if result2:
             #    print(f"\t\tFound as group(s) {str([str(r) for r in result2])}")
             self.assertEqual(bool(result2), expected_result)
+            self.assertEqual(expression.matches(hed_string), expected_result)
+
+    def test_query_cache(self):
+        clear_query_cache()
+        expression1 = QueryParser("Event and (Action  or Agent)")
+        expression2 = QueryParser(" event AND (action or agent)")
+        self.assertIs(expression1.tree, expression2.tree)
+        self.assertIsNot(QueryParser("Event and Action").tree, expression1.tree)
+
+        expression3 = pickle.loads(pickle.dumps(expression1))
+        hed_string = HedString("(Event, Agent), Item", self.hed_schema)
+        self.assertEqual(str(expression3), str(expression1))
+        self.assertTrue(expression3.matches(hed_string))
+
+        with self.assertRaises(ValueError):
+            QueryParser("Event and")
+        with self.assertRaises(ValueError):
+            QueryParser("Event and")
+
+    def test_query_cache_bounded(self):
+        clear_query_cache()
+        for index in range(MAX_QUERY_CACHE + 10):
+            QueryParser(f"Tag{index}")
+        self.assertEqual(len(_query_cache), MAX_QUERY_CACHE)
+        self.assertNotIn("tag0", _query_cache)
+        self.assertIn(f"tag{MAX_QUERY_CACHE + 9}", _query_cache)
+        clear_query_cache()
 
     def test_broken_search_strings(self):
         test_search_strings = [
@@ -2,8 +2,9 @@ import unittest
 import os
 
 from hed import schema
-from hed.models import HedString
+from hed.models import HedString, HedGroup
 import copy
+import pickle
 
 
 class Test(unittest.TestCase):
@@ -132,5 +133,74 @@ class Test(unittest.TestCase):
         self.assertEqual(str(original_hed_string), str(hed_string))
         self.assertIsNot(sorted_hed_string, hed_string)
 
+    @staticmethod
+    def _walk(group):
+        tags, groups = [], [group]
+        for child in group.children:
+            if isinstance(child, HedGroup):
+                child_tags, child_groups = Test._walk(child)
+                tags += child_tags
+                groups += child_groups
+            else:
+                tags.append(child)
+        return tags, groups
+
+    def assert_flat_lists(self, hed_string):
+        tags, groups = self._walk(hed_string)
+        self.assertEqual([id(tag) for tag in hed_string.get_all_tags()], [id(tag) for tag in tags])
+        self.assertEqual([id(group) for group in hed_string.get_all_groups()], [id(group) for group in groups])
+        for group in groups[1:]:
+            self.assertEqual([id(tag) for tag in group.get_all_tags()], [id(tag) for tag in self._walk(group)[0]])
+
+    def test_invalidate_parent_cycle(self):
+        hed_string = HedString("Event, (Square, (Red, Blue))", self.hed_schema)
+        outer = hed_string.children[1]
+        inner = outer.children[1]
+        # A malformed tree whose parents loop back must not make changes hang.
+        outer._parent = inner
+        inner.append(HedString("Green", self.hed_schema).children[0])
+        self.assertEqual(len(inner.get_all_tags()), 3)
+
+    def test_cached_lists_after_changes(self):
+        hed_string = HedString("Event, (Item, (Square, Circle), Red), ((Blue, Green)), (Agent, (Action))",
+                               self.hed_schema)
+        self.assert_flat_lists(hed_string)
+        hed_string.get_all_tags().clear()
+        self.assert_flat_lists(hed_string)
+        inner = hed_string.children[1].children[1]
+        inner.get_all_tags()
+        hed_string.remove([inner.children[0]])
+        self.assert_flat_lists(hed_string)
+        self.assertNotIn("Square", [str(tag) for tag in hed_string.get_all_tags()])
+        hed_string.children[3].children[1].append(HedString("Walk", self.hed_schema).children[0])
+        self.assert_flat_lists(hed_string)
+        self.assertIn("Walk", [str(tag) for tag in hed_string.get_all_tags()])
+        original_group = hed_string.children[1]
+        new_group = HedString("(Yellow)", self.hed_schema).children[0]
+        hed_string.replace(hed_string.children[2], new_group)
+        self.assert_flat_lists(hed_string)
+        hed_string.sort()
+        self.assert_flat_lists(hed_string)
+        self.assertEqual(str(hed_string.get_all_tags()[0]), "Event")
+        string_copy = copy.deepcopy(hed_string)
+        self.assert_flat_lists(string_copy)
+        self.assertNotIn(id(hed_string.get_all_tags()[0]), [id(tag) for tag in string_copy.get_all_tags()])
+        self.assertEqual([(id(group), depth) for group, depth in hed_string.get_all_groups(also_return_depth=True)],
+                         [(id(group), group._parent is hed_string) for group in self._walk(hed_string)[1]])
+        self.assertTrue(hed_string.check_if_in_original(original_group))
+        self.assertFalse(hed_string.check_if_in_original(new_group))
+    def test_slots_pickle(self):
+        hed_string = HedString("Event, (Item, (Square, Circle)), Duration/2 s", self.hed_schema)
+        for node in hed_string.get_all_groups() + hed_string.get_all_tags():
+            self.assertFalse(hasattr(node, "__dict__"))
+        loaded = pickle.loads(pickle.dumps(hed_string))
+        self.assertEqual(str(loaded), str(hed_string))
+        self.assert_flat_lists(loaded)
+        for tag in loaded.get_all_tags():
+            self.assertIn(tag, tag._parent.children)
+        self.assertEqual([tag.long_tag for tag in loaded.get_all_tags()],
+                         [tag.long_tag for tag in hed_string.get_all_tags()])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ from hed.models import HedString
 import unittest
 from hed import load_schema_version
 import copy
+import random
 
 
 class TestHedStrings(unittest.TestCase):
@@ -185,6 +186,29 @@ class TestHedStringUtil(unittest.TestCase):
 
         self.compare_split_results(test_strings, expected_results)
 
+    def test_split_matches_reference(self):
+        test_strings = ['', ' ', '   ', ',', '()', ' ( ) ', 'A', ' A ', 'A  B', 'A , B', 'A,,B', ' , A', '(A)',
+                        '(  )', 'A\t, (B,\tC)) ', 'Event, (Item/Extended, (Square, Def/Def1)), Duration/2 s']
+        rng = random.Random(0)
+        test_strings += ["".join(rng.choice("ab ,()\t/") for _ in range(rng.randint(0, 12))) for _ in range(2000)]
+        for test_string in test_strings:
+            self.assertEqual(HedString.split_hed_string(test_string),
+                             HedString._split_hed_string_by_character(test_string))
+
+    def test_split_into_groups_spans(self):
+        schema = load_schema_version("8.2.0")
+        test_string = " Event ,( Item/Extended,(Square, Red ) ),( (Blue))  "
+        contents = HedString.split_into_groups(test_string, schema)
+        self.assertEqual([str(child) for child in contents],
+                         ["Event", "(Item/Extended,(Square,Red))", "((Blue))"])
+        self.assertEqual(contents[0].span, (1, 6))
+        self.assertEqual(test_string[contents[1]._startpos:contents[1]._endpos], "( Item/Extended,(Square, Red ) )")
+        self.assertEqual(test_string[contents[2]._startpos:contents[2]._endpos], "( (Blue))")
+        for bad_string in ["(Event", "Event)", "(Event))"]:
+            with self.assertRaises(ValueError):
+                HedString.split_into_groups(bad_string, schema)
+
+
 class TestHedStringShrinkDefs(unittest.TestCase):
     hed_schema = load_schema_version("8.0.0")
 
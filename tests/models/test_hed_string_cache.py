@@ -0,0 +1,74 @@
+import copy
+import unittest
+
+from hed import load_schema_version
+from hed.models import HedString, DefinitionDict
+from hed.models.hed_string_cache import HedStringCache, copy_hed_tree
+
+
+class TestHedStringCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.def_dict = DefinitionDict("(Definition/Def1, (Event, Square))", cls.schema)
+
+    def test_copies_are_independent(self):
+        cache = HedStringCache()
+        text = "Event, (Item/Extended, (Square, Def/Def1)), Duration/2 s"
+        first = cache.get(text, self.schema, self.def_dict)
+        second = cache.get(text, self.schema, self.def_dict)
+        self.assertIsNot(first, second)
+        self.assertEqual(str(first), str(HedString(text, self.schema, self.def_dict)))
+        first.remove([first.get_all_tags()[0]])
+        first.expand_defs()
+        self.assertEqual(str(second), "Event,(Item/Extended,(Square,Def/Def1)),Duration/2 s")
+        for tag in second.get_all_tags():
+            self.assertIn(tag, tag._parent.children)
+            self.assertIsNot(tag, first.get_all_tags()[0])
+
+    def test_expandable_copied(self):
+        cache = HedStringCache()
+        cache.get("Def/Def1, Event", self.schema, self.def_dict)
+        hed_string = cache.get("Def/Def1, Event", self.schema, self.def_dict)
+        def_tag = hed_string.get_all_tags()[0]
+        self.assertIs(def_tag.expandable.children[0], def_tag)
+        hed_string.expand_defs()
+        self.assertEqual(str(hed_string), "(Def-expand/Def1,(Event,Square)),Event")
+
+    def test_key_identity(self):
+        cache = HedStringCache()
+        cache.get("Def/Def1", self.schema)
+        with_defs = cache.get("Def/Def1", self.schema, self.def_dict)
+        self.assertTrue(with_defs.get_all_tags()[0].expandable)
+        self.assertEqual(cache.cache_info().misses, 2)
+        self.assertEqual(cache.cache_info().hits, 0)
+
+    def test_statistics_and_bounds(self):
+        cache = HedStringCache(max_size=2)
+        for text in ["Event", "Square", "Event", "Item", "Event", "Square"]:
+            cache.get(text, self.schema)
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.maxsize, 2)
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+
+    def test_disabled(self):
+        cache = HedStringCache(max_size=0)
+        cache.get("Event", self.schema)
+        cache.get("Event", self.schema)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.cache_info().misses, 2)
+
+    def test_copy_matches_deepcopy(self):
+        hed_string = HedString("(Event, (Square, Item/Blech)), Def/Def1", self.schema, self.def_dict)
+        fast_copy = copy_hed_tree(hed_string)
+        slow_copy = copy.deepcopy(hed_string)
+        self.assertEqual(fast_copy, slow_copy)
+        self.assertEqual(fast_copy.get_as_long(), slow_copy.get_as_long())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -186,3 +186,16 @@ class TestSchemaUtilityFunctions(TestHedBase):
 
         tag5 = HedTag("IntensityTakesValue/300 cd", hed_schema=util_create_schemas.load_schema_intensity())
         self.assertEqual(None, tag5.value_as_default_unit())
+
+    def test_slots_and_copy(self):
+        tag = HedTag("Duration/300 ms", hed_schema=self.hed_schema)
+        self.assertFalse(hasattr(tag, "__dict__"))
+        with self.assertRaises(AttributeError):
+            tag.junk = 1
+        tag_copy = tag.copy()
+        self.assertIsNot(tag_copy, tag)
+        self.assertEqual(str(tag_copy), str(tag))
+        self.assertIs(tag_copy._schema_entry, tag._schema_entry)
+        self.assertEqual(tag_copy.span, tag.span)
+        self.assertEqual(tag_copy.tag_terms, tag.tag_terms)
+        self.assertAlmostEqual(tag_copy.value_as_default_unit(), 0.3)
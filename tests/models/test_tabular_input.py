@@ -1,11 +1,13 @@
 import unittest
 import os
 import shutil
+import itertools
 
 from hed.models import DefinitionEntry, Sidecar, TabularInput
 from hed import schema
 from hed.errors import HedFileError
-from hed.errors import ErrorHandler, ErrorContext
+from hed.errors import ErrorHandler, ErrorContext, get_printable_issue_string
+from hed.validator import SpreadsheetValidator
 
 
 class Test(unittest.TestCase):
@@ -97,6 +99,62 @@ class Test(unittest.TestCase):
                     # Replace 'valid_path.tsv' with a path to an existing .tsv file
                     TabularInput(file=self.events_path, sidecar=invalid_input)
 
+    def test_iter_chunks(self):
+        # Give some rows the same onset, including a group spanning the chunk boundary at row 7.
+        dataframe = TabularInput(self.events_path).dataframe
+        for row in [5, 6, 7, 8, 20, 21]:
+            dataframe.loc[row, "onset"] = dataframe.loc[row - 1, "onset"]
+        events_path = os.path.join(self.base_output_folder, "chunked_events.tsv")
+        dataframe.to_csv(events_path, sep="\t", index=False)
+
+        whole_input = TabularInput(events_path, sidecar=self.sidecar1)
+        chunks = list(TabularInput.iter_chunks(events_path, sidecar=self.sidecar1, chunk_size=7))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual([chunk.row_offset for chunk in chunks],
+                         [0] + list(itertools.accumulate(len(chunk.dataframe) for chunk in chunks[:-1])))
+        self.assertEqual(sum(len(chunk.dataframe) for chunk in chunks), len(whole_input.dataframe))
+        self.assertEqual(sum((list(chunk.series_a) for chunk in chunks), []), list(whole_input.series_a))
+        self.assertEqual(sum((list(chunk.series_filtered) for chunk in chunks), []),
+                         list(whole_input.series_filtered))
+
+    def test_iter_chunks_unsorted(self):
+        # Row 10 repeats the onset of row 2, which is in an earlier chunk, so the chunks don't group them.
+        dataframe = TabularInput(self.events_path).dataframe
+        dataframe.loc[10, "onset"] = dataframe.loc[2, "onset"]
+        events_path = os.path.join(self.base_output_folder, "unsorted_events.tsv")
+        dataframe.to_csv(events_path, sep="\t", index=False)
+
+        whole_input = TabularInput(events_path, sidecar=self.sidecar1)
+        chunks = list(TabularInput.iter_chunks(events_path, sidecar=self.sidecar1, chunk_size=7))
+        self.assertEqual(sum((list(chunk.series_a) for chunk in chunks), []), list(whole_input.series_a))
+        expected = list(whole_input.series_filtered)
+        self.assertEqual(expected[2], f"{whole_input.series_a[2]},{whole_input.series_a[10]}")
+        self.assertEqual(expected[10], "n/a")
+        expected[2] = whole_input.series_a[2]
+        expected[10] = whole_input.series_a[10]
+        self.assertEqual(sum((list(chunk.series_filtered) for chunk in chunks), []), expected)
+
+    def test_iter_validate(self):
+        events_path = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                    '../data/validator_tests/bids_events_bad_category_key.tsv'))
+        json_path = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                  '../data/validator_tests/bids_events.json'))
+        sidecar = Sidecar(json_path)
+        whole_issues = TabularInput(events_path, sidecar=sidecar).validate(self.hed_schema)
+        self.assertTrue(whole_issues)
+
+        validator = SpreadsheetValidator(self.hed_schema)
+        chunks = TabularInput.iter_chunks(events_path, sidecar=sidecar, chunk_size=4)
+        chunk_issues = sum(validator.iter_validate(chunks, sidecar.get_def_dict(self.hed_schema),
+                                                   name=events_path), [])
+        self.assertEqual(get_printable_issue_string(chunk_issues), get_printable_issue_string(whole_issues))
+
+    def test_iter_chunks_invalid(self):
+        with self.assertRaises(HedFileError):
+            list(TabularInput.iter_chunks("nonexistent_file.xlsx"))
+        with self.assertRaises(HedFileError):
+            list(TabularInput.iter_chunks("nonexistent_file.tsv"))
+
 
 if __name__ == '__main__':
     unittest.main()
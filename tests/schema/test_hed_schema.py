@@ -166,3 +166,26 @@ class TestHedSchema(unittest.TestCase):
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace=''))
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace='unknown'))
 
+    def test_find_tag_entry_cache(self):
+        schema = load_schema(self.hed_xml_3g)
+        entry, remainder, issues = schema.find_tag_entry("Event/Sensory-event")
+        self.assertIn("Event/Sensory-event", schema._tag_lookup_cache)
+        entry2, remainder2, issues2 = schema.find_tag_entry("Event/Sensory-event")
+        self.assertIs(entry, entry2)
+        self.assertEqual(remainder, remainder2)
+        self.assertEqual(issues, issues2)
+
+        tag1 = HedTag("Event/Nonsense-term/Action", hed_schema=schema)
+        tag2 = HedTag("Event/Nonsense-term/Action", hed_schema=schema)
+        issues1 = schema.find_tag_entry(tag1)[2]
+        issues2 = schema.find_tag_entry(tag2)[2]
+        self.assertEqual(len(issues1), 1)
+        self.assertIs(issues1[0]["source_tag"], tag1)
+        self.assertIs(issues2[0]["source_tag"], tag2)
+        self.assertEqual(issues1[0]["message"], issues2[0]["message"])
+
+        schema.set_schema_prefix("tl:")
+        self.assertFalse(schema._tag_lookup_cache)
+        self.assertTrue(schema.find_tag_entry("tl:Event/Sensory-event", schema_namespace="tl:")[0])
+        self.assertFalse(schema.find_tag_entry("Invalid-tag-name", schema_namespace="tl:")[0])
+
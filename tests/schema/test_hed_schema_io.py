@@ -1,4 +1,7 @@
 import unittest
+import shutil
+import tempfile
+import pickle
 
 from hed.errors import HedFileError
 from hed.errors.error_types import SchemaErrors
@@ -6,6 +9,7 @@ from hed.schema import load_schema, HedSchemaGroup, load_schema_version, HedSche
 import os
 from hed.errors import HedExceptions
 from hed.schema import HedKey
+from hed.schema import hed_cache, hed_schema_io
 
 
 # todo: speed up these tests
@@ -149,6 +153,80 @@ class TestHedSchema(unittest.TestCase):
     #     self.assertFalse(schemas.library, "load_schema_version for empty string is not a library")
 
 
+class TestCompiledSchemaCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.saved_cache_folder = hed_cache.get_cache_directory()
+        cls.hed_cache_dir = tempfile.mkdtemp()
+        hed_cache.set_cache_directory(cls.hed_cache_dir)
+        cls.schema_path = os.path.join(cls.hed_cache_dir, "HED8.0.0.xml")
+        shutil.copy(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../data/schema_tests/HED8.0.0.xml"),
+                    cls.schema_path)
+        cls.compiled_folder = os.path.join(cls.hed_cache_dir, hed_schema_io.COMPILED_SCHEMA_FOLDER)
+        cls.saved_compiled_cache = hed_schema_io.COMPILED_SCHEMA_CACHE
+        hed_schema_io.COMPILED_SCHEMA_CACHE = True
+
+    @classmethod
+    def tearDownClass(cls):
+        hed_schema_io.COMPILED_SCHEMA_CACHE = cls.saved_compiled_cache
+        hed_cache.set_cache_directory(cls.saved_cache_folder)
+        shutil.rmtree(cls.hed_cache_dir)
+
+    def setUp(self):
+        shutil.rmtree(self.compiled_folder, ignore_errors=True)
+
+    def test_load_compiled(self):
+        parsed_schema = load_schema(self.schema_path)
+        schema1 = hed_schema_io._load_schema_file(self.schema_path)
+        self.assertEqual(schema1, parsed_schema)
+        self.assertEqual(len(os.listdir(self.compiled_folder)), 1)
+
+        schema2 = hed_schema_io._load_schema_file(self.schema_path)
+        self.assertIsNot(schema2, schema1)
+        self.assertEqual(schema2, parsed_schema)
+        self.assertEqual(schema2.filename, parsed_schema.filename)
+        self.assertTrue(schema2.get_tag_entry("Event"))
+
+    def test_source_changed(self):
+        hed_schema_io._load_schema_file(self.schema_path)
+        old_names = os.listdir(self.compiled_folder)
+        with open(self.schema_path, "a") as file:
+            file.write("\n")
+        hed_schema_io._load_schema_file(self.schema_path)
+        new_names = os.listdir(self.compiled_folder)
+        self.assertEqual(len(new_names), 1)
+        self.assertNotEqual(new_names, old_names)
+
+    def test_bad_compiled_file(self):
+        hed_schema_io._load_schema_file(self.schema_path)
+        compiled_path = os.path.join(self.compiled_folder, os.listdir(self.compiled_folder)[0])
+        for contents in [b"not a schema", b"", pickle.dumps({"not": "a schema"})]:
+            with open(compiled_path, "wb") as file:
+                file.write(contents)
+            hed_schema = hed_schema_io._load_schema_file(self.schema_path)
+            self.assertEqual(hed_schema, load_schema(self.schema_path))
+            # The bad copy was deleted and saved again.
+            with open(compiled_path, "rb") as file:
+                self.assertNotEqual(file.read(), contents)
+            self.assertEqual(hed_schema, hed_schema_io._load_schema_file(self.schema_path))
+
+    def test_cache_off(self):
+        hed_schema_io.COMPILED_SCHEMA_CACHE = False
+        try:
+            hed_schema = hed_schema_io._load_schema_file(self.schema_path)
+        finally:
+            hed_schema_io.COMPILED_SCHEMA_CACHE = True
+        self.assertEqual(hed_schema, load_schema(self.schema_path))
+        self.assertFalse(os.path.exists(self.compiled_folder))
+
+    def test_missing_file(self):
+        # A version not found in the cache gives no path, which must raise the same error as load_schema.
+        for hed_path in [None, "", os.path.join(self.hed_cache_dir, "HED_missing.xml")]:
+            with self.assertRaises(HedFileError) as context:
+                hed_schema_io._load_schema_file(hed_path)
+            self.assertEqual(context.exception.args[0], HedExceptions.FILE_NOT_FOUND)
+
+
 class TestHedSchemaMerging(unittest.TestCase):
     # Verify all 5 schemas produce the same results
     base_schema_dir = '../data/schema_tests/merge_tests/'
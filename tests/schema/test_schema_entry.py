@@ -1,4 +1,6 @@
+import os
 import unittest
+from hed import HedTag, load_schema, load_schema_version
 from hed.schema.hed_schema_entry import HedTagEntry
 class MockEntry:
     def __init__(self, attributes, parent=None):
@@ -55,3 +57,33 @@ class TestMockEntry(unittest.TestCase):
         # Test numeric attribute with treat_as_string=True should raise TypeError
         with self.assertRaises(TypeError):
             self.child_entry2._check_inherited_attribute('number', return_value=True, return_union=True)
+
+
+class TestUnitMatches(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hed_schema = load_schema_version("8.2.0")
+        schema_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                    '../data/validator_tests/HED8.0.0_added_tests.mediawiki'))
+        cls.currency_schema = load_schema(schema_path)
+
+    def test_get_unit_matches(self):
+        entry = self.hed_schema.get_tag_entry("Duration/#")
+        (index, unit_entry), prefix_match = entry.get_unit_matches("ms")
+        self.assertEqual((index, unit_entry.name), (0, "s"))
+        self.assertEqual(prefix_match, (None, None))
+        self.assertEqual(entry.get_unit_matches("Seconds")[0][1].name, "second")
+        self.assertEqual(entry.get_unit_matches("S"), ((None, None), (None, None)))
+        self.assertEqual(entry.get_unit_matches("3"), ((None, None), (None, None)))
+        currency_entry = self.currency_schema.get_tag_entry("Item/Currency-test/#")
+        unit_match, (index, unit_entry) = currency_entry.get_unit_matches("$")
+        self.assertEqual(unit_match, (None, None))
+        self.assertEqual(unit_entry.name, "$")
+
+    def test_units_portion_matches_unit_classes(self):
+        for hed_schema, tag_text in [(self.hed_schema, "Duration/"), (self.currency_schema, "Item/Currency-test/")]:
+            for value in ["3 ms", "3 MS", "3 mS", "3 Hz", "3 seconds", "3 Seconds", "$ 3", "3 $", "3", "3 dollars",
+                          "3 points", "3 s", "3 ks"]:
+                tag = HedTag(tag_text + value, hed_schema)
+                self.assertEqual(tag._get_tag_units_portion(tag.unit_classes),
+                                 tag._get_tag_units_portion(dict(tag.unit_classes)))
@@ -1,6 +1,8 @@
 import os
 import unittest
 
+from pandas import DataFrame
+from hed.models.definition_dict import DefinitionDict
 from hed.models.sidecar import Sidecar, HedString
 from hed.models.tabular_input import TabularInput
 from hed.schema.hed_schema_io import load_schema_version
@@ -22,6 +24,12 @@ class Test(unittest.TestCase):
         cls.events_path = events_path
         cls.sidecar = sidecar1
         cls.schema = schema
+        def_dict = DefinitionDict()
+        for definition in ['(Definition/Cond1, (Red))', '(Definition/Cond2, (Blue))']:
+            def_dict.check_for_definitions(HedString(definition, hed_schema=schema))
+        df = DataFrame({'onset': [0.0, 1.0, 2.0, 3.0, 4.0],
+                        'HED': ['(Def/Cond1, Onset)', 'Green', '(Def/Cond2, Onset)', '(Def/Cond1, Offset)', 'Yellow']})
+        cls.temporal_manager = EventManager(TabularInput(df), schema, extra_defs=def_dict)
 
     def test_constructor(self):
         manager1 = EventManager(self.input_data, self.schema)
@@ -57,6 +65,52 @@ class Test(unittest.TestCase):
             self.assertIsInstance(base[index], str)
         # ToDo  finish tests
 
+    def test_get_ongoing_events(self):
+        manager = self.temporal_manager
+        self.assertEqual([(event.start_index, event.end_index) for event in manager.temporal_events], [(0, 3), (2, 5)])
+        ongoing = [[event.anchor for event in manager.get_ongoing_events(index)] for index in range(5)]
+        self.assertEqual(ongoing, [[], ['Def/Cond1'], ['Def/Cond1'], ['Def/Cond2'], ['Def/Cond2']])
+
+    def test_time_queries(self):
+        manager = self.temporal_manager
+        self.assertEqual([event.anchor for event in manager.get_events_at_time(0.0)], ['Def/Cond1'])
+        self.assertEqual([event.anchor for event in manager.get_events_at_time(2.5)], ['Def/Cond1', 'Def/Cond2'])
+        self.assertEqual([event.anchor for event in manager.get_events_at_time(3.0)], ['Def/Cond2'])
+        self.assertEqual([event.anchor for event in manager.get_events_at_time(100.0)], ['Def/Cond2'])
+        self.assertFalse(manager.get_events_at_time(-1.0))
+        self.assertEqual([event.anchor for event in manager.get_events_in_window(3.0, 4.0)], ['Def/Cond2'])
+        self.assertEqual([event.anchor for event in manager.get_events_in_window(1.0, 2.0)], ['Def/Cond1'])
+        self.assertEqual(len(manager.get_events_in_window(-1.0, 10.0)), 2)
+        self.assertEqual(list(manager.get_rows_in_window(1.0, 3.0)), [1, 2])
+        self.assertEqual(list(manager.get_rows_in_window(3.5, 10.0)), [4])
+        self.assertFalse(len(manager.get_rows_in_window(10.0, 20.0)))
+        epochs = manager.get_epochs('Def/Cond2', before=1.0, after=1.5)
+        self.assertEqual(len(epochs), 1)
+        self.assertEqual(epochs[0][0].start_index, 2)
+        self.assertEqual(list(epochs[0][1]), [1, 2, 3])
+        self.assertFalse(manager.get_epochs('Cond3'))
+
+    def test_get_epochs(self):
+        manager = EventManager(self.input_data, self.schema)
+        epochs = manager.get_epochs('Face-image', before=0.0, after=1.0)
+        self.assertEqual(len(epochs), 52)
+        for event, rows in epochs:
+            self.assertEqual(rows[0], event.start_index)
+            self.assertTrue(all(manager.onset_times[rows] < event.start_time + 1.0))
+
+    def test_iter_context(self):
+        contexts = list(self.temporal_manager.iter_context())
+        self.assertEqual(contexts, [('Def/Cond1', ''), ('', 'Def/Cond1'), ('Def/Cond2', 'Def/Cond1'),
+                                    ('', 'Def/Cond2'), ('', 'Def/Cond2')])
+        self.assertIs(contexts[1][1], contexts[2][1])
+        manager1 = EventManager(self.input_data, self.schema)
+        base, context = manager1._expand_context()
+        for index in range(len(manager1.onsets)):
+            ongoing = ",".join(str(event.contents) for event in manager1.get_ongoing_events(index))
+            self.assertEqual(context[index], ongoing)
+            self.assertEqual(base[index], ",".join(str(event.contents) for event in manager1.event_list[index]))
+        self.assertEqual(list(zip(*manager1.unfold_context())), list(manager1.iter_unfolded_context()))
+
     def test_str_list_to_hed(self):
         manager = EventManager(self.input_data, self.schema)
         hed_obj1 = manager.str_list_to_hed(['', '', ''])
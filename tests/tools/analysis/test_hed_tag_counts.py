@@ -66,6 +66,53 @@ class Test(unittest.TestCase):
         self.assertEqual(14, len(counts3.tag_dict))
         self.assertEqual(2, counts3.tag_dict['experiment-structure'].events)
 
+    def test_update_counts(self):
+        hed_strings = [HedString(self.input_df.iloc[k]['HED_assembled'], self.hed_schema) for k in range(10)]
+        counts1 = HedTagCounts('Base_name1')
+        for hed in hed_strings + [None]:
+            counts1.update_event_counts(hed, file_name='Base_name1')
+        counts2 = HedTagCounts('Base_name1')
+        counts2.update_counts(hed_strings + [None], 'Base_name1')
+        self.assertEqual(counts1.get_summary(), counts2.get_summary())
+        self.assertEqual(list(counts1.tag_dict.keys()), list(counts2.tag_dict.keys()))
+        hed = HedString("Label/Blue, Label/Red, (Label/Blue, Red)", self.hed_schema)
+        counts2.update_counts([hed, hed], 'Base_name2')
+        self.assertEqual(counts2.tag_dict['label'].events, 2)
+        self.assertEqual(counts2.tag_dict['label'].value_dict, {'Blue': 4, 'Red': 2})
+        self.assertEqual(list(counts2.tag_dict['label'].files), ['Base_name2'])
+        self.assertEqual(counts2.tag_dict['red'].events, 2)
+        self.assertNotIn('red', counts1.tag_dict)
+        self.assertEqual(list(counts2.files), ['Base_name1', 'Base_name2'])
+
+    def test_merge(self):
+        parts = []
+        for k in range(3):
+            counts = HedTagCounts(f'run-{k}', 2)
+            counts.update_counts([HedString(self.input_df.iloc[row]['HED_assembled'], self.hed_schema)
+                                  for row in range(2 * k, 2 * k + 2)] + [HedString("Label/X", self.hed_schema)],
+                                 f'run-{k}')
+            parts.append(counts)
+        left = HedTagCounts('All')
+        left.merge(parts[0])
+        left.merge(parts[1])
+        left.merge(parts[2])
+        right = HedTagCounts('All')
+        partial = HedTagCounts('Partial')
+        partial.merge(parts[1])
+        partial.merge(parts[2])
+        right.merge(parts[0])
+        right.merge(partial)
+        self.assertEqual(left.get_summary(), right.get_summary())
+        self.assertEqual(left.total_events, 6)
+        self.assertEqual(list(left.files), ['run-0', 'run-1', 'run-2'])
+        self.assertEqual(left.tag_dict['label'].events, 3)
+        self.assertEqual(left.tag_dict['label'].value_dict, {'X': 3})
+        old_style = HedTagCounts('All')
+        for counts in parts:
+            old_style.merge_tag_dicts(counts.tag_dict)
+        self.assertEqual(old_style.get_summary()['details'], left.get_summary()['details'])
+        self.assertEqual(parts[0].tag_dict['label'].events, 1)
+
     def test_hed_tag_count(self):
         name = 'Base_name1'
         counts1 = HedTagCounts(name, 0)
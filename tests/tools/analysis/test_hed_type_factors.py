@@ -1,5 +1,6 @@
 import os
 import unittest
+import numpy as np
 from pandas import DataFrame
 from hed.models import DefinitionDict
 from hed.models.hed_string import HedString
@@ -111,6 +112,26 @@ class Test(unittest.TestCase):
             var_fact2.get_factors(factor_encoding="baloney")
         self.assertEqual(context.exception.args[0], "BadFactorEncoding")
 
+    def test_get_factor_array(self):
+        var_manager = HedType(EventManager(self.tab_input, self.schema), 'run-01')
+        var_fact = var_manager.get_type_value_factors('face-type')
+        level_indices = var_fact.get_level_indices()
+        self.assertEqual(list(level_indices.keys()), list(var_fact.levels.keys()))
+        self.assertEqual(list(level_indices['unfamiliar-face-cond']),
+                         sorted(var_fact.levels['unfamiliar-face-cond'].keys()))
+        factors, columns = var_fact.get_factor_array(dtype=np.int8)
+        self.assertEqual(factors.dtype, np.int8)
+        self.assertEqual(factors.shape, (200, 3))
+        self.assertEqual(columns, list(var_fact.get_factors().columns))
+        self.assertEqual(int(factors.sum()), 52)
+        df_sparse = var_fact.get_factors(sparse=True)
+        self.assertTrue(df_sparse.sparse.to_dense().equals(var_fact.get_factors()))
+        self.assertAlmostEqual(df_sparse.sparse.density, 52 / 600)
+        df_cat = var_fact.get_factors(factor_encoding="categorical")
+        self.assertEqual(df_cat['face-type'].value_counts()['unfamiliar-face-cond'], 20)
+        self.assertTrue(df_cat.equals(var_fact._one_hot_to_categorical(var_fact.get_factors(),
+                                                                       list(var_fact.levels.keys()))))
+
     def test_constructor_unmatched(self):
         with self.assertRaises(KeyError) as context:
             HedType(EventManager(self.input_data3, self.schema), 'run-01')
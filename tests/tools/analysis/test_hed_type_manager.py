@@ -1,5 +1,6 @@
 import os
 import unittest
+import pandas as pd
 from hed.models.sidecar import Sidecar
 from hed.models.tabular_input import TabularInput
 from hed.schema.hed_schema_io import load_schema_version
@@ -64,6 +65,23 @@ class Test(unittest.TestCase):
         self.assertEqual(len(df_task.columns), 2, "get_factor_vectors has right number of factors if 2 types")
         df_baloney = var_manager.get_factor_vectors("baloney")
         self.assertIsNone(df_baloney, "get_factor_vectors returns None if no factors")
+        with self.assertRaises(KeyError):
+            var_manager.get_factor_vectors("condition-variable", ["face-type", "baloney"])
+
+    def test_get_factor_vectors_encodings(self):
+        var_manager = HedTypeManager(EventManager(self.input_data, self.schema))
+        var_manager.add_type("Condition-variable")
+        df_cond = var_manager.get_factor_vectors("condition-variable")
+        df_sparse = var_manager.get_factor_vectors("condition-variable", sparse=True)
+        self.assertEqual(list(df_sparse.columns), list(df_cond.columns))
+        self.assertTrue(all(isinstance(dtype, pd.SparseDtype) for dtype in df_sparse.dtypes))
+        self.assertTrue(df_sparse.sparse.to_dense().equals(df_cond))
+        df_face = var_manager.get_factor_vectors("condition-variable", ["face-type"], factor_encoding="categorical")
+        self.assertEqual(list(df_face.columns), ["face-type"])
+        self.assertEqual(df_face["face-type"].value_counts()["n/a"], len(df_face) - df_cond.filter(
+            like="face-type.").to_numpy().sum())
+        self.assertEqual(df_face.loc[df_cond["face-type.famous-face-cond"] == 1, "face-type"].unique().tolist(),
+                         ["famous-face-cond"])
 
     def test_get_types(self):
         var_manager = HedTypeManager(EventManager(self.input_data, self.schema))
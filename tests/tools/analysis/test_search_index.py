@@ -0,0 +1,57 @@
+import os
+import unittest
+from hed import schema as hedschema
+from hed.models import Sidecar, TabularInput, QueryParser
+from hed.models import df_util
+from hed.tools.analysis.search_index import SearchIndex
+
+
+class Test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        bids_root_path = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                          '../../data/bids_tests/eeg_ds003645s_hed'))
+        schema_path = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                    '../../data/schema_tests/HED8.0.0.xml'))
+        json_path = os.path.realpath(os.path.join(bids_root_path, 'task-FacePerception_events.json'))
+        events_path = os.path.realpath(os.path.join(bids_root_path,
+                                                    'sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv'))
+        schema = hedschema.load_schema(schema_path)
+        sidecar = Sidecar(json_path, name='face_sub1_json')
+        input_data = TabularInput(events_path, sidecar=sidecar, name="face_sub1_events")
+        cls.hed_strings, _ = df_util.get_assembled(input_data, sidecar, schema, extra_def_dicts=None,
+                                                   join_columns=True, shrink_defs=False, expand_defs=True)
+        cls.queries = ["sensory-event", "data-feature", "sensory-event and face", "image or data-feature",
+                       "~face", "[Face and Image]", "{Def and Def-expand}", "Sens*", "Nonexistent*",
+                       '"Def/Face-image"', "@Face", "?", "{Sensory-event and Experimental-stimulus:}",
+                       "(Visual-presentation or Cue) and ~Image", "[Sensory-event or Agent-action]"]
+
+    def test_search_matches_query_parser(self):
+        index = SearchIndex(self.hed_strings)
+        self.assertEqual(len(index), len(self.hed_strings))
+        for query in self.queries:
+            with self.subTest(query=query):
+                parser = QueryParser(query)
+                expected = [1 if parser.search(hed_string) else 0 for hed_string in self.hed_strings]
+                self.assertEqual(list(index.search(parser)), expected)
+
+    def test_search_all(self):
+        parsers = [QueryParser(query) for query in self.queries]
+        factors = SearchIndex(self.hed_strings).search_all(parsers)
+        self.assertEqual(factors.shape, (len(self.hed_strings), len(parsers)))
+        self.assertEqual(factors[:, 0].sum(), 155)
+        self.assertFalse(factors[:, 1].any())
+
+    def test_get_candidates(self):
+        index = SearchIndex(self.hed_strings + [None])
+        self.assertEqual(len(index.get_candidates(QueryParser("data-feature"))), 0)
+        self.assertEqual(len(index.get_candidates(QueryParser("~face"))), len(self.hed_strings) + 1)
+        sensory = index.get_candidates(QueryParser("sensory-event"))
+        self.assertEqual(len(sensory), 155)
+        self.assertLessEqual(len(index.get_candidates(QueryParser("sensory-event and face"))), len(sensory))
+        self.assertFalse(index.search(QueryParser("~face"))[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import os
 import unittest
-from hed.schema.hed_schema_io import load_schema
+from hed.errors.error_reporter import get_printable_issue_string
+from hed.schema.hed_schema_io import load_schema, load_schema_version
 from hed.tools.analysis.tabular_summary import TabularSummary
 from hed.tools.bids.bids_file_group import BidsFileGroup
 
@@ -40,6 +41,30 @@ class Test(unittest.TestCase):
         self.assertEqual(len(validation_issues), 6,
                          "BidsFileGroup should have 2 validation warnings for missing columns")
 
+    def test_validator_parallel(self):
+        events = BidsFileGroup(self.root_path)
+        # The unmerged library schema does not contain most of the tags used, so there are many issues.
+        hed_schema = load_schema_version("score_1.0.0")
+        serial_issues = events.validate_datafiles(hed_schema)
+        parallel_issues = events.validate_datafiles(hed_schema, num_workers=2)
+        self.assertTrue(serial_issues)
+        self.assertEqual(len(serial_issues), len(parallel_issues))
+        self.assertEqual(get_printable_issue_string(serial_issues, skip_filename=False),
+                         get_printable_issue_string(parallel_issues, skip_filename=False))
+        self.assertEqual([issue['code'] for issue in serial_issues], [issue['code'] for issue in parallel_issues])
+        for data_obj in events.datafile_dict.values():
+            self.assertIsNone(data_obj.contents)
+
+    def test_validator_parallel_after_sidecars(self):
+        events = BidsFileGroup(self.root_path)
+        hed_schema = load_schema_version("score_1.0.0")
+        # Validating the sidecars leaves their definitions (which refer to the schema) in the Sidecar objects.
+        events.validate_sidecars(hed_schema)
+        serial_issues = events.validate_datafiles(hed_schema)
+        parallel_issues = events.validate_datafiles(hed_schema, num_workers=2)
+        self.assertEqual(get_printable_issue_string(serial_issues, skip_filename=False),
+                         get_printable_issue_string(parallel_issues, skip_filename=False))
+
     def test_summarize(self):
         events = BidsFileGroup(self.root_path)
         info = events.summarize()
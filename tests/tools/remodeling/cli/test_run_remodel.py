@@ -1,11 +1,15 @@
 import os
 import io
+import json
 import shutil
 import unittest
 from unittest.mock import patch
 import zipfile
 from hed.errors import HedFileError
-from hed.tools.remodeling.cli.run_remodel import parse_arguments, parse_tasks, main
+from hed.tools.remodeling.cli.run_remodel import parse_arguments, parse_tasks, run_direct_ops, main
+from hed.tools.remodeling.dispatcher import Dispatcher
+from hed.tools.remodeling.backup_manager import BackupManager
+from hed.tools.util.io_util import get_file_list
 
 
 class Test(unittest.TestCase):
@@ -193,6 +197,107 @@ class Test(unittest.TestCase):
             main(arg_list)
             self.assertFalse(fp.getvalue())
 
+    def test_run_direct_ops_parallel(self):
+        files = get_file_list(self.data_root, name_suffix='events', extensions=['.tsv'],
+                              exclude_dirs=['derivatives', 'stimuli', 'remodel'])
+        details = []
+        for processes in ['1', '2']:
+            args, operations = parse_arguments([self.data_root, self.summary_model_path, '-x', 'derivatives',
+                                                'stimuli', '-r', '8.1.0', '-j', self.sidecar_path, '-nu',
+                                                '-p', processes])
+            dispatch = Dispatcher(operations, data_root=args.data_dir, hed_versions=args.hed_versions)
+            run_direct_ops(dispatch, args, files)
+            self.assertEqual(list(dispatch.summary_dicts.keys()), ['Hed type summary'])
+            summary = dispatch.summary_dicts['Hed type summary']
+            self.assertEqual(list(summary.summary_dict.keys()), files)
+            details.append(summary.get_summary_details())
+        self.assertEqual(details[0], details[1])
+
+    def test_main_incremental(self):
+        arg_list = [self.data_root, self.model_path, '-x', 'derivatives', 'stimuli', '-in', '-v']
+        with patch('sys.stdout', new=io.StringIO()) as fp:
+            main(arg_list)
+            self.assertNotIn("Skipping unchanged", fp.getvalue())
+        state_path = os.path.join(self.data_root, 'derivatives', 'remodel', 'incremental',
+                                  'remove_extra_rmdl.json')
+        with open(state_path, 'r') as fp:
+            self.assertEqual(len(json.load(fp)), 6)
+        files = get_file_list(self.data_root, name_suffix='events', extensions=['.tsv'],
+                              exclude_dirs=['derivatives', 'stimuli', 'remodel'])
+        with open(files[0], 'r') as fp:
+            first_contents = fp.read()
+
+        with patch('sys.stdout', new=io.StringIO()) as fp:
+            main(arg_list)
+            self.assertEqual(fp.getvalue().count("Skipping unchanged"), len(files))
+
+        # A file changed since the last run is restored from the backup and run again
+        with open(files[0], 'a') as fp:
+            fp.write("junk\n")
+        with patch('sys.stdout', new=io.StringIO()) as fp:
+            main(arg_list)
+            self.assertEqual(fp.getvalue().count("Skipping unchanged"), len(files) - 1)
+        with open(files[0], 'r') as fp:
+            self.assertEqual(fp.read(), first_contents)
+
+    def test_run_direct_ops_incremental_summaries(self):
+        files = get_file_list(self.data_root, name_suffix='events', extensions=['.tsv'],
+                              exclude_dirs=['derivatives', 'stimuli', 'remodel'])
+        arg_list = [self.data_root, self.summary_model_path, '-x', 'derivatives', 'stimuli', '-r', '8.1.0',
+                    '-j', self.sidecar_path, '-in', '-v']
+        details = []
+        skipped = []
+        for _ in range(3):
+            args, operations = parse_arguments(arg_list)
+            dispatch = Dispatcher(operations, data_root=args.data_dir, hed_versions=args.hed_versions)
+            with patch('sys.stdout', new=io.StringIO()) as fp:
+                run_direct_ops(dispatch, args, files)
+                skipped.append(fp.getvalue().count("Skipping unchanged"))
+            details.append(dispatch.summary_dicts['Hed type summary'].get_summary_details())
+            if len(skipped) == 2:
+                # A state naming a class outside of hed.tools.analysis is not loaded, so the file is run again
+                state_path = os.path.join(self.data_root, 'derivatives', 'remodel', 'incremental',
+                                          'summarize_hed_types_rmdl.json')
+                with open(state_path, 'r') as fp:
+                    state = json.load(fp)
+                state[files[0]]["summaries"]["Hed type summary"]["summary_dict"] = \
+                    {"__object__": ["subprocess", "Popen"], "state": {}}
+                with open(state_path, 'w') as fp:
+                    json.dump(state, fp)
+        self.assertEqual(skipped, [0, len(files), len(files) - 1])
+        self.assertEqual(details[0], details[1])
+        self.assertEqual(details[0], details[2])
+
+    def test_main_incremental_dependent(self):
+        operations = [{"operation": "remove_columns", "description": "",
+                       "parameters": {"column_names": ["value", "sample"], "ignore_missing": True}},
+                      {"operation": "summarize_definitions", "description": "",
+                       "parameters": {"summary_name": "Definitions", "summary_filename": "definitions"}}]
+        model_path = os.path.join(self.data_root, 'derivatives', 'remodel', 'remodeling_files', 'defs_rmdl.json')
+        with open(model_path, 'w') as fp:
+            json.dump(operations, fp)
+        files = get_file_list(self.data_root, name_suffix='events', extensions=['.tsv'],
+                              exclude_dirs=['derivatives', 'stimuli', 'remodel'])
+        backup_path = BackupManager(self.data_root).get_backup_path(BackupManager.DEFAULT_BACKUP_NAME, files[0])
+        with open(backup_path, 'r') as fp:
+            backup_contents = fp.read()
+        main([self.data_root, model_path, '-b', '-x', 'derivatives', 'stimuli', '-ns'])
+        with open(files[0], 'r') as fp:
+            remodeled_contents = fp.read()
+
+        # The operations depend on the earlier files, so every file is restored and run again
+        arg_list = [self.data_root, model_path, '-b', '-x', 'derivatives', 'stimuli', '-ns', '-in', '-v']
+        for _ in range(2):
+            with patch('sys.stdout', new=io.StringIO()) as fp:
+                main(arg_list)
+                self.assertIn("run serially in full", fp.getvalue())
+            with open(files[0], 'r') as fp:
+                self.assertEqual(fp.read(), remodeled_contents)
+        with patch('sys.stdout', new=io.StringIO()):
+            main(arg_list + ['-nu'])
+        with open(files[0], 'r') as fp:
+            self.assertEqual(fp.read(), backup_contents)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -133,6 +133,19 @@ class Test(unittest.TestCase):
         self.assertEqual(remove_groups3[5], 1, "_get_remove_groups has correct first group")
         self.assertEqual(remove_groups3[7], 1, "_get_remove_groups has correct second group")
 
+    def test_do_op_unmerged_group(self):
+        # The first run of succesful_stop rows differs in stop_signal_delay so only the second run is merged.
+        parms = json.loads(self.json_parms)
+        op = MergeConsecutiveOp(parms)
+        df = pd.DataFrame(self.sample_data, columns=self.sample_columns)
+        df.loc[4, 'stop_signal_delay'] = 0.3
+        df.loc[5, 'stop_signal_delay'] = 0.4
+        df_new = self.dispatch.post_proc_data(op.do_op(self.dispatch, self.dispatch.prep_data(df), 'run-01'))
+        self.assertEqual(len(df_new), len(df) - 1)
+        self.assertEqual(list(df_new['onset']), [0.0776, 5.5774, 9.5856, 13.5939, 14.2, 15.3, 17.3, 21.1021, 22.6103])
+        self.assertAlmostEqual(df_new.loc[6, 'duration'], 2.2083)
+        self.assertAlmostEqual(df_new.loc[5, 'duration'], 0.7083)
+
     def test_invalid_missing_column(self):
         parms = json.loads(self.json_parms)
         parms["column_name"] = "baloney"
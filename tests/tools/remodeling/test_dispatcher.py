@@ -185,6 +185,33 @@ class Test(unittest.TestCase):
         self.assertEqual(len(df.columns), 17)
         self.assertIn('key-assignment.right-sym-cond', df.columns)
 
+    def test_run_operations_hed_cache(self):
+        events_path = os.path.realpath(os.path.join(self.data_path, 'sub-002_task-FacePerception_run-1_events.tsv'))
+        sidecar_path = os.path.realpath(os.path.join(self.data_path, 'task-FacePerception_events.json'))
+        op_list = [
+            {"operation": "summarize_hed_tags", "description": "",
+             "parameters": {"summary_name": "tags", "summary_filename": "tags",
+                            "tags": {"Sensory events": ["Sensory-event"]}}},
+            {"operation": "summarize_hed_type", "description": "",
+             "parameters": {"summary_name": "conditions", "summary_filename": "conditions",
+                            "type_tag": "condition-variable"}},
+            {"operation": "summarize_definitions", "description": "",
+             "parameters": {"summary_name": "definitions", "summary_filename": "definitions"}}
+        ]
+        dispatch = Dispatcher(op_list, hed_versions=['8.1.0'])
+        dispatch.run_operations(events_path, sidecar=sidecar_path)
+        self.assertEqual(sorted(key[0] for key in dispatch._hed_cache), ["events", "tabular"])
+        for op in op_list:
+            dispatch_single = Dispatcher([op], hed_versions=['8.1.0'])
+            dispatch_single.run_operations(events_path, sidecar=sidecar_path)
+            name = op["parameters"]["summary_name"]
+            self.assertEqual(dispatch.summary_dicts[name].get_summary(),
+                             dispatch_single.summary_dicts[name].get_summary())
+        df = dispatch.post_proc_data(dispatch.get_data_file(events_path))
+        event_manager = dispatch.get_event_manager(df, events_path, sidecar_path)
+        self.assertIs(dispatch.get_event_manager(df.copy(), events_path, sidecar_path), event_manager)
+        self.assertIsNot(dispatch.get_event_manager(df.iloc[:10], events_path, sidecar_path), event_manager)
+
     def test_save_summaries(self):
         with open(self.summarize_model) as fp:
             model1 = json.load(fp)
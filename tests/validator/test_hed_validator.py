@@ -191,6 +191,25 @@ class Test(unittest.TestCase):
         issues = test_string.validate(hed_schema)
         self.assertEqual(len(issues), 1)
 
+    def test_is_valid(self):
+        test_strings = {
+            'Event, (Item, Square)': True,
+            'Event, Event': False,
+            'Invalidtag, Item': False,
+            'Event, Item, ((Square)': False,
+            'Item/Extended-item, Red': True,
+            'Duration/3 s, Red': True,
+            'Duration/3 monkeys': False,
+            'Def/Unknown': False
+        }
+        for hed_string, expected in test_strings.items():
+            hed_string_obj = HedString(hed_string, self.hed_schema)
+            is_valid = self.hed_validator.is_valid(hed_string_obj)
+            self.assertEqual(is_valid, expected, hed_string)
+            issues = self.hed_validator.validate(hed_string_obj, False)
+            self.assertEqual(is_valid, not [issue for issue in issues if issue['severity'] == 1], hed_string)
+            self.assertTrue(all(issue['message'] for issue in issues))
+
 
 if __name__ == '__main__':
     unittest.main()
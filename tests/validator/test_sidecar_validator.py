@@ -165,6 +165,16 @@ class Test(unittest.TestCase):
         '''
         self.run_test(sidecar_json, expected_number_of_issues=1)
 
+    def test_is_valid(self):
+        validator = SidecarValidator(self.hed_schema)
+        self.assertTrue(validator.is_valid(Sidecar(self._refs_json_filename)))
+        self.assertFalse(validator.is_valid(Sidecar(self._bad_refs_json_filename)))
+        sidecar = Sidecar(os.path.join(self.base_data_dir, "sidecar_tests/json_errors.json"))
+        self.assertFalse(validator.is_valid(sidecar))
+        issues = sidecar.validate(self.hed_schema)
+        self.assertTrue(issues)
+        self.assertTrue(all(issue['message'] for issue in issues))
+
     def run_test(self, sidecar_json, expected_number_of_issues):
         sidecar = Sidecar(io.StringIO(sidecar_json))
         issues = sidecar.validate(self.hed_schema)
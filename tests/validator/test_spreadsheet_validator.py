@@ -5,7 +5,8 @@ import shutil
 import unittest
 from hed import load_schema_version, load_schema
 from hed.validator import SpreadsheetValidator
-from hed import SpreadsheetInput
+from hed import SpreadsheetInput, TabularInput
+from hed.errors import get_printable_issue_string
 
 class TestSpreadsheetValidation(unittest.TestCase):
     @classmethod
@@ -45,3 +46,28 @@ class TestSpreadsheetValidation(unittest.TestCase):
         issues = file_input.validate(self.schema)
         self.assertTrue(len(issues), 1)
 
+    def test_deduplicate_matches_full(self):
+        events = pd.DataFrame({
+            "onset": [str(x) for x in range(8)],
+            "duration": ["n/a"] * 8,
+            "HED": ["Event, Invalidtag", "Item, (Square)", "Event, Invalidtag", "Item, (Square)",
+                    "Event/Extended", "Event, Invalidtag", "n/a", "Item, Item"]
+        })
+        full_issues = SpreadsheetValidator(self.schema).validate(TabularInput(events.copy()))
+        dedup_validator = SpreadsheetValidator(self.schema, deduplicate=True)
+        dedup_issues = dedup_validator.validate(TabularInput(events.copy()))
+
+        self.assertEqual(len(full_issues), len(dedup_issues))
+        self.assertEqual(get_printable_issue_string(full_issues), get_printable_issue_string(dedup_issues))
+        self.assertEqual([issue.get("ec_row") for issue in full_issues],
+                         [issue.get("ec_row") for issue in dedup_issues])
+        self.assertEqual([issue["ec_row"] for issue in dedup_issues if issue["code"] == "TAG_INVALID"], [2, 4, 7])
+
+    def test_is_valid(self):
+        events = pd.DataFrame({"onset": ["1", "2", "3"], "HED": ["Event, Item", "Item, (Square)", "Event, Red"]})
+        self.assertTrue(self.validator.is_valid(TabularInput(events.copy())))
+        events.loc[1, "HED"] = "Event, Invalidtag"
+        self.assertFalse(self.validator.is_valid(TabularInput(events.copy())))
+        self.assertFalse(self.validator.is_valid(TabularInput(events.copy()).dataframe_a))
+        issues = self.validator.validate(TabularInput(events.copy()))
+        self.assertTrue(all(issue["message"] for issue in issues))
@@ -1,6 +1,8 @@
 import unittest
 
 from hed.errors.error_types import ValidationErrors, DefinitionErrors
+from hed.models import HedString
+from hed.validator.tag_validator import TagValidator
 from tests.validator.test_tag_validator_base import TestValidatorBase
 from functools import partial
 
@@ -349,6 +351,24 @@ class IndividualHedTagsShort(TestHed):
         }
         self.validator_semantic(test_strings, expected_results, expected_issues, False)
 
+    def test_repeated_tags_memo(self):
+        tag_validator = TagValidator(self.hed_schema)
+        hed_string = HedString("Duration/23 hz, Duration/23 hz, Duration/23 s, item", self.hed_schema)
+        hed_string._calculate_to_canonical_forms(self.hed_schema)
+        tags = hed_string.get_all_tags()
+        issues = [tag_validator.run_individual_tag_validators(tag) for tag in tags]
+        self.assertEqual([len(tag_issues) for tag_issues in issues], [1, 1, 0, 1])
+        self.assertIs(issues[0][0]['source_tag'], tags[0])
+        self.assertIs(issues[1][0]['source_tag'], tags[1])
+        self.assertIsNot(issues[0][0], issues[1][0])
+        self.assertEqual(issues[0][0]['message'], issues[1][0]['message'])
+        self.assertEqual(issues[3][0]['code'], ValidationErrors.STYLE_WARNING)
+        self.assertEqual(len(tag_validator._tag_issue_memo), 3)
+        issues[1][0]['message'] += " changed"
+        self.assertEqual(tag_validator.run_individual_tag_validators(tags[1])[0]['message'], issues[0][0]['message'])
+        self.assertEqual(tag_validator.run_individual_tag_validators(tags[1], allow_placeholders=True),
+                         issues[0])
+
 
 class TestTagLevels(TestHed):
     @staticmethod